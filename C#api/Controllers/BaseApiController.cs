@@ -1,6 +1,7 @@
 using Microsoft.AspNetCore.Mvc;
 using ProvidersV2;
 using ProcessorsV2;
+using HelpersV2;
 
 [ApiController]
 [Route("api/v2/[controller]")]
@@ -49,4 +50,47 @@ public abstract class BaseApiController : ControllerBase
 
         return null;
     }
-}
\ No newline at end of file
+
+    // Ok with only the properties asked for through ?fields=, or BadRequest when one of
+    // them is not a property of the model.
+    protected IActionResult OkFields<T>(T record, string? fields)
+    {
+        try
+        {
+            var projection = Projection<T>.For(fields);
+            return projection == null ? Ok(record) : Ok(new Projected<T>(record, projection));
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
+    }
+
+    protected IActionResult OkFields<T>(PaginatedResponse<T> page, string? fields)
+    {
+        try
+        {
+            var projection = Projection<T>.For(fields);
+            return projection == null ? Ok(page) : Ok(projection.Apply(page));
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
+    }
+
+    // The 400 for a refused delete, naming the records that still point at the one being
+    // deleted (a few per pool) when that is why it was refused.
+    protected IActionResult DeleteRefused(Dictionary<string, List<string>> dependents)
+    {
+        if (dependents.Count == 0) return BadRequest("ID not found or other data is dependent on this data");
+
+        var listed = dependents.OrderBy(source => source.Key, StringComparer.Ordinal).Select(source =>
+        {
+            var keys = source.Value.OrderBy(key => key.Length).ThenBy(key => key, StringComparer.Ordinal).Take(10);
+            var more = source.Value.Count > 10 ? $" and {source.Value.Count - 10} more" : "";
+            return $"{source.Key} {string.Join(", ", keys)}{more}";
+        });
+        return BadRequest($"Other data is dependent on this data: {string.Join("; ", listed)}");
+    }
+}
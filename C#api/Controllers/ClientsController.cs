@@ -21,17 +21,24 @@ public class ClientsController : BaseApiController
     public IActionResult GetClients(
         [FromQuery] int page = 1,
         [FromQuery] int pageSize = 10,
-        [FromQuery] string sortOrder = "asc"
+        [FromQuery] string sortOrder = "asc",
+        [FromQuery] string cursor = null,
+        [FromQuery] string filter = null,
+        [FromQuery] string sort = null,
+        [FromQuery] string fields = null
     )
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "clients", "get");
         if (auth != null) return auth;
-        var clients = DataProvider.fetch_client_pool().GetClients();
-        clients = sortOrder.ToLower() == "desc"
-            ? clients.OrderByDescending(c => c.Id).ToList()
-            : clients.OrderBy(c => c.Id).ToList();
-        var response = PaginationHelper.Paginate(clients, page, pageSize);
-        return Ok(response);
+        try
+        {
+            var response = DataProvider.fetch_client_pool().GetClientsPage(page, pageSize, sortOrder.ToLower() == "desc", cursor, filter, sort);
+            return OkFields(response, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
     }
 
     [HttpGet("search")]
@@ -41,8 +48,9 @@ public class ClientsController : BaseApiController
         [FromQuery] string country = null,
         [FromQuery] string contactName = null,
         [FromQuery] int page = 1,
-        [FromQuery] int pageSize = 10
-
+        [FromQuery] int pageSize = 10,
+        [FromQuery] string cursor = null,
+        [FromQuery] string fields = null
     )
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "clients", "get");
@@ -53,12 +61,13 @@ public class ClientsController : BaseApiController
                 var clients = DataProvider.fetch_client_pool().SearchClients(name, address, country, contactName);
 
 
-                if (clients == null || !clients.Any())
+                var response = PaginationHelper.PaginateMatches(clients, x => x.Id, page, pageSize, cursor);
+                if (response.TotalCount == 0)
                 {
                     return BadRequest("Error, er is geen Client(s) gevonden met deze gegevens.");
                 }
-                var response = PaginationHelper.Paginate(clients, page, pageSize);
-                return Ok(response);
+
+                return OkFields(response, fields);
             }
             catch (ArgumentException ex)
             {
@@ -67,7 +76,7 @@ public class ClientsController : BaseApiController
         }
 
     [HttpGet("{id}")]
-    public IActionResult GetClient(int id)
+    public IActionResult GetClient(int id, [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "clients", "getsingle");
         if (auth != null) return auth;
@@ -75,7 +84,7 @@ public class ClientsController : BaseApiController
         var client = DataProvider.fetch_client_pool().GetClient(id);
         if (client == null) return NoContent();
 
-        return Ok(client);
+        return OkFields(client, fields);
     }
 
     [HttpGet("{id}/orders")]
@@ -193,7 +202,7 @@ public class ClientsController : BaseApiController
         if (auth != null) return auth;
 
         var success = DataProvider.fetch_client_pool().RemoveClient(id);
-        if (!success) return BadRequest("ID not found or other data is dependent on this data");
+        if (!success) return DeleteRefused(DataProvider.fetch_client_pool().GetClientDependents(id));
 
         DataProvider.fetch_client_pool().Save();
         return Ok();
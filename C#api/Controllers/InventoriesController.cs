@@ -20,31 +20,41 @@ public class InventoriesController : BaseApiController
     public IActionResult GetInventories(
         [FromQuery] int page = 1,
         [FromQuery] int pageSize = 10,
-        [FromQuery] string sortOrder = "asc"
+        [FromQuery] string sortOrder = "asc",
+        [FromQuery] string cursor = null,
+        [FromQuery] string filter = null,
+        [FromQuery] string sort = null,
+        [FromQuery] string fields = null
         )
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "inventories", "get");
         if (auth is UnauthorizedResult) return auth;
 
-        var inventories = DataProvider.fetch_inventory_pool().GetInventories();
-            inventories = sortOrder.ToLower() == "desc"
-                        ? inventories.OrderByDescending(i => i.Id).ToList()
-                        : inventories.OrderBy(i => i.Id).ToList();
-    if (auth is OkResult)
+        try
         {
-            var user = AuthProvider.GetUser(Request.Headers["API_KEY"]);
-            var locations = DataProvider.fetch_location_pool().GetLocations();
-            var locationids = locations.Where(x => user.OwnWarehouses.Contains(x.Warehouse_Id)).Select(x => x.Id).ToList();
-            inventories = inventories.Where(x => x.Locations.Any(y => locationids.Contains(y))).ToList();
-        }
-
-        var response = PaginationHelper.Paginate(inventories, page, pageSize);
+            var inventoryPool = DataProvider.fetch_inventory_pool();
+            if (auth is OkResult)
+            {
+                var user = AuthProvider.GetUser(Request.Headers["API_KEY"]);
+                var inventoryIds = inventoryPool.GetInventoryIdsInWarehouses(user.OwnWarehouses);
+                if (filter != null || sort != null)
+                {
+                    return OkFields(inventoryPool.GetInventoriesPage(page, pageSize, sortOrder.ToLower() == "desc", cursor, filter, sort, inventoryIds), fields);
+                }
+                return OkFields(PaginationHelper.Paginate(inventoryIds, id => inventoryPool.GetInventory((int)id), page, pageSize, sortOrder.ToLower() == "desc", cursor), fields);
+            }
 
-        return Ok(response);
+            var response = inventoryPool.GetInventoriesPage(page, pageSize, sortOrder.ToLower() == "desc", cursor, filter, sort);
+            return OkFields(response, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
     }
 
     [HttpGet("{id}")]
-    public IActionResult GetInventory(int id)
+    public IActionResult GetInventory(int id, [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "inventories", "getsingle");
         if (auth != null) return auth;
@@ -52,7 +62,7 @@ public class InventoriesController : BaseApiController
         var inventory = DataProvider.fetch_inventory_pool().GetInventory(id);
         if (inventory == null) return NoContent();
 
-        return Ok(inventory);
+        return OkFields(inventory, fields);
     }
 
     [HttpPost]
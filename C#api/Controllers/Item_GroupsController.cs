@@ -18,20 +18,28 @@ public class Item_GroupsController : BaseApiController
     [HttpGet]
     public IActionResult GetItemGroups(
         [FromQuery] int page = 1,
-        [FromQuery] int pageSize = 10)
+        [FromQuery] int pageSize = 10,
+        [FromQuery] string cursor = null,
+        [FromQuery] string filter = null,
+        [FromQuery] string sort = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "item_groups", "get");
         if (auth != null) return auth;
 
-        var itemGroups = DataProvider.fetch_itemgroup_pool().GetItemGroups();
-
-        var response = PaginationHelper.Paginate(itemGroups, page, pageSize);
-
-        return Ok(response);
+        try
+        {
+            var response = DataProvider.fetch_itemgroup_pool().GetItemGroupsPage(page, pageSize, cursor: cursor, filter: filter, sort: sort);
+            return OkFields(response, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
     }
 
     [HttpGet("{id}")]
-    public IActionResult GetItemGroup(int id)
+    public IActionResult GetItemGroup(int id, [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "item_groups", "getsingle");
         if (auth != null) return auth;
@@ -39,7 +47,7 @@ public class Item_GroupsController : BaseApiController
         var itemGroup = DataProvider.fetch_itemgroup_pool().GetItemGroup(id);
         if (itemGroup == null) return NoContent();
 
-        return Ok(itemGroup);
+        return OkFields(itemGroup, fields);
     }
 
     [HttpGet("{id}/items")]
@@ -18,20 +18,28 @@ public class Item_LinesController : BaseApiController
     [HttpGet]
     public IActionResult GetItemLines(
         [FromQuery] int page = 1,
-        [FromQuery] int pageSize = 10)
+        [FromQuery] int pageSize = 10,
+        [FromQuery] string cursor = null,
+        [FromQuery] string filter = null,
+        [FromQuery] string sort = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "item_lines", "get");
         if (auth != null) return auth;
 
-        var itemLines = DataProvider.fetch_itemline_pool().GetItemLines();
-
-        var response = PaginationHelper.Paginate(itemLines, page, pageSize);
-
-        return Ok(response);
+        try
+        {
+            var response = DataProvider.fetch_itemline_pool().GetItemLinesPage(page, pageSize, cursor: cursor, filter: filter, sort: sort);
+            return OkFields(response, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
     }
 
     [HttpGet("{id}")]
-    public IActionResult GetItemLine(int id)
+    public IActionResult GetItemLine(int id, [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "item_lines", "getsingle");
         if (auth != null) return auth;
@@ -39,7 +47,7 @@ public class Item_LinesController : BaseApiController
         var itemLine = DataProvider.fetch_itemline_pool().GetItemLine(id);
         if (itemLine == null) return NoContent();
 
-        return Ok(itemLine);
+        return OkFields(itemLine, fields);
     }
 
     [HttpGet("{id}/items")]
@@ -18,20 +18,28 @@ public class Item_TypesController : BaseApiController
     [HttpGet]
     public IActionResult GetItemTypes(
         [FromQuery] int page = 1,
-        [FromQuery] int pageSize = 10)
+        [FromQuery] int pageSize = 10,
+        [FromQuery] string cursor = null,
+        [FromQuery] string filter = null,
+        [FromQuery] string sort = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "item_types", "get");
         if (auth != null) return auth;
 
-        var itemTypes = DataProvider.fetch_itemtype_pool().GetItemTypes();
-
-        var response = PaginationHelper.Paginate(itemTypes, page, pageSize);
-
-        return Ok(response);
+        try
+        {
+            var response = DataProvider.fetch_itemtype_pool().GetItemTypesPage(page, pageSize, cursor: cursor, filter: filter, sort: sort);
+            return OkFields(response, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
     }
 
     [HttpGet("{id}")]
-    public IActionResult GetItemType(int id)
+    public IActionResult GetItemType(int id, [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "item_types", "getsingle");
         if (auth != null) return auth;
@@ -39,7 +47,7 @@ public class Item_TypesController : BaseApiController
         var itemType = DataProvider.fetch_itemtype_pool().GetItemType(id);
         if (itemType == null) return NoContent();
 
-        return Ok(itemType);
+        return OkFields(itemType, fields);
     }
 
     [HttpGet("{id}/items")]
@@ -24,31 +24,43 @@ public class ItemsController : BaseApiController, ILoggableAction
     public IActionResult GetItems(
         [FromQuery] int page = 1,
         [FromQuery] int pageSize = 10,
-        [FromQuery] string sortOrder = "asc")
+        [FromQuery] string sortOrder = "asc",
+        [FromQuery] string cursor = null,
+        [FromQuery] string filter = null,
+        [FromQuery] string sort = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "items", "get");
         if (auth is UnauthorizedResult) return auth;
 
-        var items = DataProvider.fetch_item_pool().GetItems();
-        var newitems = new List<Item>();
-        items = sortOrder.ToLower() == "desc"
-            ? items.OrderByDescending(i => i.Uid).ToList()
-            : items.OrderBy(i => i.Uid).ToList();
-        if (auth is OkResult)
-        {
-            var user = AuthProvider.GetUser(Request.Headers["API_KEY"]);
-            var inventories = DataProvider.fetch_inventory_pool().GetInventories();
-            var locations = DataProvider.fetch_location_pool().GetLocations();
-            var locationids = locations.Where(x => user.OwnWarehouses.Contains(x.Warehouse_Id)).Select(x => x.Id).ToList();
-            var ids = inventories.Where(x => x.Locations.Any(y => locationids.Contains(y))).Select(x => x.Item_Id);
-            foreach (var id in ids) newitems.Add(DataProvider.fetch_item_pool().GetItem(id));
-        }
-        var paginatedItems = PaginationHelper.Paginate(newitems.Count == 0 ? items : newitems, page, pageSize);
-        return Ok(paginatedItems);
+        try
+        {
+            var itemPool = DataProvider.fetch_item_pool();
+            if (auth is OkResult)
+            {
+                var user = AuthProvider.GetUser(Request.Headers["API_KEY"]);
+                var itemIds = DataProvider.fetch_inventory_pool().GetItemIdsInWarehouses(user.OwnWarehouses);
+                if (itemIds.Count > 0 && (filter != null || sort != null))
+                {
+                    return OkFields(itemPool.GetItemsPage(page, pageSize, sortOrder.ToLower() == "desc", cursor, filter, sort, itemIds), fields);
+                }
+                if (itemIds.Count > 0)
+                {
+                    return OkFields(PaginationHelper.Paginate(itemIds, itemPool.GetItem, page, pageSize, sortOrder.ToLower() == "desc", cursor), fields);
+                }
+            }
+
+            var paginatedItems = itemPool.GetItemsPage(page, pageSize, sortOrder.ToLower() == "desc", cursor, filter, sort);
+            return OkFields(paginatedItems, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
     }
 
     [HttpGet("{id}")]
-    public IActionResult GetItem(string id)
+    public IActionResult GetItem(string id, [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "items", "getsingle");
         if (auth != null) return auth;
@@ -56,7 +68,7 @@ public class ItemsController : BaseApiController, ILoggableAction
         var item = DataProvider.fetch_item_pool().GetItem(id);
         if (item == null) return NoContent();
 
-        return Ok(item);
+        return OkFields(item, fields);
     }
 
     [HttpGet("{id}/inventory")]
@@ -93,16 +105,60 @@ public class ItemsController : BaseApiController, ILoggableAction
     }
 
     [HttpGet("{id}/transfers")]
-    public IActionResult GetItemTransfers(string id)
+    public IActionResult GetItemTransfers(string id, [FromQuery] int page = 1, [FromQuery] int pageSize = 10, [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "items", "getsingle");
         if (auth != null) return auth;
 
-        if (DataProvider.fetch_item_pool().GetItem(id) == null) return NoContent();
+        try
+        {
+            if (DataProvider.fetch_item_pool().GetItem(id) == null) return NoContent();
+
+            var transfers = DataProvider.fetch_item_pool().GetTransfersForItemPage(id, page, pageSize);
+            return OkFields(transfers, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
+    }
 
-        var transfers = DataProvider.fetch_item_pool().GetTransfersForItem(id);
+    [HttpGet("{id}/orders")]
+    public IActionResult GetItemOrders(string id, [FromQuery] int page = 1, [FromQuery] int pageSize = 10, [FromQuery] string fields = null)
+    {
+        var auth = CheckAuthorization(Request.Headers["API_KEY"], "items", "getsingle");
+        if (auth != null) return auth;
+
+        try
+        {
+            if (DataProvider.fetch_item_pool().GetItem(id) == null) return NoContent();
 
-        return Ok(transfers.OrderBy(x => x.Created_At));
+            var orders = DataProvider.fetch_order_pool().GetOrdersForItemPage(id, page, pageSize);
+            return OkFields(orders, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
+    }
+
+    [HttpGet("{id}/shipments")]
+    public IActionResult GetItemShipments(string id, [FromQuery] int page = 1, [FromQuery] int pageSize = 10, [FromQuery] string fields = null)
+    {
+        var auth = CheckAuthorization(Request.Headers["API_KEY"], "items", "getsingle");
+        if (auth != null) return auth;
+
+        try
+        {
+            if (DataProvider.fetch_item_pool().GetItem(id) == null) return NoContent();
+
+            var shipments = DataProvider.fetch_shipment_pool().GetShipmentsForItemPage(id, page, pageSize);
+            return OkFields(shipments, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
     }
 
     [HttpGet("search")]
@@ -111,8 +167,11 @@ public class ItemsController : BaseApiController, ILoggableAction
         [FromQuery] string upcCode = null, 
         [FromQuery] string commodityCode = null, 
         [FromQuery] string supplierCode = null, 
+        [FromQuery] bool exact = false,
         [FromQuery] int page = 1,
-        [FromQuery] int pageSize = 10)
+        [FromQuery] int pageSize = 10,
+        [FromQuery] string cursor = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "items", "get");
         if (auth != null) return auth;
@@ -123,15 +182,92 @@ public class ItemsController : BaseApiController, ILoggableAction
                 code, 
                 upcCode, 
                 commodityCode, 
-                supplierCode);
+                supplierCode,
+                exact);
 
-            if (items == null || !items.Any())
+            var response = PaginationHelper.PaginateMatches(items, x => x.Uid, page, pageSize, cursor);
+            if (response.TotalCount == 0)
             {
                 return NoContent();
             }
-            
-            var response = PaginationHelper.Paginate(items, page, pageSize);
-            return Ok(items);
+
+            return OkFields(response, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
+    }
+
+    [HttpGet("by-code/{code}")]
+    public IActionResult GetItemsByCode(string code, [FromQuery] bool prefix = false, [FromQuery] int page = 1, [FromQuery] int pageSize = 10, [FromQuery] string fields = null)
+    {
+        var auth = CheckAuthorization(Request.Headers["API_KEY"], "items", "get");
+        if (auth != null) return auth;
+
+        try
+        {
+            var items = DataProvider.fetch_item_pool().GetItemsByCode(code, prefix);
+            if (items.Count == 0) return NoContent();
+
+            return OkFields(PaginationHelper.Paginate(items, page, pageSize), fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
+    }
+
+    [HttpGet("by-upc/{upcCode}")]
+    public IActionResult GetItemsByUpcCode(string upcCode, [FromQuery] bool prefix = false, [FromQuery] int page = 1, [FromQuery] int pageSize = 10, [FromQuery] string fields = null)
+    {
+        var auth = CheckAuthorization(Request.Headers["API_KEY"], "items", "get");
+        if (auth != null) return auth;
+
+        try
+        {
+            var items = DataProvider.fetch_item_pool().GetItemsByUpcCode(upcCode, prefix);
+            if (items.Count == 0) return NoContent();
+
+            return OkFields(PaginationHelper.Paginate(items, page, pageSize), fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
+    }
+
+    [HttpGet("by-supplier-code/{supplierCode}")]
+    public IActionResult GetItemsBySupplierCode(string supplierCode, [FromQuery] bool prefix = false, [FromQuery] int page = 1, [FromQuery] int pageSize = 10, [FromQuery] string fields = null)
+    {
+        var auth = CheckAuthorization(Request.Headers["API_KEY"], "items", "get");
+        if (auth != null) return auth;
+
+        try
+        {
+            var items = DataProvider.fetch_item_pool().GetItemsBySupplierCode(supplierCode, prefix);
+            if (items.Count == 0) return NoContent();
+
+            return OkFields(PaginationHelper.Paginate(items, page, pageSize), fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
+    }
+
+    [HttpGet("by-supplier-part/{supplierPartNumber}")]
+    public IActionResult GetItemsBySupplierPartNumber(string supplierPartNumber, [FromQuery] bool prefix = false, [FromQuery] int page = 1, [FromQuery] int pageSize = 10, [FromQuery] string fields = null)
+    {
+        var auth = CheckAuthorization(Request.Headers["API_KEY"], "items", "get");
+        if (auth != null) return auth;
+
+        try
+        {
+            var items = DataProvider.fetch_item_pool().GetItemsBySupplierPartNumber(supplierPartNumber, prefix);
+            if (items.Count == 0) return NoContent();
+
+            return OkFields(PaginationHelper.Paginate(items, page, pageSize), fields);
         }
         catch (ArgumentException ex)
         {
@@ -349,7 +485,7 @@ public class ItemsController : BaseApiController, ILoggableAction
         if (auth != null) return auth;
 
         var success = DataProvider.fetch_item_pool().RemoveItem(id);
-        if (!success) return BadRequest("ID not found or other data is dependent on this data");
+        if (!success) return DeleteRefused(DataProvider.fetch_item_pool().GetItemDependents(id));
 
         DataProvider.fetch_item_pool().Save();
         return Ok();
@@ -18,25 +18,40 @@ public class LocationsController : BaseApiController
     [HttpGet]
     public IActionResult GetLocations(
         [FromQuery] int page = 1,
-        [FromQuery] int pageSize = 10)
+        [FromQuery] int pageSize = 10,
+        [FromQuery] string cursor = null,
+        [FromQuery] string filter = null,
+        [FromQuery] string sort = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "locations", "get");
         if (auth is UnauthorizedResult) return auth;
 
-        var locations = DataProvider.fetch_location_pool().GetLocations();
+        try
+        {
+            var locationPool = DataProvider.fetch_location_pool();
+            if (auth is OkResult)
+            {
+                var user = AuthProvider.GetUser(Request.Headers["API_KEY"]);
+                if (filter != null || sort != null)
+                {
+                    var own = $"Warehouse_Id:in:{string.Join("|", user.OwnWarehouses)}";
+                    return OkFields(locationPool.GetLocationsPage(page, pageSize, cursor: cursor, filter: string.IsNullOrWhiteSpace(filter) ? own : $"{filter};{own}", sort: sort), fields);
+                }
+                return OkFields(locationPool.GetLocationsInWarehousesPage(user.OwnWarehouses, page, pageSize, cursor), fields);
+            }
 
-        if (auth is OkResult)
+            var response = locationPool.GetLocationsPage(page, pageSize, cursor: cursor, filter: filter, sort: sort);
+            return OkFields(response, fields);
+        }
+        catch (ArgumentException ex)
         {
-            var user = AuthProvider.GetUser(Request.Headers["API_KEY"]);
-            locations = locations.Where(x => user.OwnWarehouses.Contains(x.Warehouse_Id)).ToList();
+            return BadRequest(ex.Message);
         }
-
-        var response = PaginationHelper.Paginate(locations, page, pageSize);
-        return Ok(response);
     }
 
     [HttpGet("{id}")]
-    public IActionResult GetLocation(int id)
+    public IActionResult GetLocation(int id, [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "locations", "getsingle");
         if (auth != null) return auth;
@@ -44,7 +59,7 @@ public class LocationsController : BaseApiController
         var location = DataProvider.fetch_location_pool().GetLocation(id);
         if (location == null) return NoContent();
 
-        return Ok(location);
+        return OkFields(location, fields);
     }
 
     [HttpGet("{id}/inventory")]
@@ -53,8 +68,10 @@ public class LocationsController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "locations", "getsingle");
         if (auth != null) return auth;
 
-        var inventory = DataProvider.fetch_location_pool().GetLocationsInWarehouse(id);
-        return Ok(inventory);
+        if (DataProvider.fetch_location_pool().GetLocation(id) == null) return NoContent();
+
+        var inventories = DataProvider.fetch_inventory_pool().GetInventoriesForLocation(id);
+        return Ok(inventories);
     }
 
     [HttpGet("search")]
@@ -63,7 +80,9 @@ public class LocationsController : BaseApiController
         [FromQuery] int? warehouseId = null, 
         [FromQuery] string code = null,
         [FromQuery] int page = 1,
-        [FromQuery] int pageSize = 10)
+        [FromQuery] int pageSize = 10,
+        [FromQuery] string cursor = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "locations", "get");
         if (auth != null) return auth;
@@ -75,13 +94,13 @@ public class LocationsController : BaseApiController
                 warehouseId, 
                 code);
             
-            if (locations == null || !locations.Any())
+            var response = PaginationHelper.PaginateMatches(locations, x => x.Id, page, pageSize, cursor);
+            if (response.TotalCount == 0)
             {
                 return NoContent();
             }
 
-            var response = PaginationHelper.Paginate(locations, page, pageSize);
-            return Ok(locations);
+            return OkFields(response, fields);
         }
         catch (ArgumentException ex)
         {
@@ -25,26 +25,39 @@ public class OrdersController : BaseApiController, ILoggableAction
     public IActionResult GetOrders(
         [FromQuery] int page = 1,
         [FromQuery] int pageSize = 10,
-        [FromQuery] string sortOrder = "asc")
+        [FromQuery] string sortOrder = "asc",
+        [FromQuery] string cursor = null,
+        [FromQuery] string filter = null,
+        [FromQuery] string sort = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "orders", "get");
         if (auth is UnauthorizedResult) return auth;
-        var orders = DataProvider.fetch_order_pool().GetOrders();
-        orders = sortOrder.ToLower() == "desc"
-            ? orders.OrderByDescending(c => c.Id).ToList()
-            : orders.OrderBy(c => c.Id).ToList();
-        if (auth is OkResult) 
+        try
         {
-            var user = AuthProvider.GetUser(Request.Headers["API_KEY"]);
-            orders = orders.Where(o => user.OwnWarehouses.Contains(o.Warehouse_Id)).ToList();
-        }
+            var orderPool = DataProvider.fetch_order_pool();
+            if (auth is OkResult) 
+            {
+                var user = AuthProvider.GetUser(Request.Headers["API_KEY"]);
+                if (filter != null || sort != null)
+                {
+                    var own = $"Warehouse_Id:in:{string.Join("|", user.OwnWarehouses)}";
+                    return OkFields(orderPool.GetOrdersPage(page, pageSize, sortOrder.ToLower() == "desc", cursor, string.IsNullOrWhiteSpace(filter) ? own : $"{filter};{own}", sort), fields);
+                }
+                return OkFields(orderPool.GetOrdersInWarehousesPage(user.OwnWarehouses, page, pageSize, sortOrder.ToLower() == "desc", cursor), fields);
+            }
 
-        var response = PaginationHelper.Paginate(orders, page, pageSize);
-        return Ok(response);
+            var response = orderPool.GetOrdersPage(page, pageSize, sortOrder.ToLower() == "desc", cursor, filter, sort);
+            return OkFields(response, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
     }
 
     [HttpGet("{id}")]
-    public IActionResult GetOrder(int id)
+    public IActionResult GetOrder(int id, [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "orders", "getsingle");
         if (auth != null) return auth;
@@ -52,7 +65,7 @@ public class OrdersController : BaseApiController, ILoggableAction
         var order = DataProvider.fetch_order_pool().GetOrder(id);
         if (order == null) return NoContent();
 
-        return Ok(order);
+        return OkFields(order, fields);
     }
 
     [HttpGet("{id}/items")]
@@ -83,8 +96,12 @@ public class OrdersController : BaseApiController, ILoggableAction
         [FromQuery] string orderStatus = null,
         [FromQuery] string orderDate = null,
         [FromQuery] int? warehouseId = null,
+        [FromQuery] string from = null,
+        [FromQuery] string to = null,
         [FromQuery] int page = 1,
-        [FromQuery] int pageSize = 10)
+        [FromQuery] int pageSize = 10,
+        [FromQuery] string cursor = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "orders", "get");
         if (auth != null) return auth;
@@ -95,15 +112,17 @@ public class OrdersController : BaseApiController, ILoggableAction
                 sourceId, 
                 orderStatus, 
                 orderDate,  
-                warehouseId);
+                warehouseId,
+                from: from,
+                to: to);
 
-            if (orders == null || !orders.Any())
+            var response = PaginationHelper.PaginateMatches(orders, x => x.Id, page, pageSize, cursor);
+            if (response.TotalCount == 0)
             {
                 return NoContent();
             }
 
-            var response = PaginationHelper.Paginate(orders, page, pageSize);
-            return Ok(orders);
+            return OkFields(response, fields);
         }
         catch (ArgumentException ex)
         {
@@ -182,6 +201,7 @@ public class OrdersController : BaseApiController, ILoggableAction
 
         DataProvider.fetch_order_pool().UpdateItemsInOrder(id, items);
         DataProvider.fetch_order_pool().Save();
+        DataProvider.fetch_inventory_pool().Save();
         return Ok();
     }
 
@@ -194,6 +214,7 @@ public class OrdersController : BaseApiController, ILoggableAction
         var order = DataProvider.fetch_order_pool().GetOrder(id);
         if (order == null) return NoContent();
 
+        var changes = new List<(Inventory Inventory, int Delta)>();
         foreach (var item in order.Items)
         {
             var inventories = DataProvider.fetch_inventory_pool().GetInventoriesForItem(item.Item_Id);
@@ -201,13 +222,17 @@ public class OrdersController : BaseApiController, ILoggableAction
             {
                 if (inventory.Locations.Contains(order.Source_Id))
                 {
-                    inventory.Total_On_Hand -= item.Amount;
+                    changes.Add((inventory, -item.Amount));
                 }
             }
         }
+        if (!DataProvider.fetch_inventory_pool().AdjustOnHand(changes))
+        {
+            return BadRequest("Inventory could not be updated; the order was not committed.");
+        }
 
         order.Order_Status = "Processed";
-        var success = DataProvider.fetch_order_pool().UpdateOrder(id, order);
+        var success = DataProvider.fetch_order_pool().OverwriteOrder(id, order);
         if (!success) return NoContent();
 
         _notificationSystem.Push($"Order with id: {order.Id} has been processed.");
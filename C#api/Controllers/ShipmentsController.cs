@@ -24,21 +24,28 @@ public class ShipmentsController : BaseApiController, ILoggableAction
     public IActionResult GetShipments(
         [FromQuery] int page = 1,
         [FromQuery] int pageSize = 10,
-        [FromQuery] string sortOrder = "asc")
+        [FromQuery] string sortOrder = "asc",
+        [FromQuery] string cursor = null,
+        [FromQuery] string filter = null,
+        [FromQuery] string sort = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "shipments", "get");
         if (auth != null) return auth;
 
-        var shipments = DataProvider.fetch_shipment_pool().GetShipments();
-        shipments = sortOrder.ToLower() == "desc"
-            ? shipments.OrderByDescending(c => c.Id).ToList()
-            : shipments.OrderBy(c => c.Id).ToList();
-        var response = PaginationHelper.Paginate(shipments, pageSize, page);
-        return Ok(response);
+        try
+        {
+            var response = DataProvider.fetch_shipment_pool().GetShipmentsPage(page, pageSize, sortOrder.ToLower() == "desc", cursor, filter, sort);
+            return OkFields(response, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
     }
 
     [HttpGet("{id}")]
-    public IActionResult GetShipment(int id)
+    public IActionResult GetShipment(int id, [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "shipments", "getsingle");
         if (auth != null) return auth;
@@ -46,7 +53,7 @@ public class ShipmentsController : BaseApiController, ILoggableAction
         var shipment = DataProvider.fetch_shipment_pool().GetShipment(id);
         if (shipment == null) return NoContent();
 
-        return Ok(shipment);
+        return OkFields(shipment, fields);
     }
 
     [HttpGet("{id}/orders")]
@@ -87,8 +94,12 @@ public class ShipmentsController : BaseApiController, ILoggableAction
         [FromQuery] string orderDate = null,
         [FromQuery] string shipmentStatus = null,
         [FromQuery] string carrierCode = null,
+        [FromQuery] string from = null,
+        [FromQuery] string to = null,
         [FromQuery] int page = 1,
-        [FromQuery] int pageSize = 10)
+        [FromQuery] int pageSize = 10,
+        [FromQuery] string cursor = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "shipments", "get");
         if (auth != null) return auth;
@@ -99,14 +110,17 @@ public class ShipmentsController : BaseApiController, ILoggableAction
                 orderId,  
                 orderDate, 
                 shipmentStatus, 
-                carrierCode);
+                carrierCode,
+                from: from,
+                to: to);
 
-            if (shipments == null || !shipments.Any())
+            var response = PaginationHelper.PaginateMatches(shipments, x => x.Id, page, pageSize, cursor);
+            if (response.TotalCount == 0)
             {
                 return NoContent();
             }
-            var response = PaginationHelper.Paginate(shipments, page, pageSize);
-            return Ok(shipments);
+
+            return OkFields(response, fields);
         }
         catch (ArgumentException ex)
         {
@@ -315,6 +329,7 @@ public class ShipmentsController : BaseApiController, ILoggableAction
 
         DataProvider.fetch_shipment_pool().UpdateItemsInShipment(id, items);
         DataProvider.fetch_shipment_pool().Save();
+        DataProvider.fetch_inventory_pool().Save();
         return Ok();
     }
 
@@ -327,6 +342,7 @@ public class ShipmentsController : BaseApiController, ILoggableAction
         var shipment = DataProvider.fetch_shipment_pool().GetShipment(id);
         if (shipment == null) return NoContent();
 
+        var changes = new List<(Inventory Inventory, int Delta)>();
         foreach (var item in shipment.Items)
         {
             var inventories = DataProvider.fetch_inventory_pool().GetInventoriesForItem(item.Item_Id);
@@ -334,13 +350,17 @@ public class ShipmentsController : BaseApiController, ILoggableAction
             {
                 if (inventory.Locations.Contains(shipment.Source_Id))
                 {
-                    inventory.Total_On_Hand -= item.Amount;
+                    changes.Add((inventory, -item.Amount));
                 }
             }
         }
+        if (!DataProvider.fetch_inventory_pool().AdjustOnHand(changes))
+        {
+            return BadRequest("Inventory could not be updated; the shipment was not committed.");
+        }
 
         shipment.Shipment_Status = "Shipped";
-        var success = DataProvider.fetch_shipment_pool().UpdateShipment(id, shipment);
+        var success = DataProvider.fetch_shipment_pool().OverwriteShipment(id, shipment);
         if (!success) return NoContent();
 
         _notificationSystem.Push($"Shipment with id: {shipment.Id} has been processed.");
@@ -356,7 +376,7 @@ public class ShipmentsController : BaseApiController, ILoggableAction
         if (auth != null) return auth;
 
         var success = DataProvider.fetch_shipment_pool().RemoveShipment(id);
-        if (!success) return BadRequest("ID not found or other data is dependent on this data");
+        if (!success) return DeleteRefused(DataProvider.fetch_shipment_pool().GetShipmentDependents(id));
 
         DataProvider.fetch_shipment_pool().Save();
         return Ok();
@@ -19,21 +19,28 @@ public class SuppliersController : BaseApiController
     public IActionResult GetSuppliers(
         [FromQuery] int page = 1,
         [FromQuery] int pageSize = 10,
-        [FromQuery] string sortOrder = "asc")
+        [FromQuery] string sortOrder = "asc",
+        [FromQuery] string cursor = null,
+        [FromQuery] string filter = null,
+        [FromQuery] string sort = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "suppliers", "get");
         if (auth != null) return auth;
 
-        var suppliers = DataProvider.fetch_supplier_pool().GetSuppliers();
-        suppliers = sortOrder.ToLower() == "desc"
-            ? suppliers.OrderByDescending(c => c.Id).ToList()
-            : suppliers.OrderBy(c => c.Id).ToList();
-        var response = PaginationHelper.Paginate(suppliers, page, pageSize);
-        return Ok(response);
+        try
+        {
+            var response = DataProvider.fetch_supplier_pool().GetSuppliersPage(page, pageSize, sortOrder.ToLower() == "desc", cursor, filter, sort);
+            return OkFields(response, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
     }
 
     [HttpGet("{id}")]
-    public IActionResult GetSupplier(int id)
+    public IActionResult GetSupplier(int id, [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "suppliers", "getsingle");
         if (auth != null) return auth;
@@ -41,7 +48,7 @@ public class SuppliersController : BaseApiController
         var supplier = DataProvider.fetch_supplier_pool().GetSupplier(id);
         if (supplier == null) return NoContent();
 
-        return Ok(supplier);
+        return OkFields(supplier, fields);
     }
 
     [HttpGet("{id}/items")]
@@ -61,7 +68,9 @@ public class SuppliersController : BaseApiController
         [FromQuery] string code = null, 
         [FromQuery] string phoneNumber = null,
         [FromQuery] int page = 1,
-        [FromQuery] int pageSize = 10)
+        [FromQuery] int pageSize = 10,
+        [FromQuery] string cursor = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "suppliers", "get");
         if (auth != null) return auth;
@@ -75,13 +84,13 @@ public class SuppliersController : BaseApiController
                 phoneNumber
                 );
 
-            if (suppliers == null || !suppliers.Any())
+            var response = PaginationHelper.PaginateMatches(suppliers, x => x.Id, page, pageSize, cursor);
+            if (response.TotalCount == 0)
             {
                 return NoContent();
             }
 
-            var response = PaginationHelper.Paginate(suppliers, page, pageSize);
-            return Ok(suppliers);
+            return OkFields(response, fields);
         }
         catch (ArgumentException ex)
         {
@@ -26,21 +26,28 @@ public class TransfersController : BaseApiController, ILoggableAction
     public IActionResult GetTransfers(
         [FromQuery] int page = 1,
         [FromQuery] int pageSize = 10,
-        [FromQuery] string sortOrder = "asc")
+        [FromQuery] string sortOrder = "asc",
+        [FromQuery] string cursor = null,
+        [FromQuery] string filter = null,
+        [FromQuery] string sort = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "transfers", "get");
         if (auth != null) return auth;
 
-        var transfers = DataProvider.fetch_transfer_pool().GetTransfers();
-        transfers = sortOrder.ToLower() == "desc"
-            ? transfers.OrderByDescending(c => c.Id).ToList()
-            : transfers.OrderBy(c => c.Id).ToList();
-        var response = PaginationHelper.Paginate(transfers, page, pageSize);
-        return Ok(response);
+        try
+        {
+            var response = DataProvider.fetch_transfer_pool().GetTransfersPage(page, pageSize, sortOrder.ToLower() == "desc", cursor, filter, sort);
+            return OkFields(response, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
     }
 
     [HttpGet("{id}")]
-    public IActionResult GetTransfer(int id)
+    public IActionResult GetTransfer(int id, [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "transfers", "get");
         if (auth != null) return auth;
@@ -48,7 +55,7 @@ public class TransfersController : BaseApiController, ILoggableAction
         var transfer = DataProvider.fetch_transfer_pool().GetTransfer(id);
         if (transfer == null) return NoContent();
 
-        return Ok(transfer);
+        return OkFields(transfer, fields);
     }
 
     [HttpGet("{id}/items")]
@@ -79,9 +86,12 @@ public class TransfersController : BaseApiController, ILoggableAction
         [FromQuery] int? transferTo = null,
         [FromQuery] string transferStatus = null,
         [FromQuery] string createdAt = null,
+        [FromQuery] string from = null,
+        [FromQuery] string to = null,
         [FromQuery] int page = 1,
-        [FromQuery] int pageSize = 10)
-        
+        [FromQuery] int pageSize = 10,
+        [FromQuery] string cursor = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "transfers", "get");
         if (auth != null) return auth;
@@ -92,15 +102,17 @@ public class TransfersController : BaseApiController, ILoggableAction
                 transferFrom, 
                 transferTo, 
                 transferStatus, 
-                createdAt);
+                createdAt,
+                from: from,
+                to: to);
 
-            if (transfers == null || !transfers.Any())
+            var response = PaginationHelper.PaginateMatches(transfers, x => x.Id, page, pageSize, cursor);
+            if (response.TotalCount == 0)
             {
                 return NoContent();
             }
 
-            var response = PaginationHelper.Paginate(transfers, page, pageSize);
-            return Ok(transfers);
+            return OkFields(response, fields);
         }
         catch (ArgumentException ex)
         {
@@ -241,6 +253,7 @@ public class TransfersController : BaseApiController, ILoggableAction
         if (transfer == null) return NoContent();
 
         // Update inventories based on transfer items
+        var changes = new List<(Inventory Inventory, int Delta)>();
         foreach (var item in transfer.Items)
         {
             var inventories = DataProvider.fetch_inventory_pool().GetInventoriesForItem(item.Item_Id);
@@ -249,15 +262,18 @@ public class TransfersController : BaseApiController, ILoggableAction
                 if (transfer.Transfer_From is null) break;
                 if (inventory.Locations.Contains((int)transfer.Transfer_From))
                 {
-                    inventory.Total_On_Hand -= item.Amount;
+                    changes.Add((inventory, -item.Amount));
                 }
                 else if (inventory.Locations.Contains((int)transfer.Transfer_To))
                 {
-                    inventory.Total_On_Hand += item.Amount;
+                    changes.Add((inventory, item.Amount));
                 }
-                DataProvider.fetch_inventory_pool().UpdateInventory((int)inventory.Id, inventory);
             }
         }
+        if (!DataProvider.fetch_inventory_pool().AdjustOnHand(changes))
+        {
+            return BadRequest("Inventory could not be updated; the transfer was not committed.");
+        }
 
         transfer.Transfer_Status = "Processed";
         var success = DataProvider.fetch_transfer_pool().UpdateTransfer(id, transfer);
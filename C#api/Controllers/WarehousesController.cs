@@ -19,21 +19,28 @@ public class WarehousesController : BaseApiController
     public IActionResult GetWarehouses(
         [FromQuery] int page = 1,
         [FromQuery] int pageSize = 10,
-        [FromQuery] string sortOrder = "asc")
+        [FromQuery] string sortOrder = "asc",
+        [FromQuery] string cursor = null,
+        [FromQuery] string filter = null,
+        [FromQuery] string sort = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "warehouses", "get");
         if (auth != null) return auth;
 
-        var warehouses = DataProvider.fetch_warehouse_pool().GetWarehouses();
-        warehouses = sortOrder.ToLower() == "desc"
-            ? warehouses.OrderByDescending(c => c.Id).ToList()
-            : warehouses.OrderBy(c => c.Id).ToList();
-        var response = PaginationHelper.Paginate(warehouses, page, pageSize);
-        return Ok(response);
+        try
+        {
+            var response = DataProvider.fetch_warehouse_pool().GetWarehousesPage(page, pageSize, sortOrder.ToLower() == "desc", cursor, filter, sort);
+            return OkFields(response, fields);
+        }
+        catch (ArgumentException ex)
+        {
+            return BadRequest(ex.Message);
+        }
     }
 
     [HttpGet("{id}")]
-    public IActionResult GetWarehouse(int id)
+    public IActionResult GetWarehouse(int id, [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "warehouses", "getsingle");
         if (auth != null) return auth;
@@ -41,7 +48,7 @@ public class WarehousesController : BaseApiController
         var warehouse = DataProvider.fetch_warehouse_pool().GetWarehouse(id);
         if (warehouse == null) return NoContent();
 
-        return Ok(warehouse);
+        return OkFields(warehouse, fields);
     }
 
     [HttpGet("{id}/locations")]
@@ -61,7 +68,9 @@ public class WarehousesController : BaseApiController
         [FromQuery] string city = null,
         [FromQuery] string country = null,
         [FromQuery] int page = 1,
-        [FromQuery] int pageSize = 10)
+        [FromQuery] int pageSize = 10,
+        [FromQuery] string cursor = null,
+        [FromQuery] string fields = null)
     {
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "warehouses", "get");
         if (auth != null) return auth;
@@ -75,13 +84,13 @@ public class WarehousesController : BaseApiController
                 country
                 );
             
-            if (warehouses == null || !warehouses.Any())
+            var response = PaginationHelper.PaginateMatches(warehouses, x => x.Id, page, pageSize, cursor);
+            if (response.TotalCount == 0)
             {
                 return NoContent();
             }
-            
-            var response = PaginationHelper.Paginate(warehouses, page, pageSize);
-            return Ok(warehouses);
+
+            return OkFields(response, fields);
         }
         catch (ArgumentException ex)
         {
@@ -216,7 +225,7 @@ public class WarehousesController : BaseApiController
         if (auth != null) return auth;
 
         var success = DataProvider.fetch_warehouse_pool().RemoveWarehouse(id);
-        if (!success) return BadRequest("ID not found or other data is dependent on this data");
+        if (!success) return DeleteRefused(DataProvider.fetch_warehouse_pool().GetWarehouseDependents(id));
 
         DataProvider.fetch_warehouse_pool().Save();
         return Ok();
@@ -0,0 +1,254 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using InterfacesV2;
+using Newtonsoft.Json;
+namespace HelpersV2;
+
+public class JournalMeta
+{
+    public int NextId { get; set; }
+}
+
+public class JournalEntry<T>
+{
+    public string Op { get; set; }
+    public string Key { get; set; }
+    public T? Record { get; set; }
+}
+
+// Append-only change log next to a pool's snapshot file (items.json -> items.journal).
+// Writes only append the records that changed; the snapshot is rewritten once the
+// journal has grown large enough relative to the collection.
+public class DataJournal<T> : IJournal where T : class
+{
+    public const string ADD = "add";
+    public const string REPLACE = "replace";
+    public const string REMOVE = "remove";
+
+    private const int MIN_COMPACT_ENTRIES = 1000;
+    private const int COMPACT_RATIO = 4;
+    private const int LOAD_BUFFER_SIZE = 64 * 1024;
+
+    private readonly string _snapshotPath;
+    private readonly string _journalPath;
+    private readonly string _metaPath;
+    private readonly Func<T, string> _keyOf;
+    private readonly Func<List<T>> _source;
+    private readonly Dictionary<string, PendingLine> _pending = new Dictionary<string, PendingLine>();
+    private readonly object _fileLock = new object();
+    private int _journalEntries;
+    private int _persistedNextId;
+
+    public DataJournal(string snapshotPath, Func<T, string> keyOf, Func<List<T>> source)
+    {
+        _snapshotPath = snapshotPath;
+        _journalPath = Path.ChangeExtension(snapshotPath, ".journal");
+        _metaPath = Path.ChangeExtension(snapshotPath, ".meta.json");
+        _keyOf = keyOf;
+        _source = source;
+    }
+
+    public string Name => Path.GetFileNameWithoutExtension(_snapshotPath);
+
+    public IdSequence Sequence { get; } = new IdSequence();
+
+    public void Add(T record) => Stage(ADD, record);
+
+    public void Replace(T record) => Stage(REPLACE, record);
+
+    public void Remove(T record) => Stage(REMOVE, record);
+
+    private void Stage(string op, T record)
+    {
+        var key = _keyOf(record);
+        // Serialized here, on the writing thread, so the flusher never reads a live record
+        // while a request may be changing it in place.
+        var line = JsonConvert.SerializeObject(new JournalEntry<T> { Op = op, Key = key, Record = op == REMOVE ? null : record }, Formatting.None);
+        lock (_pending)
+        {
+            // Only the latest state of a record matters, so repeated writes to the
+            // same key before a flush collapse into a single journal line.
+            _pending[key] = new PendingLine(key, line);
+        }
+    }
+
+    // Reads the snapshot one record at a time straight from the file stream instead of
+    // materializing the whole document as a string first, then applies the journal.
+    public List<T> Load()
+    {
+        var data = ReadSnapshot();
+        Replay(data);
+        ReadMeta();
+        return data;
+    }
+
+    private List<T> ReadSnapshot()
+    {
+        var data = new List<T>();
+        var length = new FileInfo(_snapshotPath).Length;
+        using (var stream = new FileStream(_snapshotPath, FileMode.Open, FileAccess.Read, FileShare.Read, LOAD_BUFFER_SIZE, FileOptions.SequentialScan))
+        using (var reader = new StreamReader(stream))
+        using (var jsonReader = new JsonTextReader(reader))
+        {
+            var serializer = JsonSerializer.CreateDefault();
+            if (jsonReader.Read() && jsonReader.TokenType == JsonToken.StartArray)
+            {
+                while (jsonReader.Read() && jsonReader.TokenType != JsonToken.EndArray)
+                {
+                    var record = serializer.Deserialize<T>(jsonReader);
+                    if (record == null) continue;
+                    if (data.Count == 0) data.Capacity = EstimateCapacity(record, length);
+                    data.Add(record);
+                }
+            }
+        }
+        return data;
+    }
+
+    // Snapshots are written indented by Compact, so the size of the first record
+    // re-serialized the same way is a good estimate of the size of every record.
+    private static int EstimateCapacity(T first, long length)
+    {
+        var recordSize = JsonConvert.SerializeObject(first, Formatting.Indented).Length;
+        return (int)Math.Min(int.MaxValue / 2, length / Math.Max(1, recordSize) + 1);
+    }
+
+    private void Replay(List<T> data)
+    {
+        _journalEntries = 0;
+        if (!File.Exists(_journalPath)) return;
+
+        var positions = new Dictionary<string, int>(data.Count);
+        for (int i = 0; i < data.Count; i++) positions[_keyOf(data[i])] = i;
+
+        var removed = false;
+        using (var reader = new StreamReader(_journalPath))
+        {
+            string? line;
+            while ((line = reader.ReadLine()) != null)
+            {
+                if (string.IsNullOrWhiteSpace(line)) continue;
+
+                JournalEntry<T>? entry;
+                try
+                {
+                    entry = JsonConvert.DeserializeObject<JournalEntry<T>>(line);
+                }
+                catch (JsonException)
+                {
+                    // A torn last line from an interrupted append; everything before it is valid.
+                    break;
+                }
+                if (entry == null) continue;
+
+                _journalEntries++;
+                if (entry.Op == REMOVE)
+                {
+                    if (positions.TryGetValue(entry.Key, out var index))
+                    {
+                        data[index] = null!;
+                        positions.Remove(entry.Key);
+                        removed = true;
+                    }
+                }
+                else if (entry.Record != null)
+                {
+                    if (positions.TryGetValue(entry.Key, out var index))
+                    {
+                        data[index] = entry.Record;
+                    }
+                    else
+                    {
+                        positions[entry.Key] = data.Count;
+                        data.Add(entry.Record);
+                    }
+                }
+            }
+        }
+
+        if (removed) data.RemoveAll(record => record == null);
+    }
+
+    public void Flush()
+    {
+        lock (_fileLock)
+        {
+            List<PendingLine> entries;
+            lock (_pending)
+            {
+                if (_pending.Count == 0) return;
+                entries = new List<PendingLine>(_pending.Values);
+            }
+
+            using (var writer = new StreamWriter(_journalPath, append: true))
+            {
+                foreach (var entry in entries)
+                {
+                    writer.WriteLine(entry.Line);
+                }
+            }
+
+            lock (_pending)
+            {
+                foreach (var entry in entries)
+                {
+                    if (_pending.TryGetValue(entry.Key, out var current) && ReferenceEquals(current, entry))
+                    {
+                        _pending.Remove(entry.Key);
+                    }
+                }
+            }
+            _journalEntries += entries.Count;
+            if (Sequence.Peek != _persistedNextId) WriteMeta();
+
+            if (_journalEntries >= Math.Max(MIN_COMPACT_ENTRIES, _source().Count / COMPACT_RATIO))
+            {
+                Compact();
+            }
+        }
+    }
+
+    private void ReadMeta()
+    {
+        if (!File.Exists(_metaPath)) return;
+        var meta = JsonConvert.DeserializeObject<JournalMeta>(File.ReadAllText(_metaPath));
+        if (meta == null) return;
+        Sequence.Seed(meta.NextId);
+        _persistedNextId = meta.NextId;
+    }
+
+    // Written after the journal lines it covers: if the process dies in between, the
+    // pool reseeds from the highest loaded id, which already includes those records.
+    private void WriteMeta()
+    {
+        var meta = new JournalMeta { NextId = Sequence.Peek };
+        var tempPath = _metaPath + ".tmp";
+        File.WriteAllText(tempPath, JsonConvert.SerializeObject(meta));
+        File.Move(tempPath, _metaPath, true);
+        _persistedNextId = meta.NextId;
+    }
+
+    private void Compact()
+    {
+        // Rebuilt from the files rather than from the pool's list: request threads keep
+        // adding, removing and patching records in place while this runs, and everything
+        // they staged after the last append lands in the fresh journal.
+        var records = ReadSnapshot();
+        Replay(records);
+        var tempPath = _snapshotPath + ".tmp";
+        using (var writer = new StreamWriter(tempPath))
+        using (var jsonWriter = new JsonTextWriter(writer) { Formatting = Formatting.Indented })
+        {
+            JsonSerializer.CreateDefault().Serialize(jsonWriter, records);
+        }
+        File.Move(tempPath, _snapshotPath, true);
+
+        // Once the snapshot is in place the journal is redundant; replaying it again
+        // after a crash between these two steps is harmless because entries are upserts.
+        File.WriteAllText(_journalPath, string.Empty);
+        _journalEntries = 0;
+    }
+
+    private sealed record PendingLine(string Key, string Line);
+}
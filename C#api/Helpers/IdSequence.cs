@@ -0,0 +1,30 @@
+using System.Threading;
+namespace HelpersV2;
+
+// Monotonic id counter for a pool. Seeded once at load and only ever moves forward,
+// so ids of deleted records are not handed out again.
+public class IdSequence
+{
+    private int _next = 1;
+
+    public int Peek => Volatile.Read(ref _next);
+
+    public int Next()
+    {
+        return Interlocked.Increment(ref _next) - 1;
+    }
+
+    public void Seed(int next)
+    {
+        int current;
+        while ((current = Volatile.Read(ref _next)) < next)
+        {
+            if (Interlocked.CompareExchange(ref _next, next, current) == current) return;
+        }
+    }
+
+    public void Observe(int id)
+    {
+        Seed(id + 1);
+    }
+}
@@ -0,0 +1,101 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+using InterfacesV2;
+namespace HelpersV2;
+
+// The single background writer behind the pools: commits only mark a journal as dirty,
+// and one thread appends the pending entries of every dirty journal on each interval
+// tick, or sooner once FlushBatchSize commits have piled up. In durable mode a commit
+// blocks until the flush that covers it has reached the disk.
+public class JournalFlusher
+{
+    private readonly object _flushLock = new object();
+    private readonly AutoResetEvent _flushSignal = new AutoResetEvent(false);
+    private readonly Thread _thread;
+    private HashSet<IJournal> _dirty = new HashSet<IJournal>();
+    private TaskCompletionSource _nextFlush = NewFlush();
+    private int _commitsSinceFlush;
+    private volatile bool _stopping;
+
+    public JournalFlusher(int flushIntervalMs = 1000, int flushBatchSize = 100, bool durableWrites = false)
+    {
+        FlushIntervalMs = flushIntervalMs;
+        FlushBatchSize = flushBatchSize;
+        DurableWrites = durableWrites;
+        _thread = new Thread(FlushLoop) { IsBackground = true, Name = "DataProvider flusher" };
+        _thread.Start();
+    }
+
+    public int FlushIntervalMs { get; }
+
+    public int FlushBatchSize { get; }
+
+    public bool DurableWrites { get; }
+
+    public void Commit(IJournal journal)
+    {
+        Task flushed;
+        lock (_flushLock)
+        {
+            _dirty.Add(journal);
+            flushed = _nextFlush.Task;
+            if (++_commitsSinceFlush >= FlushBatchSize || DurableWrites) _flushSignal.Set();
+        }
+        if (DurableWrites) flushed.GetAwaiter().GetResult();
+    }
+
+    // Writes whatever is still pending and ends the thread.
+    public void Stop()
+    {
+        _stopping = true;
+        _flushSignal.Set();
+        _thread.Join();
+    }
+
+    private void FlushLoop()
+    {
+        while (true)
+        {
+            _flushSignal.WaitOne(FlushIntervalMs);
+            FlushDirty();
+            if (_stopping) return;
+        }
+    }
+
+    private void FlushDirty()
+    {
+        HashSet<IJournal> dirty;
+        TaskCompletionSource flush;
+        lock (_flushLock)
+        {
+            dirty = _dirty;
+            flush = _nextFlush;
+            _dirty = new HashSet<IJournal>();
+            _nextFlush = NewFlush();
+            _commitsSinceFlush = 0;
+        }
+
+        var failures = new List<Exception>();
+        foreach (var journal in dirty)
+        {
+            try
+            {
+                journal.Flush();
+            }
+            catch (Exception ex)
+            {
+                // Unwritten entries stay pending in the journal, so retry on the next tick.
+                Console.WriteLine($"Failed to flush {journal.Name}: {ex.Message}");
+                failures.Add(ex);
+                lock (_flushLock) _dirty.Add(journal);
+            }
+        }
+
+        if (failures.Count == 0) flush.SetResult();
+        else flush.SetException(failures);
+    }
+
+    private static TaskCompletionSource NewFlush() => new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+}
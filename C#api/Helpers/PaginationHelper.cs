@@ -1,12 +1,19 @@
 using System;
 using System.Collections.Generic;
+using System.ComponentModel;
+using System.Globalization;
 using System.Linq;
+using System.Text;
+using System.Text.Json.Serialization;
 namespace HelpersV2;
 
 public static class PaginationHelper
 {
+    public const int CountLimit = 1000;
+
     public static PaginatedResponse<T> Paginate<T>(IEnumerable<T> source, int page, int pageSize)
     {
+        Validate(page, pageSize);
         var totalItems = source.Count();
         var paginatedItems = source.Skip((page - 1) * pageSize).Take(pageSize).ToList();
 
@@ -18,6 +25,204 @@ public static class PaginationHelper
             Items = paginatedItems
         };
     }
+
+    // Pages over an ordered set of keys and only looks up the records on the page. With a
+    // cursor the page starts right after the key it encodes instead of at an offset.
+    public static PaginatedResponse<T> Paginate<TKey, T>(IReadOnlyCollection<TKey> keys, Func<TKey, T> lookup, int page, int pageSize, bool descending = false, string? cursor = null)
+    {
+        Validate(page, pageSize);
+        var take = pageSize + 1;
+        var pageKeys = (cursor == null
+            ? PageOf(keys, (long)(page - 1) * pageSize, take, descending)
+            : KeysAfter(keys, DecodeCursor<TKey>(cursor), descending).Take(take)).ToList();
+        var hasMore = TrimToPage(pageKeys, pageSize);
+
+        return new PaginatedResponse<T>
+        {
+            TotalCount = keys.Count,
+            Page = page,
+            PageSize = pageSize,
+            Items = pageKeys.Select(lookup).Where(x => x != null).ToList(),
+            NextCursor = hasMore ? EncodeCursor(pageKeys[^1]!) : null
+        };
+    }
+
+    // Offset pages over keys kept in an order other than their own (creation order, say).
+    // There is no cursor, since a key alone does not say where in that order to resume.
+    public static PaginatedResponse<T> PaginateInOrder<TKey, T>(IReadOnlyCollection<TKey> keys, Func<TKey, T> lookup, int page, int pageSize)
+    {
+        Validate(page, pageSize);
+        var pageKeys = PageOf(keys, (long)(page - 1) * pageSize, pageSize, descending: false);
+
+        return new PaginatedResponse<T>
+        {
+            TotalCount = keys.Count,
+            Page = page,
+            PageSize = pageSize,
+            Items = pageKeys.Select(lookup).Where(x => x != null).ToList()
+        };
+    }
+
+    // Pages over search results that arrive in ascending key order without evaluating all of
+    // them: after the page and one match past it, matches are only counted, and only up to
+    // CountLimit. Past that TotalCount is a lower bound and TotalCountCapped is set.
+    public static PaginatedResponse<T> PaginateMatches<T, TKey>(IEnumerable<T> matches, Func<T, TKey> keyOf, int page, int pageSize, string? cursor = null)
+    {
+        Validate(page, pageSize);
+        var comparer = Comparer<TKey>.Default;
+        var hasAfter = cursor != null;
+        var after = hasAfter ? DecodeCursor<TKey>(cursor!) : default;
+        var skip = hasAfter ? 0 : (long)(page - 1) * pageSize;
+        var take = pageSize + 1;
+        var pageItems = new List<T>();
+        var seen = 0L;
+        var capped = false;
+
+        foreach (var match in matches)
+        {
+            if (pageItems.Count == take && seen >= CountLimit)
+            {
+                capped = true;
+                break;
+            }
+            seen++;
+            if (pageItems.Count < take && (hasAfter ? comparer.Compare(keyOf(match), after) > 0 : seen > skip)) pageItems.Add(match);
+        }
+        var hasMore = TrimToPage(pageItems, pageSize);
+
+        return new PaginatedResponse<T>
+        {
+            TotalCount = (int)Math.Min(seen, int.MaxValue),
+            TotalCountCapped = capped,
+            Page = page,
+            PageSize = pageSize,
+            Items = pageItems,
+            NextCursor = hasMore ? EncodeCursor(keyOf(pageItems[^1])!) : null
+        };
+    }
+
+    // Keyset pagination over records that are not kept in key order.
+    public static PaginatedResponse<T> PaginateAfter<T, TKey>(IEnumerable<T> source, Func<T, TKey> keyOf, string? cursor, int page, int pageSize, bool descending = false)
+    {
+        Validate(page, pageSize);
+        var comparer = Comparer<TKey>.Default;
+        var matches = source as ICollection<T> ?? source.ToList();
+        IEnumerable<T> remaining = matches;
+        if (cursor != null)
+        {
+            var after = DecodeCursor<TKey>(cursor);
+            remaining = matches.Where(x => descending ? comparer.Compare(keyOf(x), after) < 0 : comparer.Compare(keyOf(x), after) > 0);
+        }
+        var ordered = descending ? remaining.OrderByDescending(keyOf) : remaining.OrderBy(keyOf);
+        var pageItems = ordered.Take(pageSize + 1).ToList();
+        var hasMore = TrimToPage(pageItems, pageSize);
+
+        return new PaginatedResponse<T>
+        {
+            TotalCount = matches.Count,
+            Page = page,
+            PageSize = pageSize,
+            Items = pageItems,
+            NextCursor = hasMore ? EncodeCursor(keyOf(pageItems[^1])!) : null
+        };
+    }
+
+    public static string EncodeCursor(object key)
+    {
+        var text = Convert.ToString(key, CultureInfo.InvariantCulture) ?? string.Empty;
+        return Convert.ToBase64String(Encoding.UTF8.GetBytes(text)).TrimEnd('=').Replace('+', '-').Replace('/', '_');
+    }
+
+    public static TKey DecodeCursor<TKey>(string cursor)
+    {
+        try
+        {
+            var base64 = cursor.Replace('-', '+').Replace('_', '/');
+            base64 = base64.PadRight(base64.Length + (4 - base64.Length % 4) % 4, '=');
+            var text = Encoding.UTF8.GetString(Convert.FromBase64String(base64));
+            return (TKey)TypeDescriptor.GetConverter(typeof(TKey)).ConvertFromInvariantString(text)!;
+        }
+        catch (Exception ex) when (ex is FormatException || ex is NotSupportedException || ex is ArgumentException)
+        {
+            throw new ArgumentException("Invalid cursor.");
+        }
+    }
+
+    // Every paginate method checks its arguments first, so the ones below can rely on them;
+    // controllers turn the ArgumentException into a 400.
+    private static void Validate(int page, int pageSize)
+    {
+        if (page < 1) throw new ArgumentException("page must be at least 1.");
+        if (pageSize < 1) throw new ArgumentException("pageSize must be at least 1.");
+    }
+
+    // One entry past the page is read to know whether a next page exists.
+    private static bool TrimToPage<TItem>(List<TItem> entries, int pageSize)
+    {
+        if (entries.Count <= pageSize) return false;
+        entries.RemoveAt(entries.Count - 1);
+        return true;
+    }
+
+    private static IEnumerable<TKey> PageOf<TKey>(IReadOnlyCollection<TKey> keys, long skip, int take, bool descending)
+    {
+        if (keys is IReadOnlyList<TKey> list)
+        {
+            // Sorted lists are read as a range, in either direction, without walking the skipped keys.
+            var start = Math.Max(0, skip);
+            var end = Math.Min(list.Count, start + take);
+            for (var i = start; i < end; i++) yield return list[(int)(descending ? list.Count - 1 - i : i)];
+            yield break;
+        }
+
+        IEnumerable<TKey> ordered = keys;
+        if (descending) ordered = keys is SortedSet<TKey> sorted ? sorted.Reverse() : keys.Reverse();
+        foreach (var key in ordered.Skip((int)Math.Max(0, skip)).Take(take)) yield return key;
+    }
+
+    private static IEnumerable<TKey> KeysAfter<TKey>(IReadOnlyCollection<TKey> keys, TKey after, bool descending)
+    {
+        IComparer<TKey> comparer = Comparer<TKey>.Default;
+        if (keys is IReadOnlyList<TKey> list)
+        {
+            // First position whose key sorts after the cursor (or, descending, the last one before it).
+            int low = 0, high = list.Count;
+            while (low < high)
+            {
+                var middle = low + (high - low) / 2;
+                var order = comparer.Compare(list[middle], after);
+                if (order < 0 || (!descending && order == 0)) low = middle + 1;
+                else high = middle;
+            }
+            if (descending) for (var i = low - 1; i >= 0; i--) yield return list[i];
+            else for (var i = low; i < list.Count; i++) yield return list[i];
+            yield break;
+        }
+
+        if (keys is SortedSet<TKey> set)
+        {
+            comparer = set.Comparer;
+            if (set.Count == 0) yield break;
+            if (descending)
+            {
+                if (comparer.Compare(after, set.Min) <= 0) yield break;
+                foreach (var key in set.GetViewBetween(set.Min, after).Reverse()) if (comparer.Compare(key, after) < 0) yield return key;
+            }
+            else
+            {
+                if (comparer.Compare(after, set.Max) >= 0) yield break;
+                foreach (var key in set.GetViewBetween(after, set.Max)) if (comparer.Compare(key, after) > 0) yield return key;
+            }
+            yield break;
+        }
+
+        IEnumerable<TKey> ordered = descending ? keys.Reverse() : keys;
+        foreach (var key in ordered)
+        {
+            var order = comparer.Compare(key, after);
+            if (descending ? order < 0 : order > 0) yield return key;
+        }
+    }
 }
 
 public class PaginatedResponse<T>
@@ -26,4 +231,12 @@ public class PaginatedResponse<T>
     public int Page { get; set; }
     public int PageSize { get; set; }
     public List<T> Items { get; set; }
-}
\ No newline at end of file
+
+    // Opaque position of the last record on this page; pass it back as ?cursor= to continue.
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? NextCursor { get; set; }
+
+    // Set when counting stopped at PaginationHelper.CountLimit, making TotalCount a lower bound.
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingDefault)]
+    public bool TotalCountCapped { get; set; }
+}
@@ -0,0 +1,83 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Linq;
+using System.Text;
+using System.Threading.Tasks;
+namespace HelpersV2;
+
+public class PoolLoadResult
+{
+    public string Name { get; set; }
+    public long ElapsedMs { get; set; }
+    public int Records { get; set; }
+    public long Bytes { get; set; }
+}
+
+// Loads independent data pools concurrently on the thread pool and keeps
+// per-pool timings for the startup report.
+public class PoolLoader
+{
+    private readonly string _rootPath;
+    private readonly List<Task> _tasks = new List<Task>();
+    private readonly List<PoolLoadResult> _results = new List<PoolLoadResult>();
+    private readonly Stopwatch _total = Stopwatch.StartNew();
+
+    public PoolLoader(string rootPath)
+    {
+        _rootPath = rootPath;
+    }
+
+    public Task<T> Load<T>(string name, Func<T> create, Func<T, int> count)
+    {
+        var task = Task.Run(() =>
+        {
+            var stopwatch = Stopwatch.StartNew();
+            var pool = create();
+            stopwatch.Stop();
+
+            var result = new PoolLoadResult
+            {
+                Name = name,
+                ElapsedMs = stopwatch.ElapsedMilliseconds,
+                Records = count(pool),
+                Bytes = FileSize(name)
+            };
+            lock (_results) _results.Add(result);
+            return pool;
+        });
+        _tasks.Add(task);
+        return task;
+    }
+
+    public List<PoolLoadResult> WaitAll()
+    {
+        Task.WaitAll(_tasks.ToArray());
+        _total.Stop();
+        lock (_results) return _results.OrderByDescending(r => r.ElapsedMs).ToList();
+    }
+
+    public string Report(string title)
+    {
+        var results = WaitAll();
+        var report = new StringBuilder();
+        report.AppendLine($"{title}: loaded {results.Count} pools in {_total.ElapsedMilliseconds} ms");
+        foreach (var result in results)
+        {
+            report.AppendLine($"  {result.Name,-12} {result.ElapsedMs,7} ms {result.Records,9} records {result.Bytes,12} bytes");
+        }
+        return report.ToString().TrimEnd();
+    }
+
+    private long FileSize(string name)
+    {
+        long bytes = 0;
+        foreach (var extension in new[] { ".json", ".journal" })
+        {
+            var file = new FileInfo(Path.Combine(_rootPath, name + extension));
+            if (file.Exists) bytes += file.Length;
+        }
+        return bytes;
+    }
+}
@@ -0,0 +1,89 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+namespace HelpersV2;
+
+// Case-insensitive index over one text field for whole-value and prefix lookups: a hash
+// from the case-folded value to its records, plus the folded values in ordinal order so
+// all values sharing a prefix form one contiguous range.
+public class PrefixIndex<TId>
+{
+    private static readonly TId[] Empty = Array.Empty<TId>();
+
+    private readonly Dictionary<string, SortedSet<TId>> _ids = new Dictionary<string, SortedSet<TId>>(StringComparer.Ordinal);
+    private readonly SortedSet<string> _values = new SortedSet<string>(StringComparer.Ordinal);
+    private readonly Dictionary<TId, string> _keys = new Dictionary<TId, string>();
+
+    public IReadOnlyCollection<TId> Get(string? value)
+    {
+        if (value != null && _ids.TryGetValue(Fold(value), out var ids)) return ids;
+        return Empty;
+    }
+
+    public IndexLookup<TId> Lookup(string? value)
+    {
+        var ids = Get(value);
+        return new IndexLookup<TId>(ids.Count, () => ids);
+    }
+
+    // Every record whose value starts with the prefix, in key order.
+    public List<TId> StartingWith(string? prefix)
+    {
+        var matches = new List<TId>();
+        if (prefix == null || _values.Count == 0) return matches;
+
+        var low = Fold(prefix);
+        if (string.CompareOrdinal(low, _values.Max) > 0) return matches;
+        foreach (var value in _values.GetViewBetween(low, _values.Max))
+        {
+            if (!value.StartsWith(low, StringComparison.Ordinal)) break;
+            matches.AddRange(_ids[value]);
+        }
+        matches.Sort();
+        return matches;
+    }
+
+    public void Set(TId id, string? value)
+    {
+        var folded = value == null ? null : Fold(value);
+        if (_keys.TryGetValue(id, out var old))
+        {
+            if (old == folded) return;
+            Remove(id);
+        }
+        if (folded == null) return;
+
+        if (!_ids.TryGetValue(folded, out var ids))
+        {
+            ids = new SortedSet<TId>();
+            _ids[folded] = ids;
+            _values.Add(folded);
+        }
+        ids.Add(id);
+        _keys[id] = folded;
+    }
+
+    public void Remove(TId id)
+    {
+        if (!_keys.Remove(id, out var old)) return;
+        var ids = _ids[old];
+        ids.Remove(id);
+        if (ids.Count == 0)
+        {
+            _ids.Remove(old);
+            _values.Remove(old);
+        }
+    }
+
+    public void Clear()
+    {
+        _ids.Clear();
+        _values.Clear();
+        _keys.Clear();
+    }
+
+    private static string Fold(string value)
+    {
+        return value.ToUpperInvariant();
+    }
+}
@@ -0,0 +1,129 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Linq;
+using System.Linq.Expressions;
+using System.Reflection;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+namespace HelpersV2;
+
+// The properties of a model a ?fields= parameter asked for. Each chosen property gets a
+// compiled writer that reads it and hands it to the serializer with its own type, so a
+// projected record is written straight from the model instead of being copied into a
+// dictionary first. Built once per model and field set.
+public sealed class Projection<T>
+{
+    private static readonly List<PropertyInfo> Declared = typeof(T)
+        .GetProperties(BindingFlags.Public | BindingFlags.Instance)
+        .Where(property => property.CanRead && property.GetIndexParameters().Length == 0)
+        .ToList();
+
+    private static readonly Dictionary<string, PropertyInfo> Properties = Declared.ToDictionary(property => property.Name, StringComparer.OrdinalIgnoreCase);
+
+    private static readonly ConcurrentDictionary<string, Projection<T>> Cache = new ConcurrentDictionary<string, Projection<T>>(StringComparer.Ordinal);
+
+    private static readonly MethodInfo Serialize = typeof(JsonSerializer).GetMethods()
+        .Single(method => method.Name == nameof(JsonSerializer.Serialize) && method.IsGenericMethodDefinition
+            && method.GetParameters().Select(parameter => parameter.ParameterType.Name).SequenceEqual(new[] { nameof(Utf8JsonWriter), "TValue", nameof(JsonSerializerOptions) }));
+
+    private readonly List<(JsonEncodedText Name, Action<Utf8JsonWriter, T, JsonSerializerOptions> Write)> _writers;
+
+    private Projection(IEnumerable<PropertyInfo> properties)
+    {
+        _writers = properties.Select(property => (JsonEncodedText.Encode(property.Name), WriterFor(property))).ToList();
+    }
+
+    // Null when no fields were asked for. Fields are separated by ',' and matched
+    // case-insensitively; they are written in the model's declaration order.
+    public static Projection<T>? For(string? fields)
+    {
+        if (string.IsNullOrWhiteSpace(fields)) return null;
+
+        var chosen = new HashSet<PropertyInfo>();
+        foreach (var name in fields.Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries))
+        {
+            if (!Properties.TryGetValue(name, out var property)) throw new ArgumentException($"Unknown field '{name}'.");
+            chosen.Add(property);
+        }
+        var ordered = Declared.Where(chosen.Contains).ToList();
+        return Cache.GetOrAdd(string.Join(",", ordered.Select(property => property.Name)), _ => new Projection<T>(ordered));
+    }
+
+    public void Write(Utf8JsonWriter writer, T record, JsonSerializerOptions options)
+    {
+        writer.WriteStartObject();
+        foreach (var (name, write) in _writers)
+        {
+            writer.WritePropertyName(name);
+            write(writer, record, options);
+        }
+        writer.WriteEndObject();
+    }
+
+    public PaginatedResponse<Projected<T>> Apply(PaginatedResponse<T> page)
+    {
+        return new PaginatedResponse<Projected<T>>
+        {
+            TotalCount = page.TotalCount,
+            TotalCountCapped = page.TotalCountCapped,
+            Page = page.Page,
+            PageSize = page.PageSize,
+            Items = page.Items.Select(record => new Projected<T>(record, this)).ToList(),
+            NextCursor = page.NextCursor
+        };
+    }
+
+    // (writer, record, options) => JsonSerializer.Serialize<TProperty>(writer, record.Property, options)
+    private static Action<Utf8JsonWriter, T, JsonSerializerOptions> WriterFor(PropertyInfo property)
+    {
+        var writer = Expression.Parameter(typeof(Utf8JsonWriter), "writer");
+        var record = Expression.Parameter(typeof(T), "record");
+        var options = Expression.Parameter(typeof(JsonSerializerOptions), "options");
+        var call = Expression.Call(Serialize.MakeGenericMethod(property.PropertyType), writer, Expression.Property(record, property), options);
+        return Expression.Lambda<Action<Utf8JsonWriter, T, JsonSerializerOptions>>(call, writer, record, options).Compile();
+    }
+}
+
+// A record paired with the projection to write it through. A struct, so a projected page
+// holds no objects beyond the records it already had.
+[JsonConverter(typeof(ProjectedConverterFactory))]
+public readonly struct Projected<T>
+{
+    public Projected(T record, Projection<T> projection)
+    {
+        Record = record;
+        Projection = projection;
+    }
+
+    public T Record { get; }
+
+    public Projection<T> Projection { get; }
+}
+
+public class ProjectedConverterFactory : JsonConverterFactory
+{
+    public override bool CanConvert(Type typeToConvert)
+    {
+        return typeToConvert.IsGenericType && typeToConvert.GetGenericTypeDefinition() == typeof(Projected<>);
+    }
+
+    public override JsonConverter CreateConverter(Type typeToConvert, JsonSerializerOptions options)
+    {
+        return (JsonConverter)Activator.CreateInstance(typeof(ProjectedConverter<>).MakeGenericType(typeToConvert.GetGenericArguments()[0]))!;
+    }
+
+    private class ProjectedConverter<T> : JsonConverter<Projected<T>>
+    {
+        public override Projected<T> Read(ref Utf8JsonReader reader, Type typeToConvert, JsonSerializerOptions options)
+        {
+            throw new NotSupportedException("Projected records are write-only.");
+        }
+
+        public override void Write(Utf8JsonWriter writer, Projected<T> value, JsonSerializerOptions options)
+        {
+            if (value.Record == null) writer.WriteNullValue();
+            else value.Projection.Write(writer, value.Record, options);
+        }
+    }
+}
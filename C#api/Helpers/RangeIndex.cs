@@ -0,0 +1,83 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+namespace HelpersV2;
+
+// Ordered index over a numeric field (timestamps as ticks), so a range query reads only
+// the values inside the range instead of every record.
+public class RangeIndex<TId>
+{
+    private readonly Dictionary<long, SortedSet<TId>> _ids = new Dictionary<long, SortedSet<TId>>();
+    private readonly SortedSet<long> _values = new SortedSet<long>();
+    private readonly Dictionary<TId, long> _keys = new Dictionary<TId, long>();
+
+    // Records with a value in [from, to], either end open when null, in key order.
+    public List<TId> Between(long? from, long? to)
+    {
+        var matches = new List<TId>();
+        if (_values.Count == 0) return matches;
+
+        var low = Math.Max(from ?? long.MinValue, _values.Min);
+        var high = Math.Min(to ?? long.MaxValue, _values.Max);
+        if (low > high) return matches;
+
+        foreach (var value in _values.GetViewBetween(low, high)) matches.AddRange(_ids[value]);
+        matches.Sort();
+        return matches;
+    }
+
+    // The estimate assumes values are spread evenly between the smallest and the largest.
+    public IndexLookup<TId> Lookup(long? from, long? to)
+    {
+        if (_values.Count == 0) return new IndexLookup<TId>(0, () => Array.Empty<TId>());
+
+        var low = Math.Max(from ?? long.MinValue, _values.Min);
+        var high = Math.Min(to ?? long.MaxValue, _values.Max);
+        var share = low > high ? 0.0 : ((double)high - low + 1) / ((double)_values.Max - _values.Min + 1);
+        return new IndexLookup<TId>((long)Math.Ceiling(share * _keys.Count), () => Between(from, to));
+    }
+
+    public bool IsBetween(TId id, long? from, long? to)
+    {
+        return id is not null && _keys.TryGetValue(id, out var value)
+            && (from == null || value >= from) && (to == null || value <= to);
+    }
+
+    public void Set(TId id, long? value)
+    {
+        if (_keys.TryGetValue(id, out var old))
+        {
+            if (old == value) return;
+            Remove(id);
+        }
+        if (value == null) return;
+
+        if (!_ids.TryGetValue(value.Value, out var ids))
+        {
+            ids = new SortedSet<TId>();
+            _ids[value.Value] = ids;
+            _values.Add(value.Value);
+        }
+        ids.Add(id);
+        _keys[id] = value.Value;
+    }
+
+    public void Remove(TId id)
+    {
+        if (!_keys.Remove(id, out var old)) return;
+        var ids = _ids[old];
+        ids.Remove(id);
+        if (ids.Count == 0)
+        {
+            _ids.Remove(old);
+            _values.Remove(old);
+        }
+    }
+
+    public void Clear()
+    {
+        _ids.Clear();
+        _values.Clear();
+        _keys.Clear();
+    }
+}
@@ -0,0 +1,256 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+namespace HelpersV2;
+
+// One condition of a ?filter= parameter. Clauses are separated by ';' and written as
+// field:operator:value, for example
+//
+//     Warehouse_Id:eq:18;Order_Status:in:Open|Packed;Order_Date:between:2020-05-01..2020-05-31
+//
+// Operators are eq, ne, gt, ge, lt, le, in (values separated by '|'), between (inclusive,
+// "low..high", either side may be left empty) and contains (text fields, ignoring case).
+public class FilterClause<T>
+{
+    private static readonly string[] Operators = { "eq", "ne", "gt", "ge", "lt", "le", "in", "between", "contains" };
+
+    private FilterClause(SchemaField<T> field, string op, IReadOnlyList<object?> values)
+    {
+        Field = field;
+        Operator = op;
+        Values = values;
+        Matches = Compile();
+    }
+
+    public SchemaField<T> Field { get; }
+
+    public string Operator { get; }
+
+    // Parsed to the field's type; for between the low and the high bound, null when open.
+    public IReadOnlyList<object?> Values { get; }
+
+    public Func<T, bool> Matches { get; }
+
+    public static List<FilterClause<T>> Parse(string? filter)
+    {
+        var clauses = new List<FilterClause<T>>();
+        if (string.IsNullOrWhiteSpace(filter)) return clauses;
+
+        foreach (var text in filter.Split(';', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries))
+        {
+            // Values may contain ':' themselves (timestamps), so only the first two separate.
+            var parts = text.Split(':', 3);
+            if (parts.Length != 3) throw new ArgumentException($"Invalid filter clause '{text}'.");
+
+            var field = RecordSchema<T>.Field(parts[0]);
+            var op = parts[1].Trim().ToLowerInvariant();
+            if (!Operators.Contains(op)) throw new ArgumentException($"Unknown filter operator '{parts[1]}'.");
+            if (op == "contains" && !field.IsText) throw new ArgumentException($"contains only applies to text fields, not {field.Name}.");
+
+            var values = op switch
+            {
+                "in" => parts[2].Split('|', StringSplitOptions.RemoveEmptyEntries).Select(value => field.Parse(value)).ToList(),
+                "between" => ParseRange(field, parts[2]),
+                "contains" => new List<object?> { parts[2] },
+                "le" => new List<object?> { field.Parse(parts[2], upper: true) },
+                _ => new List<object?> { field.Parse(parts[2]) }
+            };
+            clauses.Add(new FilterClause<T>(field, op, values));
+        }
+        return clauses;
+    }
+
+    private static List<object?> ParseRange(SchemaField<T> field, string text)
+    {
+        var bounds = text.Split("..");
+        if (bounds.Length != 2) throw new ArgumentException($"Invalid range '{text}' for {field.Name}; expected low..high.");
+        return bounds.Select((bound, i) => bound.Length == 0 ? null : field.Parse(bound, upper: i == 1)).ToList();
+    }
+
+    private Func<T, bool> Compile()
+    {
+        var field = Field;
+        var value = Values.Count > 0 ? Values[0] : null;
+        switch (Operator)
+        {
+            case "eq": return x => field.Compare(field.ValueOf(x), value) == 0;
+            case "ne": return x => field.Compare(field.ValueOf(x), value) != 0;
+            case "gt": return x => Ordered(field.ValueOf(x), value) > 0;
+            case "ge": return x => Ordered(field.ValueOf(x), value) >= 0;
+            case "lt": return x => Ordered(field.ValueOf(x), value) < 0;
+            case "le": return x => Ordered(field.ValueOf(x), value) <= 0;
+            case "in":
+                var values = Values;
+                return x =>
+                {
+                    var actual = field.ValueOf(x);
+                    return values.Any(candidate => field.Compare(actual, candidate) == 0);
+                };
+            case "between":
+                var low = Values[0];
+                var high = Values[1];
+                return x =>
+                {
+                    var actual = field.ValueOf(x);
+                    return actual != null && (low == null || field.Compare(actual, low) >= 0) && (high == null || field.Compare(actual, high) <= 0);
+                };
+            default:
+                var text = (string)value!;
+                return x => field.ValueOf(x) is string actual && actual.Contains(text, StringComparison.OrdinalIgnoreCase);
+        }
+
+        // A missing value is neither above nor below anything.
+        int? Ordered(object? actual, object? bound) => actual == null || bound == null ? null : field.Compare(actual, bound);
+    }
+}
+
+// A ?sort= parameter: field names separated by ',', each descending when prefixed by '-',
+// for example "Warehouse_Id,-Order_Date".
+public class SortKey<T>
+{
+    private SortKey(SchemaField<T> field, bool descending)
+    {
+        Field = field;
+        Descending = descending;
+    }
+
+    public SchemaField<T> Field { get; }
+
+    public bool Descending { get; }
+
+    public static List<SortKey<T>> Parse(string? sort)
+    {
+        var keys = new List<SortKey<T>>();
+        if (string.IsNullOrWhiteSpace(sort)) return keys;
+
+        foreach (var text in sort.Split(',', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries))
+        {
+            var descending = text.StartsWith('-');
+            keys.Add(new SortKey<T>(RecordSchema<T>.Field(text.TrimStart('-', '+')), descending));
+        }
+        return keys;
+    }
+}
+
+// Evaluates ?filter= and ?sort= over one pool. The pool tells it which fields have an
+// index; clauses on those fields hand their lookup to RecordQuery, so the most selective
+// one drives the scan, and every clause is still checked with its compiled predicate.
+public class RecordFilter<TKey, T> where T : class
+{
+    private readonly RecordIndex<TKey, T> _records;
+    private readonly Dictionary<string, List<Func<FilterClause<T>, IndexLookup<TKey>?>>> _lookups = new Dictionary<string, List<Func<FilterClause<T>, IndexLookup<TKey>?>>>(StringComparer.OrdinalIgnoreCase);
+
+    public RecordFilter(RecordIndex<TKey, T> records)
+    {
+        _records = records;
+    }
+
+    // The index has to be keyed on exactly the field's value.
+    public RecordFilter<TKey, T> Index<TField>(string field, SecondaryIndex<TField, TKey> index)
+    {
+        return On(field, clause => clause.Operator switch
+        {
+            "eq" when clause.Values[0] != null => index.Lookup((TField)clause.Values[0]!),
+            "in" when clause.Values.All(value => value != null) => Union(clause.Values.Select(value => index.Lookup((TField)value!))),
+            _ => null
+        });
+    }
+
+    // The index has to hold the field's value as ticks.
+    public RecordFilter<TKey, T> Index(string field, RangeIndex<TKey> index)
+    {
+        return On(field, clause =>
+        {
+            var value = clause.Values.Count > 0 ? (long?)clause.Values[0] : null;
+            return clause.Operator switch
+            {
+                "eq" when value != null => index.Lookup(value, value),
+                "gt" when value != null => index.Lookup(value + 1, null),
+                "ge" when value != null => index.Lookup(value, null),
+                "lt" when value != null => index.Lookup(null, value - 1),
+                "le" when value != null => index.Lookup(null, value),
+                "between" => index.Lookup((long?)clause.Values[0], (long?)clause.Values[1]),
+                "in" when clause.Values.All(point => point != null) => Union(clause.Values.Select(point => index.Lookup((long?)point, (long?)point))),
+                _ => null
+            };
+        });
+    }
+
+    // Case-insensitive, so its candidates for eq are a superset the predicate narrows.
+    public RecordFilter<TKey, T> Index(string field, PrefixIndex<TKey> index)
+    {
+        return On(field, clause => clause.Operator switch
+        {
+            "eq" when clause.Values[0] != null => index.Lookup((string)clause.Values[0]!),
+            "in" when clause.Values.All(value => value != null) => Union(clause.Values.Select(value => index.Lookup((string)value!))),
+            _ => null
+        });
+    }
+
+    public RecordFilter<TKey, T> Index(string field, TrigramIndex<TKey> index)
+    {
+        return On(field, clause => clause.Operator == "contains" ? index.Lookup((string)clause.Values[0]!) : null);
+    }
+
+    // Without a sort the matches come in key order (reversed when descending) and support
+    // cursors; with one they are all collected and sorted, ties broken by key. A scope,
+    // when given, limits the records to those keys.
+    public PaginatedResponse<T> Page(string? filter, string? sort, int page, int pageSize, bool descending = false, string? cursor = null, SortedSet<TKey>? scope = null)
+    {
+        var query = new RecordQuery<TKey, T>(_records);
+        if (scope != null) query = query.Where(record => scope.Contains(_records.KeyOf(record)), new IndexLookup<TKey>(scope.Count, () => scope));
+        foreach (var clause in FilterClause<T>.Parse(filter)) query = query.Where(clause.Matches, LookupFor(clause));
+
+        var keys = SortKey<T>.Parse(sort);
+        if (keys.Count == 0)
+        {
+            return descending
+                ? PaginationHelper.PaginateAfter(query, _records.KeyOf, cursor, page, pageSize, descending: true)
+                : PaginationHelper.PaginateMatches(query, _records.KeyOf, page, pageSize, cursor);
+        }
+        if (cursor != null) throw new ArgumentException("A cursor cannot be combined with sort.");
+
+        IOrderedEnumerable<T>? sorted = null;
+        foreach (var key in keys)
+        {
+            var comparer = Comparer<object?>.Create(key.Field.Compare);
+            sorted = sorted == null
+                ? (key.Descending ? query.OrderByDescending(key.Field.ValueOf, comparer) : query.OrderBy(key.Field.ValueOf, comparer))
+                : (key.Descending ? sorted.ThenByDescending(key.Field.ValueOf, comparer) : sorted.ThenBy(key.Field.ValueOf, comparer));
+        }
+        var ordered = (descending ? sorted!.ThenByDescending(_records.KeyOf) : sorted!.ThenBy(_records.KeyOf)).ToList();
+        return PaginationHelper.Paginate(ordered, page, pageSize);
+    }
+
+    private RecordFilter<TKey, T> On(string field, Func<FilterClause<T>, IndexLookup<TKey>?> lookup)
+    {
+        var name = RecordSchema<T>.Field(field).Name;
+        if (!_lookups.TryGetValue(name, out var lookups))
+        {
+            lookups = new List<Func<FilterClause<T>, IndexLookup<TKey>?>>();
+            _lookups[name] = lookups;
+        }
+        lookups.Add(lookup);
+        return this;
+    }
+
+    // The cheapest of the lookups the field's indexes offer for this clause, if any.
+    private IndexLookup<TKey>? LookupFor(FilterClause<T> clause)
+    {
+        if (!_lookups.TryGetValue(clause.Field.Name, out var lookups)) return null;
+        return lookups.Select(lookup => lookup(clause)).Where(lookup => lookup != null).OrderBy(lookup => lookup!.Estimate).FirstOrDefault();
+    }
+
+    private static IndexLookup<TKey> Union(IEnumerable<IndexLookup<TKey>> lookups)
+    {
+        var parts = lookups.ToList();
+        return new IndexLookup<TKey>(parts.Sum(part => part.Estimate), () =>
+        {
+            if (parts.Count == 1) return parts[0].Candidates();
+
+            var ids = parts.SelectMany(part => part.Candidates()).Distinct().ToList();
+            ids.Sort();
+            return ids;
+        });
+    }
+}
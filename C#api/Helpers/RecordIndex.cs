@@ -0,0 +1,257 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+namespace HelpersV2;
+
+// Primary-key index over a pool's list: maps each key to its record and to the
+// record's position, so lookups and in-place replacements skip the linear scan.
+// All appends, replacements and removals have to go through the index, which also
+// keeps the pool's registered secondary indexes in step. They are serialized on
+// WriteLock; a pool holds the same lock around a whole write (look the record up,
+// change it, journal it) so concurrent requests to one pool apply one after another.
+// Reads take no lock.
+public class RecordIndex<TKey, T> where T : class
+{
+    private readonly Func<T, TKey> _keyOf;
+    private readonly object _writeLock = new object();
+    private readonly List<(Action<TKey, T?> Update, Action Clear)> _secondary = new List<(Action<TKey, T?>, Action)>();
+    private List<T> _data = new List<T>();
+    private Dictionary<TKey, T> _records = new Dictionary<TKey, T>();
+    private Dictionary<TKey, int> _positions = new Dictionary<TKey, int>();
+    private SortedKeyList<TKey> _sortedKeys = new SortedKeyList<TKey>();
+
+    public RecordIndex(Func<T, TKey> keyOf)
+    {
+        _keyOf = keyOf;
+    }
+
+    // Every key in the pool in ascending order, so listing a page is a range read.
+    public IReadOnlyList<TKey> Keys => _sortedKeys;
+
+    // The records in the same order, produced lazily so a search can stop early.
+    public IEnumerable<T> InKeyOrder => _sortedKeys.Select(key => _records[key]);
+
+    public TKey KeyOf(T record) => _keyOf(record);
+
+    public object WriteLock => _writeLock;
+
+    // The callback gets the key and the record's new state, or null once it is gone.
+    public void AddObserver(Action<TKey, T?> changed, Action cleared)
+    {
+        _secondary.Add((changed, cleared));
+    }
+
+    public SecondaryIndex<TField, TKey> AddIndex<TField>(Func<T, TField> fieldOf)
+    {
+        return AddMultiIndex(record => new[] { fieldOf(record) });
+    }
+
+    public SecondaryIndex<TField, TKey> AddMultiIndex<TField>(Func<T, IEnumerable<TField>> fieldsOf)
+    {
+        var index = new SecondaryIndex<TField, TKey>();
+        AddObserver((key, record) =>
+        {
+            if (record == null) index.Remove(key);
+            else index.Set(key, fieldsOf(record) ?? Enumerable.Empty<TField>());
+        }, index.Clear);
+        return index;
+    }
+
+    // The ids under each field value come ordered by rankOf, then by key.
+    public SecondaryIndex<TField, TKey> AddMultiIndex<TField>(Func<T, IEnumerable<TField>> fieldsOf, Func<T, long> rankOf)
+    {
+        var index = new SecondaryIndex<TField, TKey>(ranked: true);
+        AddObserver((key, record) =>
+        {
+            if (record == null) index.Remove(key);
+            else index.Set(key, fieldsOf(record) ?? Enumerable.Empty<TField>(), rankOf(record));
+        }, index.Clear);
+        return index;
+    }
+
+    public RangeIndex<TKey> AddRangeIndex(Func<T, long?> valueOf)
+    {
+        var index = new RangeIndex<TKey>();
+        AddObserver((key, record) =>
+        {
+            if (record == null) index.Remove(key);
+            else index.Set(key, valueOf(record));
+        }, index.Clear);
+        return index;
+    }
+
+    public PrefixIndex<TKey> AddPrefixIndex(Func<T, string?> fieldOf)
+    {
+        var index = new PrefixIndex<TKey>();
+        AddObserver((key, record) =>
+        {
+            if (record == null) index.Remove(key);
+            else index.Set(key, fieldOf(record));
+        }, index.Clear);
+        return index;
+    }
+
+    public TrigramIndex<TKey> AddTrigrams(Func<T, string?> fieldOf)
+    {
+        var index = new TrigramIndex<TKey>();
+        AddObserver((key, record) =>
+        {
+            if (record == null) index.Remove(key);
+            else index.Set(key, fieldOf(record));
+        }, index.Clear);
+        return index;
+    }
+
+    public void AddReferences(ReferenceTracker tracker, string pool, Func<T, IEnumerable<(string Pool, object Key)>> referencesOf)
+    {
+        AddObserver((key, record) =>
+        {
+            if (record == null) tracker.Remove(pool, key);
+            else tracker.Set(pool, key, referencesOf(record));
+        }, () => tracker.Clear(pool));
+    }
+
+    public RunningTotals<TField, TKey> AddTotals<TField>(Func<T, TField> fieldOf, Func<T, int[]> valuesOf, int width)
+    {
+        var totals = new RunningTotals<TField, TKey>(width);
+        AddObserver((key, record) =>
+        {
+            if (record == null) totals.Remove(key);
+            else totals.Set(key, fieldOf(record), valuesOf(record));
+        }, totals.Clear);
+        return totals;
+    }
+
+    public void Load(List<T> data)
+    {
+        lock (_writeLock)
+        {
+            _data = data;
+            _records = new Dictionary<TKey, T>(data.Count);
+            _positions = new Dictionary<TKey, int>(data.Count);
+            foreach (var secondary in _secondary) secondary.Clear();
+            for (int i = 0; i < data.Count; i++)
+            {
+                var key = _keyOf(data[i]);
+                // The first record wins on a duplicate key, like the Find() it replaces.
+                if (key is not null && _records.TryAdd(key, data[i]))
+                {
+                    _positions[key] = i;
+                    Reindex(key, data[i]);
+                }
+            }
+            _sortedKeys = new SortedKeyList<TKey>(_records.Keys);
+        }
+    }
+
+    public bool Contains(TKey key)
+    {
+        return key is not null && _records.ContainsKey(key);
+    }
+
+    public T? Get(TKey key)
+    {
+        return key is not null && _records.TryGetValue(key, out var record) ? record : null;
+    }
+
+    public int IndexOf(TKey key)
+    {
+        return key is not null && _positions.TryGetValue(key, out var index) ? index : -1;
+    }
+
+    public List<T> GetMany(IEnumerable<TKey> keys)
+    {
+        var records = new List<T>();
+        foreach (var key in keys)
+        {
+            var record = Get(key);
+            if (record != null) records.Add(record);
+        }
+        return records;
+    }
+
+    // False, leaving the pool untouched, when the record has no key or its key is taken.
+    public bool Add(T record)
+    {
+        lock (_writeLock)
+        {
+            var key = _keyOf(record);
+            if (key is null || !_records.TryAdd(key, record)) return false;
+
+            _data.Add(record);
+            _positions[key] = _data.Count - 1;
+            _sortedKeys.Add(key);
+            Reindex(key, record);
+            return true;
+        }
+    }
+
+    // For records that were changed in place (PATCH) rather than swapped out.
+    public void Refresh(T record)
+    {
+        lock (_writeLock)
+        {
+            var key = _keyOf(record);
+            if (key is not null && ReferenceEquals(Get(key), record)) Reindex(key, record);
+        }
+    }
+
+    public void Replace(int index, T record)
+    {
+        lock (_writeLock)
+        {
+            var oldKey = _keyOf(_data[index]);
+            if (oldKey is not null && ReferenceEquals(Get(oldKey), _data[index]))
+            {
+                _records.Remove(oldKey);
+                _positions.Remove(oldKey);
+                _sortedKeys.Remove(oldKey);
+                Reindex(oldKey, null);
+            }
+
+            _data[index] = record;
+            var key = _keyOf(record);
+            if (key is not null)
+            {
+                if (!_records.ContainsKey(key)) _sortedKeys.Add(key);
+                _records[key] = record;
+                _positions[key] = index;
+                Reindex(key, record);
+            }
+        }
+    }
+
+    public bool Remove(T record)
+    {
+        lock (_writeLock)
+        {
+            if (record == null) return false;
+            var key = _keyOf(record);
+            var index = IndexOf(key);
+            if (index < 0 || !ReferenceEquals(_data[index], record)) return false;
+
+            // Swap-remove: the last record moves into the hole, so a delete touches one
+            // position instead of renumbering everything behind it. The list's order is
+            // therefore not meaningful; listings read the records through Keys instead.
+            var last = _data.Count - 1;
+            if (index != last)
+            {
+                var moved = _data[last];
+                _data[index] = moved;
+                var movedKey = _keyOf(moved);
+                if (movedKey is not null && ReferenceEquals(Get(movedKey), moved)) _positions[movedKey] = index;
+            }
+            _data.RemoveAt(last);
+            _records.Remove(key);
+            _positions.Remove(key);
+            _sortedKeys.Remove(key);
+            Reindex(key, null);
+            return true;
+        }
+    }
+
+    private void Reindex(TKey key, T? record)
+    {
+        foreach (var secondary in _secondary) secondary.Update(key, record);
+    }
+}
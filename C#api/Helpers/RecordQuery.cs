@@ -0,0 +1,59 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Linq;
+namespace HelpersV2;
+
+// What an index can tell the planner about one filter: about how many records pass it,
+// and, only if the planner asks, which ones (in key order).
+public class IndexLookup<TId>
+{
+    private readonly Func<IReadOnlyCollection<TId>> _candidates;
+
+    public IndexLookup(long estimate, Func<IReadOnlyCollection<TId>> candidates)
+    {
+        Estimate = estimate;
+        _candidates = candidates;
+    }
+
+    public long Estimate { get; }
+
+    public IReadOnlyCollection<TId> Candidates() => _candidates();
+}
+
+// A search over one pool. Each filter is a predicate, optionally with an index lookup for
+// it. On enumeration the filter whose index expects the fewest records supplies the
+// candidates and every filter is then checked on them, the most selective first, so the
+// cost follows the size of the smallest index answer rather than the size of the pool.
+public class RecordQuery<TKey, T> : IEnumerable<T> where T : class
+{
+    private readonly RecordIndex<TKey, T> _records;
+    private readonly List<(Func<T, bool> Matches, IndexLookup<TKey>? Lookup)> _filters = new List<(Func<T, bool>, IndexLookup<TKey>?)>();
+
+    public RecordQuery(RecordIndex<TKey, T> records)
+    {
+        _records = records;
+    }
+
+    public RecordQuery<TKey, T> Where(Func<T, bool> matches, IndexLookup<TKey>? lookup = null)
+    {
+        _filters.Add((matches, lookup));
+        return this;
+    }
+
+    public IEnumerator<T> GetEnumerator()
+    {
+        // OrderBy is stable, so filters without an index keep their order at the end.
+        var plan = _filters.OrderBy(filter => filter.Lookup?.Estimate ?? long.MaxValue).ToList();
+
+        IEnumerable<T> source = _records.InKeyOrder;
+        if (plan.Count > 0 && plan[0].Lookup is IndexLookup<TKey> driver && driver.Estimate < _records.Keys.Count)
+        {
+            source = driver.Candidates().Select(key => _records.Get(key)).Where(record => record != null)!;
+        }
+        foreach (var filter in plan) source = source.Where(filter.Matches);
+        return source.GetEnumerator();
+    }
+
+    IEnumerator IEnumerable.GetEnumerator() => GetEnumerator();
+}
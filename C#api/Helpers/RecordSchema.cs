@@ -0,0 +1,90 @@
+using System;
+using System.Collections.Generic;
+using System.ComponentModel;
+using System.Globalization;
+using System.Linq;
+using System.Linq.Expressions;
+using System.Reflection;
+namespace HelpersV2;
+
+// One scalar property of a model, as query parameters see it. The getter is compiled
+// once per model, so filters and sorts read fields without reflection per record.
+// String fields named *_Date or *_At hold timestamps and compare as UTC ticks.
+public class SchemaField<T>
+{
+    private readonly Func<T, object?> _valueOf;
+
+    internal SchemaField(PropertyInfo property)
+    {
+        Name = property.Name;
+        Type = Nullable.GetUnderlyingType(property.PropertyType) ?? property.PropertyType;
+        IsDate = Type == typeof(string) && (Name.EndsWith("_Date") || Name.EndsWith("_At"));
+
+        var record = Expression.Parameter(typeof(T), "record");
+        var read = Expression.Lambda<Func<T, object?>>(Expression.Convert(Expression.Property(record, property), typeof(object)), record).Compile();
+        _valueOf = IsDate ? x => Timestamps.Parse((string?)read(x)) : read;
+    }
+
+    public string Name { get; }
+
+    public Type Type { get; }
+
+    public bool IsDate { get; }
+
+    public bool IsText => Type == typeof(string) && !IsDate;
+
+    // Dates come back as ticks, everything else as stored.
+    public object? ValueOf(T record) => _valueOf(record);
+
+    // An upper bound given as a bare date covers that whole day.
+    public object? Parse(string text, bool upper = false)
+    {
+        if (text == "null") return null;
+        if (IsDate)
+        {
+            if (Timestamps.Parse(text) == null) throw new ArgumentException($"Invalid date '{text}' for {Name}.");
+            return Timestamps.ParseBound(text, Name, upper);
+        }
+        if (Type == typeof(string)) return text;
+        try
+        {
+            return TypeDescriptor.GetConverter(Type).ConvertFromInvariantString(text);
+        }
+        catch (Exception ex) when (ex is FormatException || ex is NotSupportedException || ex is ArgumentException)
+        {
+            throw new ArgumentException($"Invalid value '{text}' for {Name}.");
+        }
+    }
+
+    // Nulls sort first; text compares ordinally.
+    public int Compare(object? a, object? b)
+    {
+        if (a == null || b == null) return a == null ? (b == null ? 0 : -1) : 1;
+        if (a is string left) return string.CompareOrdinal(left, (string)b);
+        return Comparer<object>.Default.Compare(a, b);
+    }
+}
+
+// The fields of a model that can be filtered, sorted or selected by name, matched
+// case-insensitively. Built once per model type.
+public static class RecordSchema<T>
+{
+    private static readonly Dictionary<string, SchemaField<T>> Fields = typeof(T)
+        .GetProperties(BindingFlags.Public | BindingFlags.Instance)
+        .Where(property => property.CanRead && property.GetIndexParameters().Length == 0 && IsScalar(property.PropertyType))
+        .ToDictionary(property => property.Name, property => new SchemaField<T>(property), StringComparer.OrdinalIgnoreCase);
+
+    public static IEnumerable<SchemaField<T>> All => Fields.Values;
+
+    public static SchemaField<T> Field(string name)
+    {
+        if (Fields.TryGetValue(name.Trim(), out var field)) return field;
+        throw new ArgumentException($"Unknown field '{name.Trim()}'.");
+    }
+
+    private static bool IsScalar(Type type)
+    {
+        type = Nullable.GetUnderlyingType(type) ?? type;
+        return type.IsPrimitive || type.IsEnum || type == typeof(string) || type == typeof(decimal) || type == typeof(DateTime);
+    }
+}
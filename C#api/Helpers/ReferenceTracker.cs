@@ -0,0 +1,107 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+namespace HelpersV2;
+
+// Cross-pool registry of foreign keys: for every referenced record ("clients", "5") it
+// knows which records of which pools point at it ("orders" -> {"12", "40"}). Pools feed
+// it through RecordIndex.AddReferences, so it is updated on every add, update and
+// remove, and delete checks no longer have to scan the referencing pools.
+public class ReferenceTracker
+{
+    private readonly object _lock = new object();
+    private readonly Dictionary<(string Pool, string Key), Dictionary<string, HashSet<string>>> _referrers = new Dictionary<(string, string), Dictionary<string, HashSet<string>>>();
+    private readonly Dictionary<(string Pool, string Key), (string Pool, string Key)[]> _references = new Dictionary<(string, string), (string, string)[]>();
+
+    public bool IsReferenced(string pool, object key, params string[] by)
+    {
+        lock (_lock)
+        {
+            if (key == null || !_referrers.TryGetValue((pool, key.ToString()), out var sources)) return false;
+            return by.Length == 0 || by.Any(sources.ContainsKey);
+        }
+    }
+
+    // The keys of the records pointing at this one, per referring pool, limited to the
+    // pools in by when any are given.
+    public Dictionary<string, List<string>> GetReferrers(string pool, object key, params string[] by)
+    {
+        lock (_lock)
+        {
+            if (key == null || !_referrers.TryGetValue((pool, key.ToString()), out var sources))
+            {
+                return new Dictionary<string, List<string>>();
+            }
+            return sources.Where(source => by.Length == 0 || by.Contains(source.Key))
+                          .ToDictionary(source => source.Key, source => source.Value.ToList());
+        }
+    }
+
+    public void Set(string pool, object key, IEnumerable<(string Pool, object Key)> targets)
+    {
+        var source = (pool, key.ToString());
+        var newTargets = targets.Where(target => target.Key != null)
+                                .Select(target => (target.Pool, target.Key.ToString()))
+                                .Distinct()
+                                .ToArray();
+        lock (_lock)
+        {
+            if (_references.TryGetValue(source, out var oldTargets))
+            {
+                if (oldTargets.Length == newTargets.Length && !oldTargets.Except(newTargets).Any()) return;
+                Unlink(source, oldTargets);
+            }
+
+            foreach (var target in newTargets)
+            {
+                if (!_referrers.TryGetValue(target, out var sources))
+                {
+                    sources = new Dictionary<string, HashSet<string>>();
+                    _referrers[target] = sources;
+                }
+                if (!sources.TryGetValue(pool, out var keys))
+                {
+                    keys = new HashSet<string>();
+                    sources[pool] = keys;
+                }
+                keys.Add(source.Item2);
+            }
+            if (newTargets.Length > 0) _references[source] = newTargets;
+            else _references.Remove(source);
+        }
+    }
+
+    public void Remove(string pool, object key)
+    {
+        var source = (pool, key.ToString());
+        lock (_lock)
+        {
+            if (_references.TryGetValue(source, out var oldTargets)) Unlink(source, oldTargets);
+        }
+    }
+
+    // Forgets everything one pool refers to, e.g. before that pool is reloaded.
+    public void Clear(string pool)
+    {
+        lock (_lock)
+        {
+            foreach (var source in _references.Where(reference => reference.Key.Pool == pool).ToList())
+            {
+                Unlink(source.Key, source.Value);
+            }
+        }
+    }
+
+    private void Unlink((string Pool, string Key) source, (string Pool, string Key)[] targets)
+    {
+        foreach (var target in targets)
+        {
+            var sources = _referrers[target];
+            var keys = sources[source.Pool];
+            keys.Remove(source.Key);
+            if (keys.Count == 0) sources.Remove(source.Pool);
+            if (sources.Count == 0) _referrers.Remove(target);
+        }
+        _references.Remove(source);
+    }
+}
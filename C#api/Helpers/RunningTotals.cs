@@ -0,0 +1,52 @@
+using System;
+using System.Collections.Generic;
+namespace HelpersV2;
+
+// Per-key sums of a fixed set of counters (e.g. inventory totals per item). Like
+// SecondaryIndex it remembers what each record contributed, so a record that was
+// changed in place is subtracted with its old values, not its current ones.
+public class RunningTotals<TKey, TId>
+{
+    private readonly int _width;
+    private readonly Dictionary<TKey, long[]> _sums = new Dictionary<TKey, long[]>();
+    private readonly Dictionary<TId, (TKey Key, int[] Values)> _contributions = new Dictionary<TId, (TKey, int[])>();
+
+    public RunningTotals(int width)
+    {
+        _width = width;
+    }
+
+    public long[] Get(TKey key)
+    {
+        var totals = new long[_width];
+        if (key is not null && _sums.TryGetValue(key, out var sums)) Array.Copy(sums, totals, _width);
+        return totals;
+    }
+
+    public void Set(TId id, TKey key, int[] values)
+    {
+        Remove(id);
+        if (key is null) return;
+
+        if (!_sums.TryGetValue(key, out var sums))
+        {
+            sums = new long[_width];
+            _sums[key] = sums;
+        }
+        for (int i = 0; i < _width; i++) sums[i] += values[i];
+        _contributions[id] = (key, values);
+    }
+
+    public void Remove(TId id)
+    {
+        if (!_contributions.Remove(id, out var contribution)) return;
+        var sums = _sums[contribution.Key];
+        for (int i = 0; i < _width; i++) sums[i] -= contribution.Values[i];
+    }
+
+    public void Clear()
+    {
+        _sums.Clear();
+        _contributions.Clear();
+    }
+}
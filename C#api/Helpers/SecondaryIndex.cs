@@ -0,0 +1,113 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+namespace HelpersV2;
+
+// Maps a non-unique field (a foreign key, a location id, ...) to the primary keys of
+// the records that carry it. It remembers the keys each record was filed under, so a
+// record that changed in place can be moved without knowing its old values.
+//
+// The ids under a key are in key order, or, for a ranked index, in the order of a rank
+// given with each record (creation time, say) with ties broken by key, so a page in
+// that order is read off the set without sorting.
+public class SecondaryIndex<TKey, TId>
+{
+    private static readonly TId[] Empty = Array.Empty<TId>();
+
+    private readonly Dictionary<TKey, SortedSet<TId>> _ids = new Dictionary<TKey, SortedSet<TId>>();
+    private readonly Dictionary<TId, TKey[]> _keys = new Dictionary<TId, TKey[]>();
+    private readonly Dictionary<TId, long>? _ranks;
+    private readonly IComparer<TId> _order = Comparer<TId>.Default;
+
+    public SecondaryIndex(bool ranked = false)
+    {
+        if (!ranked) return;
+        _ranks = new Dictionary<TId, long>();
+        _order = Comparer<TId>.Create((a, b) =>
+        {
+            var order = _ranks[a].CompareTo(_ranks[b]);
+            return order != 0 ? order : Comparer<TId>.Default.Compare(a, b);
+        });
+    }
+
+    public IReadOnlyCollection<TId> Get(TKey key)
+    {
+        if (key is not null && _ids.TryGetValue(key, out var ids)) return ids;
+        return Empty;
+    }
+
+    public bool Any(TKey key)
+    {
+        return key is not null && _ids.ContainsKey(key);
+    }
+
+    public IEnumerable<TKey> Keys => _ids.Keys;
+
+    // Candidates always come in key order, as the planner expects, even from a ranked index.
+    public IndexLookup<TId> Lookup(TKey key)
+    {
+        var ids = Get(key);
+        if (_ranks == null) return new IndexLookup<TId>(ids.Count, () => ids);
+        return new IndexLookup<TId>(ids.Count, () => ids.OrderBy(id => id).ToList());
+    }
+
+    // Every key the filter accepts, for fields with a handful of distinct values such as a
+    // status, where walking the keys is cheap.
+    public IndexLookup<TId> LookupWhere(Func<TKey, bool> accept)
+    {
+        var matches = _ids.Where(entry => accept(entry.Key)).Select(entry => entry.Value).ToList();
+        return new IndexLookup<TId>(matches.Sum(ids => (long)ids.Count), () =>
+        {
+            if (matches.Count == 0) return Empty;
+            if (matches.Count == 1 && _ranks == null) return matches[0];
+
+            var ids = matches.SelectMany(set => set).ToList();
+            ids.Sort();
+            return ids;
+        });
+    }
+
+    // The rank only matters for a ranked index.
+    public void Set(TId id, IEnumerable<TKey> keys, long rank = 0)
+    {
+        var newKeys = keys.Where(key => key is not null).Distinct().ToArray();
+        if (_keys.TryGetValue(id, out var oldKeys))
+        {
+            var sameRank = _ranks == null || _ranks[id] == rank;
+            if (sameRank && oldKeys.Length == newKeys.Length && !oldKeys.Except(newKeys).Any()) return;
+            Remove(id);
+        }
+
+        // Stored before the id goes into any set, since the sets' order reads it.
+        if (_ranks != null) _ranks[id] = rank;
+        foreach (var key in newKeys)
+        {
+            if (!_ids.TryGetValue(key, out var ids))
+            {
+                ids = new SortedSet<TId>(_order);
+                _ids[key] = ids;
+            }
+            ids.Add(id);
+        }
+        _keys[id] = newKeys;
+    }
+
+    public void Remove(TId id)
+    {
+        if (!_keys.Remove(id, out var oldKeys)) return;
+        foreach (var key in oldKeys)
+        {
+            var ids = _ids[key];
+            ids.Remove(id);
+            if (ids.Count == 0) _ids.Remove(key);
+        }
+        _ranks?.Remove(id);
+    }
+
+    public void Clear()
+    {
+        _ids.Clear();
+        _keys.Clear();
+        _ranks?.Clear();
+    }
+}
@@ -0,0 +1,124 @@
+using System;
+using System.Collections;
+using System.Collections.Generic;
+namespace HelpersV2;
+
+// Sorted, duplicate-free keys kept in blocks of at most MaxBlock, with the position each
+// block starts at. Inserting or removing a key shifts one block and renumbers the block
+// starts, O(MaxBlock + n / MaxBlock), instead of moving every key behind it as a single
+// list would; reading by position is a binary search over the block starts.
+public class SortedKeyList<TKey> : IReadOnlyList<TKey>
+{
+    private const int MaxBlock = 512;
+
+    private readonly IComparer<TKey> _comparer = Comparer<TKey>.Default;
+    private readonly List<List<TKey>> _blocks = new List<List<TKey>>();
+    private readonly List<int> _starts = new List<int>();
+
+    public SortedKeyList()
+    {
+    }
+
+    public SortedKeyList(IEnumerable<TKey> keys)
+    {
+        var sorted = new List<TKey>(keys);
+        sorted.Sort(_comparer);
+        for (var i = 0; i < sorted.Count; i += MaxBlock / 2)
+        {
+            _starts.Add(i);
+            _blocks.Add(sorted.GetRange(i, Math.Min(MaxBlock / 2, sorted.Count - i)));
+        }
+        Count = sorted.Count;
+    }
+
+    public int Count { get; private set; }
+
+    public TKey this[int index]
+    {
+        get
+        {
+            if (index < 0 || index >= Count) throw new ArgumentOutOfRangeException(nameof(index));
+            var block = _starts.BinarySearch(index);
+            if (block < 0) block = ~block - 1;
+            return _blocks[block][index - _starts[block]];
+        }
+    }
+
+    // False when the key is already there.
+    public bool Add(TKey key)
+    {
+        if (_blocks.Count == 0)
+        {
+            _blocks.Add(new List<TKey> { key });
+            _starts.Add(0);
+            Count = 1;
+            return true;
+        }
+
+        var block = BlockFor(key);
+        var keys = _blocks[block];
+        var index = keys.BinarySearch(key, _comparer);
+        if (index >= 0) return false;
+
+        keys.Insert(~index, key);
+        Count++;
+        Renumber(block + 1, 1);
+        if (keys.Count > MaxBlock)
+        {
+            var half = keys.Count / 2;
+            _blocks.Insert(block + 1, keys.GetRange(half, keys.Count - half));
+            _starts.Insert(block + 1, _starts[block] + half);
+            keys.RemoveRange(half, keys.Count - half);
+        }
+        return true;
+    }
+
+    // False when the key is not there.
+    public bool Remove(TKey key)
+    {
+        if (_blocks.Count == 0) return false;
+
+        var block = BlockFor(key);
+        var keys = _blocks[block];
+        var index = keys.BinarySearch(key, _comparer);
+        if (index < 0) return false;
+
+        keys.RemoveAt(index);
+        Count--;
+        Renumber(block + 1, -1);
+        if (keys.Count == 0)
+        {
+            _blocks.RemoveAt(block);
+            _starts.RemoveAt(block);
+        }
+        return true;
+    }
+
+    public IEnumerator<TKey> GetEnumerator()
+    {
+        foreach (var keys in _blocks)
+        {
+            foreach (var key in keys) yield return key;
+        }
+    }
+
+    IEnumerator IEnumerable.GetEnumerator() => GetEnumerator();
+
+    // The last block whose first key is not after the key, or the first block.
+    private int BlockFor(TKey key)
+    {
+        int low = 0, high = _blocks.Count - 1;
+        while (low < high)
+        {
+            var middle = low + (high - low + 1) / 2;
+            if (_comparer.Compare(_blocks[middle][0], key) <= 0) low = middle;
+            else high = middle - 1;
+        }
+        return low;
+    }
+
+    private void Renumber(int fromBlock, int delta)
+    {
+        for (var i = fromBlock; i < _starts.Count; i++) _starts[i] += delta;
+    }
+}
@@ -0,0 +1,28 @@
+using System;
+using System.Globalization;
+namespace HelpersV2;
+
+// The pools keep timestamps as the strings they were written with; indexes and date
+// filters work on them as UTC ticks. Values without an offset are taken as UTC, which is
+// how Base.GetTimestamp writes them.
+public static class Timestamps
+{
+    public static long? Parse(string? text)
+    {
+        if (string.IsNullOrWhiteSpace(text)) return null;
+        return DateTime.TryParse(text, CultureInfo.InvariantCulture, DateTimeStyles.AdjustToUniversal | DateTimeStyles.AssumeUniversal, out var value)
+            ? value.Ticks
+            : null;
+    }
+
+    // For from/to query parameters: a missing bound is open, a malformed one is rejected.
+    // Both bounds are inclusive, so an upper bound given as a plain date (to=2024-11-14)
+    // covers that whole day, up to its last tick, instead of stopping at its midnight.
+    public static long? ParseBound(string? text, string name, bool upper = false)
+    {
+        if (string.IsNullOrEmpty(text)) return null;
+        var ticks = Parse(text) ?? throw new ArgumentException($"Invalid date for {name}.");
+        var dateOnly = DateTime.TryParseExact(text.Trim(), "yyyy-MM-dd", CultureInfo.InvariantCulture, DateTimeStyles.None, out _);
+        return upper && dateOnly ? ticks + TimeSpan.TicksPerDay - 1 : ticks;
+    }
+}
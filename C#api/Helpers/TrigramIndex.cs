@@ -0,0 +1,94 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+namespace HelpersV2;
+
+// Case-folded trigram index over one text field, for substring search. A record whose
+// text contains the query also contains every trigram of the query, so a lookup narrows
+// a search to the records that share them all; the caller still checks each candidate,
+// as sharing the trigrams does not guarantee the substring.
+public class TrigramIndex<TId>
+{
+    private static readonly long[] NoGrams = Array.Empty<long>();
+
+    private readonly Dictionary<long, HashSet<TId>> _ids = new Dictionary<long, HashSet<TId>>();
+    private readonly Dictionary<TId, long[]> _grams = new Dictionary<TId, long[]>();
+
+    // Null when the query is too short to have a trigram and so cannot narrow anything.
+    public IndexLookup<TId>? Lookup(string? text)
+    {
+        if (text == null || text.Length < 3) return null;
+
+        var postings = new List<HashSet<TId>>();
+        foreach (var gram in GramsOf(text))
+        {
+            if (!_ids.TryGetValue(gram, out var ids)) return new IndexLookup<TId>(0, () => Array.Empty<TId>());
+            postings.Add(ids);
+        }
+        postings.Sort((a, b) => a.Count.CompareTo(b.Count));
+
+        return new IndexLookup<TId>(postings[0].Count, () =>
+        {
+            var candidates = new List<TId>();
+            foreach (var id in postings[0])
+            {
+                if (postings.Skip(1).All(ids => ids.Contains(id))) candidates.Add(id);
+            }
+            candidates.Sort();
+            return candidates;
+        });
+    }
+
+    public void Set(TId id, string? text)
+    {
+        var newGrams = text == null ? NoGrams : GramsOf(text);
+        if (_grams.TryGetValue(id, out var oldGrams))
+        {
+            if (oldGrams.Length == newGrams.Length && !oldGrams.Except(newGrams).Any()) return;
+            Remove(id);
+        }
+        if (newGrams.Length == 0) return;
+
+        foreach (var gram in newGrams)
+        {
+            if (!_ids.TryGetValue(gram, out var ids))
+            {
+                ids = new HashSet<TId>();
+                _ids[gram] = ids;
+            }
+            ids.Add(id);
+        }
+        _grams[id] = newGrams;
+    }
+
+    public void Remove(TId id)
+    {
+        if (!_grams.Remove(id, out var oldGrams)) return;
+        foreach (var gram in oldGrams)
+        {
+            var ids = _ids[gram];
+            ids.Remove(id);
+            if (ids.Count == 0) _ids.Remove(gram);
+        }
+    }
+
+    public void Clear()
+    {
+        _ids.Clear();
+        _grams.Clear();
+    }
+
+    // Folds case the way OrdinalIgnoreCase does and packs each trigram into a long.
+    private static long[] GramsOf(string text)
+    {
+        if (text.Length < 3) return NoGrams;
+        var grams = new HashSet<long>();
+        for (int i = 0; i + 2 < text.Length; i++)
+        {
+            grams.Add((long)char.ToUpperInvariant(text[i]) << 32
+                | (long)char.ToUpperInvariant(text[i + 1]) << 16
+                | char.ToUpperInvariant(text[i + 2]));
+        }
+        return grams.ToArray();
+    }
+}
@@ -0,0 +1,6 @@
+namespace InterfacesV2;
+public interface IJournal
+{
+    string Name { get; }
+    void Flush();
+}
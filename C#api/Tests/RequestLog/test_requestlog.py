@@ -1,8 +1,8 @@
 import httpx
 import pytest
 import os
+import journal_data
 import time
-import json
 from datetime import datetime, timedelta, timezone
 
 BASE_URL = "http://localhost:3000/api/v2"
@@ -15,9 +15,7 @@ LOG_FILE_PATH = log_file_path.replace(os.sep, '/')
 data_root = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))), "data").replace(os.sep, "/")
 
 def GetJsonData(model):
-        with open(os.path.join(data_root, f"{model}.json"), 'r') as file:
-            data = json.load(file)
-        return data
+    return journal_data.GetJsonData(data_root, model)
 
 @pytest.fixture(scope="module")
 def client():
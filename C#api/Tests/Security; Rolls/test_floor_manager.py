@@ -1,7 +1,7 @@
 import httpx
 import unittest
-import json
 import os
+import journal_data
 
 class FloorManagerApiTests(unittest.TestCase):
     @classmethod
@@ -12,9 +12,7 @@ class FloorManagerApiTests(unittest.TestCase):
 
     @classmethod
     def GetJsonData(cls, model):
-        with open(os.path.join(cls.data_root, f"{model}.json"), 'r', encoding='utf-8') as file:
-            data = json.load(file)
-        return data
+        return journal_data.GetJsonData(cls.data_root, model)
 
     # 3 actions that they have the right to perform
         
@@ -81,5 +79,28 @@ class FloorManagerApiTests(unittest.TestCase):
         )
         self.assertTrue(check)
 
+    def test_GetLocationsPagesInIdOrder(self):
+        offset_ids = []
+        for page in [1, 2]:
+            response = self.client.get("locations", params={"page": page, "pageSize": 5})
+            self.assertEqual(response.status_code, 200)
+            offset_ids += [x["Id"] for x in response.json()["Items"]]
+        self.assertEqual(offset_ids, sorted(offset_ids))
+
+        first = self.client.get("locations", params={"pageSize": 5}).json()
+        second = self.client.get("locations", params={"pageSize": 5, "cursor": first["NextCursor"]}).json()
+        self.assertEqual([x["Id"] for x in first["Items"] + second["Items"]], offset_ids)
+
+    def test_GetLocationsWithFields(self):
+        response = self.client.get("locations", params={"fields": "Id,Warehouse_Id"})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.json()["Items"], [])
+        for location in response.json()["Items"]:
+            self.assertEqual(set(location.keys()), {"Id", "Warehouse_Id"})
+            self.assertIn(location["Warehouse_Id"], [7, 8, 9])
+
+        response = self.client.get("locations", params={"fields": "Id,Colour"})
+        self.assertEqual(response.status_code, 400)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
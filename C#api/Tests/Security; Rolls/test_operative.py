@@ -1,7 +1,7 @@
 import httpx
 import unittest
-import json
 import os
+import journal_data
 
 class OperativeApiTests(unittest.TestCase):
     @classmethod
@@ -12,9 +12,7 @@ class OperativeApiTests(unittest.TestCase):
 
     @classmethod
     def GetJsonData(cls, model):
-        with open(os.path.join(cls.data_root, f"{model}.json"), 'r', encoding='utf-8') as file:
-            data = json.load(file)
-        return data
+        return journal_data.GetJsonData(cls.data_root, model)
     # 3 actions that they have the right to perform
         
     def test_GetLocations(self):
@@ -1,7 +1,7 @@
 import httpx
 import unittest
-import json
 import os
+import journal_data
 import json
 
 class SupervisorApiTests(unittest.TestCase):
@@ -13,9 +13,7 @@ class SupervisorApiTests(unittest.TestCase):
 
     @classmethod
     def GetJsonData(cls, model):
-        with open(os.path.join(cls.data_root, f"{model}.json"), 'r', encoding='utf-8') as file:
-            data = json.load(file)
-        return data
+        return journal_data.GetJsonData(cls.data_root, model)
     # 3 actions that they have the right to perform
         
     def test_GetSingleOrder(self):
@@ -0,0 +1,199 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using Newtonsoft.Json;
+using Xunit;
+using ModelsV2;
+using HelpersV2;
+
+public class DataJournalTests : IDisposable
+{
+    private readonly string _root = Path.Combine(Path.GetTempPath(), "journal-" + Guid.NewGuid().ToString("N"));
+    private readonly string _snapshotPath;
+    private readonly string _journalPath;
+    private readonly string _metaPath;
+
+    public DataJournalTests()
+    {
+        Directory.CreateDirectory(_root);
+        _snapshotPath = Path.Combine(_root, "item_groups.json");
+        _journalPath = Path.Combine(_root, "item_groups.journal");
+        _metaPath = Path.Combine(_root, "item_groups.meta.json");
+        WriteSnapshot(new ItemGroup { Id = 1, Name = "Tools" }, new ItemGroup { Id = 2, Name = "Parts" });
+    }
+
+    public void Dispose()
+    {
+        Directory.Delete(_root, true);
+    }
+
+    private void WriteSnapshot(params ItemGroup[] groups)
+    {
+        File.WriteAllText(_snapshotPath, JsonConvert.SerializeObject(groups, Formatting.Indented));
+    }
+
+    private DataJournal<ItemGroup> NewJournal(List<ItemGroup> data)
+    {
+        return new DataJournal<ItemGroup>(_snapshotPath, x => x.Id.ToString(), () => data);
+    }
+
+    private DataJournal<ItemGroup> NewJournal(int poolSize)
+    {
+        var data = Enumerable.Range(1, poolSize).Select(id => new ItemGroup { Id = id }).ToList();
+        return NewJournal(data);
+    }
+
+    private List<ItemGroup> Reload()
+    {
+        return NewJournal(new List<ItemGroup>()).Load();
+    }
+
+    private int JournalLines()
+    {
+        return File.Exists(_journalPath) ? File.ReadAllLines(_journalPath).Count(line => line.Length > 0) : 0;
+    }
+
+    [Fact]
+    public void Load_ReplaysAddReplaceAndRemove()
+    {
+        // Arrange
+        var journal = NewJournal(new List<ItemGroup>());
+        journal.Add(new ItemGroup { Id = 3, Name = "Bolts" });
+        journal.Replace(new ItemGroup { Id = 1, Name = "Hand tools" });
+        journal.Remove(new ItemGroup { Id = 2 });
+        journal.Flush();
+
+        // Act
+        var reloaded = Reload();
+
+        // Assert
+        Assert.Equal(new int?[] { 1, 3 }, reloaded.Select(x => x.Id));
+        Assert.Equal("Hand tools", reloaded[0].Name);
+        Assert.Equal("Bolts", reloaded[1].Name);
+        Assert.Equal(3, JournalLines());
+    }
+
+    [Fact]
+    public void Flush_RepeatedWritesToOneKey_AppendOneLine()
+    {
+        // Arrange
+        var journal = NewJournal(new List<ItemGroup>());
+
+        // Act
+        journal.Add(new ItemGroup { Id = 3, Name = "Bolts" });
+        journal.Replace(new ItemGroup { Id = 3, Name = "Nuts" });
+        journal.Flush();
+
+        // Assert
+        Assert.Equal(1, JournalLines());
+        Assert.Equal("Nuts", Reload().Single(x => x.Id == 3).Name);
+    }
+
+    [Fact]
+    public void Load_TornLastLine_KeepsEverythingBeforeIt()
+    {
+        // Arrange
+        var journal = NewJournal(new List<ItemGroup>());
+        journal.Remove(new ItemGroup { Id = 1 });
+        journal.Flush();
+        File.AppendAllText(_journalPath, "{\"Op\":\"add\",\"Key\":\"3\",\"Rec");
+
+        // Act
+        var reloaded = Reload();
+
+        // Assert
+        Assert.Equal(new int?[] { 2 }, reloaded.Select(x => x.Id));
+    }
+
+    [Fact]
+    public void Flush_BelowTheMinimum_OnlyAppends()
+    {
+        // Arrange
+        var journal = NewJournal(poolSize: 10);
+        for (int id = 3; id < 1002; id++) journal.Add(new ItemGroup { Id = id });
+
+        // Act
+        journal.Flush();
+
+        // Assert
+        Assert.Equal(999, JournalLines());
+        Assert.Equal(2, JsonConvert.DeserializeObject<List<ItemGroup>>(File.ReadAllText(_snapshotPath))!.Count);
+    }
+
+    [Fact]
+    public void Flush_ReachingTheMinimum_CompactsIntoTheSnapshot()
+    {
+        // Arrange
+        var journal = NewJournal(poolSize: 10);
+        for (int id = 3; id < 1002; id++) journal.Add(new ItemGroup { Id = id });
+        journal.Flush();
+
+        // Act
+        journal.Remove(new ItemGroup { Id = 1 });
+        journal.Flush();
+
+        // Assert
+        Assert.Equal(0, JournalLines());
+        var snapshot = JsonConvert.DeserializeObject<List<ItemGroup>>(File.ReadAllText(_snapshotPath))!;
+        Assert.Equal(1000, snapshot.Count);
+        Assert.Equal(2, snapshot[0].Id);
+        Assert.Equal(1000, Reload().Count);
+    }
+
+    [Fact]
+    public void Flush_LargePool_WaitsForAQuarterOfItsSize()
+    {
+        // Arrange
+        var journal = NewJournal(poolSize: 8000);
+        for (int id = 3; id < 1503; id++) journal.Add(new ItemGroup { Id = id });
+
+        // Act
+        journal.Flush();
+        var linesBefore = JournalLines();
+        for (int id = 1503; id < 2003; id++) journal.Add(new ItemGroup { Id = id });
+        journal.Flush();
+
+        // Assert
+        Assert.Equal(1500, linesBefore);
+        Assert.Equal(0, JournalLines());
+        Assert.Equal(2002, Reload().Count);
+    }
+
+    [Fact]
+    public void Flush_AfterAllocatingIds_PersistsNextId()
+    {
+        // Arrange
+        var journal = NewJournal(new List<ItemGroup>());
+        journal.Sequence.Seed(3);
+        var id = journal.Sequence.Next();
+        journal.Add(new ItemGroup { Id = id });
+
+        // Act
+        journal.Flush();
+        var reloaded = NewJournal(new List<ItemGroup>());
+        reloaded.Load();
+
+        // Assert
+        Assert.Equal(4, JsonConvert.DeserializeObject<JournalMeta>(File.ReadAllText(_metaPath))!.NextId);
+        Assert.Equal(4, reloaded.Sequence.Peek);
+    }
+
+    [Fact]
+    public void Flush_WithoutNewIds_DoesNotRewriteMeta()
+    {
+        // Arrange
+        var journal = NewJournal(new List<ItemGroup>());
+        journal.Sequence.Observe(2);
+        journal.Replace(new ItemGroup { Id = 1, Name = "Hand tools" });
+        journal.Flush();
+        File.Delete(_metaPath);
+
+        // Act
+        journal.Replace(new ItemGroup { Id = 2, Name = "Spare parts" });
+        journal.Flush();
+
+        // Assert
+        Assert.False(File.Exists(_metaPath));
+    }
+}
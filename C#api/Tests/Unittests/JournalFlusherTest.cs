@@ -0,0 +1,117 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Threading;
+using Xunit;
+using ModelsV2;
+using HelpersV2;
+
+public class JournalFlusherTests : IDisposable
+{
+    private readonly string _root = Path.Combine(Path.GetTempPath(), "flusher-" + Guid.NewGuid().ToString("N"));
+    private readonly string _snapshotPath;
+
+    public JournalFlusherTests()
+    {
+        Directory.CreateDirectory(_root);
+        _snapshotPath = Path.Combine(_root, "item_groups.json");
+        File.WriteAllText(_snapshotPath, "[]");
+    }
+
+    public void Dispose()
+    {
+        Directory.Delete(_root, true);
+    }
+
+    private DataJournal<ItemGroup> NewJournal(List<ItemGroup> data)
+    {
+        return new DataJournal<ItemGroup>(_snapshotPath, x => x.Id.ToString(), () => data);
+    }
+
+    private List<ItemGroup> Reload()
+    {
+        var reloaded = new List<ItemGroup>();
+        return NewJournal(reloaded).Load();
+    }
+
+    [Fact]
+    public void Stop_FlushesPendingCommits_BeforeReturning()
+    {
+        // Arrange
+        var data = new List<ItemGroup>();
+        var journal = NewJournal(data);
+        var flusher = new JournalFlusher(flushIntervalMs: 60000, flushBatchSize: 100);
+        var group = new ItemGroup { Id = 1, Name = "Tools" };
+        data.Add(group);
+
+        // Act
+        journal.Add(group);
+        flusher.Commit(journal);
+        var beforeStop = Reload();
+        flusher.Stop();
+
+        // Assert
+        Assert.Empty(beforeStop);
+        var reloaded = Assert.Single(Reload());
+        Assert.Equal(1, reloaded.Id);
+        Assert.Equal("Tools", reloaded.Name);
+    }
+
+    [Fact]
+    public void Commit_InDurableMode_ReturnsOnlyOnceWritten()
+    {
+        // Arrange
+        var data = new List<ItemGroup>();
+        var journal = NewJournal(data);
+        var flusher = new JournalFlusher(flushIntervalMs: 60000, flushBatchSize: 100, durableWrites: true);
+
+        // Act
+        journal.Add(new ItemGroup { Id = 1, Name = "Tools" });
+        flusher.Commit(journal);
+        var reloaded = Reload();
+        flusher.Stop();
+
+        // Assert
+        Assert.Equal(1, Assert.Single(reloaded).Id);
+    }
+
+    [Fact]
+    public void Commit_ReachingBatchSize_FlushesBeforeTheInterval()
+    {
+        // Arrange
+        var data = new List<ItemGroup>();
+        var journal = NewJournal(data);
+        var flusher = new JournalFlusher(flushIntervalMs: 60000, flushBatchSize: 2);
+
+        // Act
+        journal.Add(new ItemGroup { Id = 1, Name = "Tools" });
+        flusher.Commit(journal);
+        journal.Add(new ItemGroup { Id = 2, Name = "Parts" });
+        flusher.Commit(journal);
+        var deadline = DateTime.UtcNow.AddSeconds(10);
+        while (Reload().Count < 2 && DateTime.UtcNow < deadline) Thread.Sleep(20);
+        var reloaded = Reload();
+        flusher.Stop();
+
+        // Assert
+        Assert.Equal(new int?[] { 1, 2 }, reloaded.Select(x => x.Id).OrderBy(x => x));
+    }
+
+    [Fact]
+    public void Flush_WritesTheStateAtStagingTime_NotLaterInPlaceChanges()
+    {
+        // Arrange
+        var data = new List<ItemGroup>();
+        var journal = NewJournal(data);
+        var group = new ItemGroup { Id = 1, Name = "Tools" };
+
+        // Act
+        journal.Add(group);
+        group.Name = "Changed without staging";
+        journal.Flush();
+
+        // Assert
+        Assert.Equal("Tools", Assert.Single(Reload()).Name);
+    }
+}
@@ -0,0 +1,17 @@
+using ModelsV2;
+using HelpersV2;
+
+// Locations are the stand-in record for the index and query tests.
+internal static class LocationFixtures
+{
+    public static Location NewLocation(int? id, int warehouseId, string row = "A", int rack = 1, int shelf = 0)
+    {
+        return new Location { Id = id, Warehouse_Id = warehouseId, Code = $"{row}.{rack}.{shelf}", Name = $"Row: {row}, Rack: {rack}, Shelf: {shelf}" };
+    }
+
+    // Keyed by id and still empty, so tests can add their indexes before loading.
+    public static RecordIndex<int?, Location> NewRecords()
+    {
+        return new RecordIndex<int?, Location>(x => x.Id);
+    }
+}
@@ -0,0 +1,78 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Xunit;
+using HelpersV2;
+
+public class PaginationHelperTests
+{
+    private static readonly List<int> Keys = Enumerable.Range(1, 25).ToList();
+
+    [Theory]
+    [InlineData(1, 0)]
+    [InlineData(1, -3)]
+    [InlineData(0, 10)]
+    [InlineData(-1, 10)]
+    public void EveryPaginateMethod_RejectsAPageOrPageSizeBelowOne(int page, int pageSize)
+    {
+        Assert.Throws<ArgumentException>(() => PaginationHelper.Paginate(Keys, page, pageSize));
+        Assert.Throws<ArgumentException>(() => PaginationHelper.Paginate(Keys, key => key, page, pageSize));
+        Assert.Throws<ArgumentException>(() => PaginationHelper.PaginateMatches(Keys, key => key, page, pageSize));
+        Assert.Throws<ArgumentException>(() => PaginationHelper.PaginateAfter(Keys, key => key, null, page, pageSize));
+        Assert.Throws<ArgumentException>(() => PaginationHelper.PaginateInOrder(Keys, key => key, page, pageSize));
+    }
+
+    [Fact]
+    public void Paginate_Keys_ReturnsThePageAndACursorToTheNext()
+    {
+        // Act
+        var first = PaginationHelper.Paginate(Keys, key => key, 1, 10);
+        var second = PaginationHelper.Paginate(Keys, key => key, 1, 10, cursor: first.NextCursor);
+        var last = PaginationHelper.Paginate(Keys, key => key, 3, 10);
+
+        // Assert
+        Assert.Equal(Enumerable.Range(1, 10), first.Items);
+        Assert.Equal(Enumerable.Range(11, 10), second.Items);
+        Assert.Equal(Enumerable.Range(21, 5), last.Items);
+        Assert.Null(last.NextCursor);
+        Assert.Equal(25, last.TotalCount);
+    }
+
+    [Fact]
+    public void PaginateMatches_ExactlyOnePage_HasNoNextCursor()
+    {
+        // Act
+        var page = PaginationHelper.PaginateMatches(Keys.Take(10), key => key, 1, 10);
+
+        // Assert
+        Assert.Equal(10, page.Items.Count);
+        Assert.Null(page.NextCursor);
+    }
+
+    [Fact]
+    public void PaginateAfter_Descending_ContinuesBelowTheCursor()
+    {
+        // Act
+        var first = PaginationHelper.PaginateAfter(Keys, key => key, null, 1, 5, descending: true);
+        var second = PaginationHelper.PaginateAfter(Keys, key => key, first.NextCursor, 1, 5, descending: true);
+
+        // Assert
+        Assert.Equal(new[] { 25, 24, 23, 22, 21 }, first.Items);
+        Assert.Equal(new[] { 20, 19, 18, 17, 16 }, second.Items);
+    }
+
+    [Fact]
+    public void PaginateInOrder_KeepsTheOrderOfTheKeys()
+    {
+        // Arrange
+        var keys = new List<int> { 7, 3, 9, 1, 5 };
+
+        // Act
+        var page = PaginationHelper.PaginateInOrder(keys, key => key * 10, 2, 2);
+
+        // Assert
+        Assert.Equal(5, page.TotalCount);
+        Assert.Equal(new[] { 90, 10 }, page.Items);
+        Assert.Null(page.NextCursor);
+    }
+}
@@ -0,0 +1,58 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Xunit;
+using HelpersV2;
+
+public class PrefixIndexTests
+{
+    private static PrefixIndex<int> NewIndex()
+    {
+        var index = new PrefixIndex<int>();
+        index.Set(5, "abc-100");
+        index.Set(1, "ABC-200");
+        index.Set(3, "ABD-100");
+        index.Set(2, "abc-100");
+        index.Set(4, null);
+        return index;
+    }
+
+    [Fact]
+    public void Get_MatchesTheWholeValueIgnoringCase()
+    {
+        // Act
+        var lookup = NewIndex().Lookup("ABC-100");
+
+        // Assert
+        Assert.Equal(2, lookup.Estimate);
+        Assert.Equal(new[] { 2, 5 }, lookup.Candidates());
+        Assert.Empty(NewIndex().Get("ABC"));
+        Assert.Empty(NewIndex().Get(null));
+    }
+
+    [Theory]
+    [InlineData("abc", new[] { 1, 2, 5 })]
+    [InlineData("AB", new[] { 1, 2, 3, 5 })]
+    [InlineData("abd-1", new[] { 3 })]
+    [InlineData("abe", new int[0])]
+    [InlineData("zzz", new int[0])]
+    public void StartingWith_ReturnsThePrefixRangeInKeyOrder(string prefix, int[] expected)
+    {
+        Assert.Equal(expected, NewIndex().StartingWith(prefix));
+    }
+
+    [Fact]
+    public void SetAndRemove_MoveTheRecordBetweenValues()
+    {
+        // Arrange
+        var index = NewIndex();
+
+        // Act
+        index.Set(5, "ABD-300");
+        index.Remove(3);
+
+        // Assert
+        Assert.Equal(new[] { 2 }, index.Get("abc-100"));
+        Assert.Equal(new[] { 5 }, index.StartingWith("abd"));
+    }
+}
@@ -0,0 +1,65 @@
+using System;
+using System.Collections.Generic;
+using System.Text.Json;
+using Xunit;
+using ModelsV2;
+using HelpersV2;
+
+public class ProjectionTests
+{
+    private static readonly Location Location = new Location { Id = 7, Warehouse_Id = 3, Code = "A.1.0", Name = "Row: A, Rack: 1, Shelf: 0" };
+
+    [Fact]
+    public void For_NoFields_ReturnsNull()
+    {
+        Assert.Null(Projection<Location>.For(null));
+        Assert.Null(Projection<Location>.For(" "));
+    }
+
+    [Fact]
+    public void For_UnknownField_Throws()
+    {
+        Assert.Throws<ArgumentException>(() => Projection<Location>.For("Id,Colour"));
+    }
+
+    [Fact]
+    public void For_SameFieldsInAnotherOrder_ReturnsTheCachedProjection()
+    {
+        // Act
+        var first = Projection<Location>.For("Code,id");
+        var second = Projection<Location>.For(" ID , code ,Code");
+
+        // Assert
+        Assert.Same(first, second);
+    }
+
+    [Fact]
+    public void Write_OnlyTheChosenFields_InDeclarationOrder()
+    {
+        // Arrange
+        var projection = Projection<Location>.For("code,warehouse_id,id")!;
+
+        // Act
+        var json = JsonSerializer.Serialize(new Projected<Location>(Location, projection));
+
+        // Assert
+        Assert.Equal("{\"Id\":7,\"Warehouse_Id\":3,\"Code\":\"A.1.0\"}", json);
+    }
+
+    [Fact]
+    public void Apply_KeepsThePageMetadata()
+    {
+        // Arrange
+        var projection = Projection<Location>.For("Name")!;
+        var page = new PaginatedResponse<Location> { TotalCount = 12, Page = 2, PageSize = 1, Items = new List<Location> { Location }, NextCursor = "abc" };
+
+        // Act
+        var projected = projection.Apply(page);
+
+        // Assert
+        Assert.Equal(12, projected.TotalCount);
+        Assert.Equal(2, projected.Page);
+        Assert.Equal("abc", projected.NextCursor);
+        Assert.Equal("[{\"Name\":\"Row: A, Rack: 1, Shelf: 0\"}]", JsonSerializer.Serialize(projected.Items));
+    }
+}
@@ -0,0 +1,87 @@
+using System;
+using Xunit;
+using HelpersV2;
+
+public class RangeIndexTests
+{
+    private static RangeIndex<int> NewIndex()
+    {
+        var index = new RangeIndex<int>();
+        index.Set(1, 100);
+        index.Set(2, 200);
+        index.Set(3, 200);
+        index.Set(4, 300);
+        return index;
+    }
+
+    [Fact]
+    public void Between_IncludesBothEnds_InKeyOrder()
+    {
+        // Arrange
+        var index = NewIndex();
+
+        // Act
+        var matches = index.Between(200, 300);
+
+        // Assert
+        Assert.Equal(new[] { 2, 3, 4 }, matches);
+    }
+
+    [Fact]
+    public void Between_OpenEnds_CoverEverything()
+    {
+        // Arrange
+        var index = NewIndex();
+
+        // Act
+        var below = index.Between(null, 150);
+        var all = index.Between(null, null);
+
+        // Assert
+        Assert.Equal(new[] { 1 }, below);
+        Assert.Equal(new[] { 1, 2, 3, 4 }, all);
+    }
+
+    [Fact]
+    public void Set_NewValue_MovesTheId()
+    {
+        // Arrange
+        var index = NewIndex();
+
+        // Act
+        index.Set(2, 50);
+
+        // Assert
+        Assert.Equal(new[] { 2 }, index.Between(null, 60));
+        Assert.Equal(new[] { 3 }, index.Between(200, 200));
+        Assert.True(index.IsBetween(2, null, 50));
+        Assert.False(index.IsBetween(2, 100, null));
+    }
+
+    [Fact]
+    public void Set_NullValue_UnindexesTheId()
+    {
+        // Arrange
+        var index = NewIndex();
+
+        // Act
+        index.Set(4, null);
+
+        // Assert
+        Assert.Equal(new[] { 1, 2, 3 }, index.Between(null, null));
+        Assert.False(index.IsBetween(4, null, null));
+    }
+
+    [Fact]
+    public void Remove_LeavesOtherIdsWithTheSameValue()
+    {
+        // Arrange
+        var index = NewIndex();
+
+        // Act
+        index.Remove(2);
+
+        // Assert
+        Assert.Equal(new[] { 3 }, index.Between(200, 200));
+    }
+}
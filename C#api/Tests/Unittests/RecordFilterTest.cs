@@ -0,0 +1,115 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Xunit;
+using ModelsV2;
+using HelpersV2;
+
+public class RecordFilterTests
+{
+    private readonly RecordIndex<int?, Location> _records = new RecordIndex<int?, Location>(x => x.Id);
+    private readonly RecordFilter<int?, Location> _indexed;
+    private readonly RecordFilter<int?, Location> _unindexed;
+
+    public RecordFilterTests()
+    {
+        var byWarehouse = _records.AddIndex(x => x.Warehouse_Id);
+        var byCode = _records.AddPrefixIndex(x => x.Code);
+        var byCreatedAt = _records.AddRangeIndex(x => Timestamps.Parse(x.Created_At));
+        _records.Load(Enumerable.Range(1, 30).Select(id => new Location
+        {
+            Id = id,
+            Warehouse_Id = id % 4,
+            Code = $"{(char)('A' + id % 3)}.{id}.0",
+            Name = $"Row: {(char)('A' + id % 3)}, Rack: {id}, Shelf: 0",
+            Created_At = new DateTime(2020, 1, id % 28 + 1).ToString("yyyy-MM-dd HH:mm:ss")
+        }).ToList());
+
+        _indexed = new RecordFilter<int?, Location>(_records)
+            .Index("Warehouse_Id", byWarehouse)
+            .Index("Code", byCode)
+            .Index("Created_At", byCreatedAt);
+        _unindexed = new RecordFilter<int?, Location>(_records);
+    }
+
+    private static List<int?> Ids(PaginatedResponse<Location> page) => page.Items.Select(x => x.Id).ToList();
+
+    [Theory]
+    [InlineData("Warehouse_Id:eq:2")]
+    [InlineData("Warehouse_Id:in:1|3;Name:contains:row: b")]
+    [InlineData("Code:eq:C.5.0")]
+    [InlineData("Created_At:between:2020-01-05..2020-01-10;Warehouse_Id:ne:0")]
+    [InlineData("Created_At:gt:2020-01-20 00:00:00")]
+    public void Page_WithIndexes_MatchesAFullScan(string filter)
+    {
+        // Act
+        var indexed = _indexed.Page(filter, null, 1, 100);
+        var scanned = _unindexed.Page(filter, null, 1, 100);
+
+        // Assert
+        Assert.NotEmpty(scanned.Items);
+        Assert.Equal(Ids(scanned), Ids(indexed));
+        Assert.Equal(scanned.TotalCount, indexed.TotalCount);
+    }
+
+    [Fact]
+    public void Page_WithSort_OrdersByTheFieldsThenByKey()
+    {
+        // Act
+        var page = _indexed.Page("Warehouse_Id:in:1|2", "-Warehouse_Id,Code", 1, 100);
+
+        // Assert
+        var expected = _records.InKeyOrder
+            .Where(x => x.Warehouse_Id == 1 || x.Warehouse_Id == 2)
+            .OrderByDescending(x => x.Warehouse_Id)
+            .ThenBy(x => x.Code, StringComparer.Ordinal)
+            .ThenBy(x => x.Id)
+            .Select(x => x.Id);
+        Assert.Equal(expected, Ids(page));
+    }
+
+    [Fact]
+    public void Page_AfterAnUpdate_SeesTheNewValue()
+    {
+        // Arrange
+        var location = _records.Get(1)!;
+        location.Warehouse_Id = 99;
+        _records.Refresh(location);
+
+        // Act
+        var page = _indexed.Page("Warehouse_Id:eq:99", null, 1, 100);
+
+        // Assert
+        Assert.Equal(new int?[] { 1 }, Ids(page));
+    }
+
+    [Theory]
+    [InlineData("Created_At:le:2020-01-02")]
+    [InlineData("Created_At:between:2020-01-02..2020-01-02")]
+    public void Page_DateOnlyUpperBound_CoversTheWholeDay(string filter)
+    {
+        // Arrange
+        var location = _records.Get(1)!;
+        location.Created_At = "2020-01-02 15:30:00";
+        _records.Refresh(location);
+
+        // Act
+        var indexed = _indexed.Page(filter, null, 1, 100);
+        var scanned = _unindexed.Page(filter, null, 1, 100);
+
+        // Assert
+        Assert.Contains(1, Ids(indexed));
+        Assert.Equal(Ids(scanned), Ids(indexed));
+    }
+
+    [Theory]
+    [InlineData("Warehouse_Id")]
+    [InlineData("Unknown_Field:eq:1")]
+    [InlineData("Warehouse_Id:like:1")]
+    [InlineData("Warehouse_Id:contains:1")]
+    [InlineData("Warehouse_Id:eq:one")]
+    public void Page_InvalidFilter_Throws(string filter)
+    {
+        Assert.Throws<ArgumentException>(() => _indexed.Page(filter, null, 1, 10));
+    }
+}
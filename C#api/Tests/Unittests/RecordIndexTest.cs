@@ -0,0 +1,244 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading.Tasks;
+using Xunit;
+using ModelsV2;
+using HelpersV2;
+using static LocationFixtures;
+
+public class RecordIndexTests
+{
+    private static (RecordIndex<int?, Location> Records, List<Location> Data, SecondaryIndex<int, int?> ByWarehouse) NewIndex(params Location[] locations)
+    {
+        var records = NewRecords();
+        var byWarehouse = records.AddIndex(x => x.Warehouse_Id);
+        var data = locations.ToList();
+        records.Load(data);
+        return (records, data, byWarehouse);
+    }
+
+    [Fact]
+    public void Add_NewKey_IsIndexedEverywhere()
+    {
+        // Arrange
+        var (records, data, byWarehouse) = NewIndex(NewLocation(1, 10));
+        var location = NewLocation(2, 20);
+
+        // Act
+        var added = records.Add(location);
+
+        // Assert
+        Assert.True(added);
+        Assert.Same(location, records.Get(2));
+        Assert.Equal(1, records.IndexOf(2));
+        Assert.Same(location, data[1]);
+        Assert.Equal(new int?[] { 2 }, byWarehouse.Get(20));
+    }
+
+    [Fact]
+    public void Add_DuplicateKey_IsRejectedWithoutTouchingTheList()
+    {
+        // Arrange
+        var original = NewLocation(1, 10);
+        var (records, data, byWarehouse) = NewIndex(original);
+
+        // Act
+        var added = records.Add(NewLocation(1, 20));
+
+        // Assert
+        Assert.False(added);
+        Assert.Single(data);
+        Assert.Same(original, records.Get(1));
+        Assert.Equal(new int?[] { 1 }, records.Keys);
+        Assert.Empty(byWarehouse.Get(20));
+    }
+
+    [Fact]
+    public void Add_NullKey_IsRejected()
+    {
+        // Arrange
+        var (records, data, _) = NewIndex();
+
+        // Act
+        var added = records.Add(NewLocation(null, 10));
+
+        // Assert
+        Assert.False(added);
+        Assert.Empty(data);
+        Assert.Empty(records.Keys);
+    }
+
+    [Fact]
+    public void Keys_StayInAscendingOrder_AfterOutOfOrderAdds()
+    {
+        // Arrange
+        var (records, _, _) = NewIndex(NewLocation(5, 10));
+
+        // Act
+        records.Add(NewLocation(2, 10));
+        records.Add(NewLocation(9, 10));
+        records.Add(NewLocation(7, 10));
+
+        // Assert
+        Assert.Equal(new int?[] { 2, 5, 7, 9 }, records.Keys);
+        Assert.Equal(new int?[] { 2, 5, 7, 9 }, records.InKeyOrder.Select(x => x.Id));
+    }
+
+    [Fact]
+    public void Load_DuplicateKeys_KeepsTheFirstRecord()
+    {
+        // Arrange
+        var first = NewLocation(1, 10);
+
+        // Act
+        var (records, _, byWarehouse) = NewIndex(first, NewLocation(1, 20));
+
+        // Assert
+        Assert.Same(first, records.Get(1));
+        Assert.Equal(0, records.IndexOf(1));
+        Assert.Single(records.Keys);
+        Assert.Empty(byWarehouse.Get(20));
+    }
+
+    [Fact]
+    public void Replace_MovesTheRecordBetweenSecondaryKeys()
+    {
+        // Arrange
+        var (records, data, byWarehouse) = NewIndex(NewLocation(1, 10), NewLocation(2, 10));
+        var replacement = NewLocation(2, 30);
+
+        // Act
+        records.Replace(records.IndexOf(2), replacement);
+
+        // Assert
+        Assert.Same(replacement, records.Get(2));
+        Assert.Same(replacement, data[1]);
+        Assert.Equal(new int?[] { 1 }, byWarehouse.Get(10));
+        Assert.Equal(new int?[] { 2 }, byWarehouse.Get(30));
+    }
+
+    [Fact]
+    public void Refresh_ReindexesAnInPlaceChange()
+    {
+        // Arrange
+        var location = NewLocation(1, 10);
+        var (records, _, byWarehouse) = NewIndex(location);
+
+        // Act
+        location.Warehouse_Id = 40;
+        records.Refresh(location);
+
+        // Assert
+        Assert.False(byWarehouse.Any(10));
+        Assert.Equal(new int?[] { 1 }, byWarehouse.Get(40));
+    }
+
+    [Fact]
+    public void Refresh_StaleCopy_IsIgnored()
+    {
+        // Arrange
+        var (records, _, byWarehouse) = NewIndex(NewLocation(1, 10));
+
+        // Act
+        records.Refresh(NewLocation(1, 50));
+
+        // Assert
+        Assert.Equal(new int?[] { 1 }, byWarehouse.Get(10));
+        Assert.False(byWarehouse.Any(50));
+    }
+
+    [Fact]
+    public void Remove_MovesTheLastRecordIntoTheHole()
+    {
+        // Arrange
+        var last = NewLocation(3, 30);
+        var (records, data, byWarehouse) = NewIndex(NewLocation(1, 10), NewLocation(2, 20), last);
+
+        // Act
+        var removed = records.Remove(records.Get(1)!);
+
+        // Assert
+        Assert.True(removed);
+        Assert.Equal(2, data.Count);
+        Assert.Same(last, data[0]);
+        Assert.Equal(0, records.IndexOf(3));
+        Assert.Equal(1, records.IndexOf(2));
+        Assert.Equal(-1, records.IndexOf(1));
+        Assert.Equal(new int?[] { 2, 3 }, records.Keys);
+        Assert.Equal(new int?[] { 2, 3 }, records.InKeyOrder.Select(x => x.Id));
+        Assert.False(byWarehouse.Any(10));
+    }
+
+    [Fact]
+    public void Remove_LastRecord_LeavesTheOthersInPlace()
+    {
+        // Arrange
+        var (records, data, _) = NewIndex(NewLocation(1, 10), NewLocation(2, 20));
+
+        // Act
+        var removed = records.Remove(records.Get(2)!);
+
+        // Assert
+        Assert.True(removed);
+        Assert.Single(data);
+        Assert.Equal(0, records.IndexOf(1));
+        Assert.Equal(new int?[] { 1 }, records.Keys);
+    }
+
+    [Fact]
+    public void Remove_StaleCopy_IsRejected()
+    {
+        // Arrange
+        var (records, data, _) = NewIndex(NewLocation(1, 10));
+
+        // Act
+        var removed = records.Remove(NewLocation(1, 10));
+
+        // Assert
+        Assert.False(removed);
+        Assert.Single(data);
+        Assert.NotNull(records.Get(1));
+    }
+
+    [Fact]
+    public void Remove_ManyInAnyOrder_KeepsPositionsConsistent()
+    {
+        // Arrange
+        var (records, data, byWarehouse) = NewIndex(Enumerable.Range(1, 20).Select(id => NewLocation(id, id % 3)).ToArray());
+
+        // Act
+        foreach (var id in new[] { 4, 20, 1, 13, 7, 8, 19 }) records.Remove(records.Get(id)!);
+
+        // Assert
+        Assert.Equal(13, data.Count);
+        for (int i = 0; i < data.Count; i++) Assert.Equal(i, records.IndexOf(data[i].Id));
+        Assert.Equal(data.Select(x => x.Id).OrderBy(id => id), records.Keys);
+        Assert.Equal(data.Where(x => x.Warehouse_Id == 1).Select(x => x.Id).OrderBy(id => id), byWarehouse.Get(1));
+    }
+
+    [Fact]
+    public void ConcurrentWrites_KeepTheIndexConsistent()
+    {
+        // Arrange
+        var (records, data, byWarehouse) = NewIndex();
+
+        // Act
+        var added = new int[400];
+        Parallel.For(0, 800, i =>
+        {
+            // Every key is added twice, and every fourth one is removed again.
+            var id = i % 400;
+            if (records.Add(NewLocation(id, id % 5))) added[id]++;
+            if (id % 4 == 0) records.Remove(records.Get(id)!);
+        });
+
+        // Assert
+        Assert.True(added.All(count => count >= 1));
+        var expected = Enumerable.Range(0, 400).Where(id => id % 4 != 0 || records.Contains(id)).Select(id => (int?)id).ToList();
+        Assert.Equal(expected, records.Keys.ToList());
+        Assert.Equal(data.Count, records.Keys.Count);
+        Assert.True(records.Keys.All(id => ReferenceEquals(data[records.IndexOf(id)], records.Get(id))));
+        Assert.Equal(records.Keys.Count, Enumerable.Range(0, 5).Sum(warehouse => byWarehouse.Get(warehouse).Count));
+    }
+}
@@ -0,0 +1,99 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Xunit;
+using ModelsV2;
+using HelpersV2;
+using static LocationFixtures;
+
+public class RecordQueryTests
+{
+    private static (RecordIndex<int?, Location> Records, SecondaryIndex<int, int?> ByWarehouse, TrigramIndex<int?> Names, TrigramIndex<int?> Codes) NewIndex()
+    {
+        var records = NewRecords();
+        var byWarehouse = records.AddIndex(x => x.Warehouse_Id);
+        var names = records.AddTrigrams(x => x.Name);
+        var codes = records.AddTrigrams(x => x.Code);
+        var rows = new[] { "A", "B", "C", "D" };
+        var data = Enumerable.Range(1, 300).Select(id => NewLocation(id, id % 6, rows[id % 4], id % 7, id % 3)).ToList();
+        records.Load(data);
+        return (records, byWarehouse, names, codes);
+    }
+
+    // Builds the query the way the Search* methods do and the same filters as a plain scan.
+    [Theory]
+    [InlineData("Rack: 3", 2, null)]
+    [InlineData("row: b", null, "B.5")]
+    [InlineData(null, 4, "c.")]
+    [InlineData("Sh", 1, "A")]
+    [InlineData("Rack: 6, Shelf: 2", null, null)]
+    [InlineData("Row: Z", 3, null)]
+    [InlineData(null, 5, null)]
+    public void Enumerate_ReturnsWhatAFullScanReturns(string name, int? warehouseId, string code)
+    {
+        // Arrange
+        var (records, byWarehouse, names, codes) = NewIndex();
+        var query = new RecordQuery<int?, Location>(records);
+        var filters = new List<Func<Location, bool>>();
+        if (name != null)
+        {
+            Func<Location, bool> matches = x => x.Name.Contains(name, StringComparison.OrdinalIgnoreCase);
+            query.Where(matches, names.Lookup(name));
+            filters.Add(matches);
+        }
+        if (warehouseId.HasValue)
+        {
+            Func<Location, bool> matches = x => x.Warehouse_Id == warehouseId.Value;
+            query.Where(matches, byWarehouse.Lookup(warehouseId.Value));
+            filters.Add(matches);
+        }
+        if (code != null)
+        {
+            Func<Location, bool> matches = x => x.Code.Contains(code, StringComparison.OrdinalIgnoreCase);
+            query.Where(matches, codes.Lookup(code));
+            filters.Add(matches);
+        }
+
+        // Act
+        var planned = query.Select(x => x.Id).ToList();
+
+        // Assert
+        var scanned = records.InKeyOrder.Where(x => filters.All(matches => matches(x))).Select(x => x.Id).ToList();
+        Assert.Equal(scanned, planned);
+    }
+
+    [Fact]
+    public void Enumerate_OnlyAsksTheMostSelectiveIndexForCandidates()
+    {
+        // Arrange
+        var (records, _, _, _) = NewIndex();
+        var asked = new List<string>();
+        var query = new RecordQuery<int?, Location>(records)
+            .Where(x => x.Id % 2 == 0, new IndexLookup<int?>(150, () => { asked.Add("even"); return records.Keys.Where(id => id % 2 == 0).ToList(); }))
+            .Where(x => x.Id <= 10, new IndexLookup<int?>(10, () => { asked.Add("first ten"); return Enumerable.Range(1, 10).Select(id => (int?)id).ToList(); }));
+
+        // Act
+        var ids = query.Select(x => x.Id).ToList();
+
+        // Assert
+        Assert.Equal(new int?[] { 2, 4, 6, 8, 10 }, ids);
+        Assert.Equal(new[] { "first ten" }, asked);
+    }
+
+    [Fact]
+    public void Enumerate_IndexExpectingTheWholePool_FallsBackToAScan()
+    {
+        // Arrange
+        var (records, _, _, _) = NewIndex();
+        var asked = false;
+        var query = new RecordQuery<int?, Location>(records)
+            .Where(x => x.Id > 295, new IndexLookup<int?>(300, () => { asked = true; return records.Keys; }));
+
+        // Act
+        var ids = query.Select(x => x.Id).ToList();
+
+        // Assert
+        Assert.Equal(new int?[] { 296, 297, 298, 299, 300 }, ids);
+        Assert.False(asked);
+    }
+}
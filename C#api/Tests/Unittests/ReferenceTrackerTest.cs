@@ -0,0 +1,79 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Xunit;
+using ModelsV2;
+using HelpersV2;
+using static LocationFixtures;
+
+public class ReferenceTrackerTests
+{
+    private static (RecordIndex<int?, Location> Records, ReferenceTracker Tracker) NewIndex(params Location[] locations)
+    {
+        var tracker = new ReferenceTracker();
+        var records = NewRecords();
+        records.AddReferences(tracker, "locations", x => new (string, object)[] { ("warehouses", x.Warehouse_Id) });
+        records.Load(locations.ToList());
+        return (records, tracker);
+    }
+
+    [Fact]
+    public void Load_CountsEveryReferrer()
+    {
+        // Act
+        var (_, tracker) = NewIndex(NewLocation(1, 10), NewLocation(2, 10), NewLocation(3, 20));
+
+        // Assert
+        Assert.Equal(new[] { "1", "2" }, tracker.GetReferrers("warehouses", 10)["locations"].OrderBy(key => key));
+        Assert.Equal(new[] { "3" }, tracker.GetReferrers("warehouses", 20)["locations"]);
+    }
+
+    [Fact]
+    public void Replace_MovesTheReferenceToTheNewTarget()
+    {
+        // Arrange
+        var (records, tracker) = NewIndex(NewLocation(1, 10), NewLocation(2, 10));
+
+        // Act
+        records.Replace(records.IndexOf(1), NewLocation(1, 20));
+
+        // Assert
+        Assert.Equal(new[] { "2" }, tracker.GetReferrers("warehouses", 10)["locations"]);
+        Assert.Equal(new[] { "1" }, tracker.GetReferrers("warehouses", 20)["locations"]);
+    }
+
+    [Fact]
+    public void Remove_LastReferrer_LeavesTheTargetUnreferenced()
+    {
+        // Arrange
+        var (records, tracker) = NewIndex(NewLocation(1, 10), NewLocation(2, 10));
+
+        // Act
+        records.Remove(records.Get(1));
+        var afterFirst = tracker.GetReferrers("warehouses", 10)["locations"];
+        records.Remove(records.Get(2));
+
+        // Assert
+        Assert.Equal(new[] { "2" }, afterFirst);
+        Assert.Empty(tracker.GetReferrers("warehouses", 10));
+        Assert.False(tracker.IsReferenced("warehouses", 10));
+    }
+
+    [Fact]
+    public void GetReferrers_OnlyReportsThePoolsAskedFor()
+    {
+        // Arrange
+        var tracker = new ReferenceTracker();
+        tracker.Set("orders", 1, new (string, object)[] { ("clients", 5) });
+        tracker.Set("invoices", 7, new (string, object)[] { ("clients", 5) });
+
+        // Act
+        var referrers = tracker.GetReferrers("clients", 5, "orders");
+
+        // Assert
+        Assert.Equal(new[] { "orders" }, referrers.Keys);
+        Assert.Equal(2, tracker.GetReferrers("clients", 5).Count);
+        Assert.True(tracker.IsReferenced("clients", 5, "invoices"));
+        Assert.False(tracker.IsReferenced("clients", 5, "shipments"));
+    }
+}
@@ -0,0 +1,69 @@
+using System;
+using Xunit;
+using HelpersV2;
+
+public class RunningTotalsTests
+{
+    [Fact]
+    public void Set_SumsEveryContributionPerKey()
+    {
+        // Arrange
+        var totals = new RunningTotals<string, int>(2);
+
+        // Act
+        totals.Set(1, "P1", new[] { 5, 1 });
+        totals.Set(2, "P1", new[] { 3, 2 });
+        totals.Set(3, "P2", new[] { 7, 0 });
+
+        // Assert
+        Assert.Equal(new long[] { 8, 3 }, totals.Get("P1"));
+        Assert.Equal(new long[] { 7, 0 }, totals.Get("P2"));
+        Assert.Equal(new long[] { 0, 0 }, totals.Get("P3"));
+    }
+
+    [Fact]
+    public void Set_AgainForTheSameId_ReplacesItsContribution()
+    {
+        // Arrange
+        var totals = new RunningTotals<string, int>(2);
+        totals.Set(1, "P1", new[] { 5, 1 });
+        totals.Set(2, "P1", new[] { 3, 2 });
+
+        // Act
+        totals.Set(1, "P2", new[] { 4, 4 });
+
+        // Assert
+        Assert.Equal(new long[] { 3, 2 }, totals.Get("P1"));
+        Assert.Equal(new long[] { 4, 4 }, totals.Get("P2"));
+    }
+
+    [Fact]
+    public void Remove_SubtractsWhatTheIdContributed()
+    {
+        // Arrange
+        var totals = new RunningTotals<string, int>(1);
+        totals.Set(1, "P1", new[] { 5 });
+        totals.Set(2, "P1", new[] { 3 });
+
+        // Act
+        totals.Remove(1);
+        totals.Remove(1);
+
+        // Assert
+        Assert.Equal(new long[] { 3 }, totals.Get("P1"));
+    }
+
+    [Fact]
+    public void Get_ReturnsACopy()
+    {
+        // Arrange
+        var totals = new RunningTotals<string, int>(1);
+        totals.Set(1, "P1", new[] { 5 });
+
+        // Act
+        totals.Get("P1")[0] = 99;
+
+        // Assert
+        Assert.Equal(new long[] { 5 }, totals.Get("P1"));
+    }
+}
@@ -0,0 +1,120 @@
+using System;
+using System.Linq;
+using Xunit;
+using HelpersV2;
+
+public class SecondaryIndexTests
+{
+    [Fact]
+    public void Set_FilesTheIdUnderEveryDistinctKey()
+    {
+        // Arrange
+        var index = new SecondaryIndex<string, int>();
+
+        // Act
+        index.Set(1, new[] { "P1", "P2", "P1", null });
+
+        // Assert
+        Assert.Equal(new[] { 1 }, index.Get("P1"));
+        Assert.Equal(new[] { 1 }, index.Get("P2"));
+        Assert.Equal(2, index.Keys.Count());
+    }
+
+    [Fact]
+    public void Set_AgainWithOtherKeys_MovesTheId()
+    {
+        // Arrange
+        var index = new SecondaryIndex<string, int>();
+        index.Set(1, new[] { "P1" });
+        index.Set(2, new[] { "P1" });
+
+        // Act
+        index.Set(1, new[] { "P3" });
+
+        // Assert
+        Assert.Equal(new[] { 2 }, index.Get("P1"));
+        Assert.Equal(new[] { 1 }, index.Get("P3"));
+    }
+
+    [Fact]
+    public void Remove_DropsKeysThatBecomeEmpty()
+    {
+        // Arrange
+        var index = new SecondaryIndex<string, int>();
+        index.Set(1, new[] { "P1", "P2" });
+        index.Set(2, new[] { "P2" });
+
+        // Act
+        index.Remove(1);
+
+        // Assert
+        Assert.False(index.Any("P1"));
+        Assert.Equal(new[] { 2 }, index.Get("P2"));
+    }
+
+    [Fact]
+    public void LookupWhere_UnionsTheAcceptedKeysInIdOrder()
+    {
+        // Arrange
+        var index = new SecondaryIndex<string, int>();
+        index.Set(3, new[] { "Open" });
+        index.Set(1, new[] { "Packed" });
+        index.Set(2, new[] { "Shipped" });
+
+        // Act
+        var lookup = index.LookupWhere(status => status != "Shipped");
+
+        // Assert
+        Assert.Equal(2, lookup.Estimate);
+        Assert.Equal(new[] { 1, 3 }, lookup.Candidates());
+    }
+
+    [Fact]
+    public void Ranked_KeepsIdsInRankOrderWithTiesByKey()
+    {
+        // Arrange
+        var index = new SecondaryIndex<string, int>(ranked: true);
+
+        // Act
+        index.Set(1, new[] { "P1" }, 30);
+        index.Set(2, new[] { "P1" }, 10);
+        index.Set(4, new[] { "P1" }, 20);
+        index.Set(3, new[] { "P1" }, 20);
+
+        // Assert
+        Assert.Equal(new[] { 2, 3, 4, 1 }, index.Get("P1"));
+    }
+
+    [Fact]
+    public void Ranked_SetWithANewRank_MovesTheId()
+    {
+        // Arrange
+        var index = new SecondaryIndex<string, int>(ranked: true);
+        index.Set(1, new[] { "P1" }, 10);
+        index.Set(2, new[] { "P1" }, 20);
+
+        // Act
+        index.Set(1, new[] { "P1" }, 30);
+
+        // Assert
+        Assert.Equal(new[] { 2, 1 }, index.Get("P1"));
+    }
+
+    [Fact]
+    public void Ranked_LookupReturnsCandidatesInKeyOrder()
+    {
+        // Arrange
+        var index = new SecondaryIndex<string, int>(ranked: true);
+        index.Set(1, new[] { "P1" }, 30);
+        index.Set(2, new[] { "P1" }, 10);
+        index.Set(3, new[] { "P1" }, 20);
+
+        // Act
+        var lookup = index.Lookup("P1");
+        var where = index.LookupWhere(key => key == "P1");
+
+        // Assert
+        Assert.Equal(new[] { 1, 2, 3 }, lookup.Candidates());
+        Assert.Equal(new[] { 1, 2, 3 }, where.Candidates());
+    }
+}
@@ -0,0 +1,60 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Xunit;
+using HelpersV2;
+
+public class SortedKeyListTests
+{
+    [Fact]
+    public void AddAndRemove_AcrossManyBlocks_MatchASortedSet()
+    {
+        // Arrange
+        var random = new Random(7);
+        var keys = new SortedKeyList<int>(Enumerable.Range(0, 1500).Select(i => i * 2));
+        var expected = new SortedSet<int>(keys);
+
+        // Act
+        for (var i = 0; i < 5000; i++)
+        {
+            var key = random.Next(4000);
+            if (random.Next(3) == 0) Assert.Equal(expected.Remove(key), keys.Remove(key));
+            else Assert.Equal(expected.Add(key), keys.Add(key));
+        }
+
+        // Assert
+        Assert.Equal(expected.Count, keys.Count);
+        Assert.Equal(expected.ToList(), keys.ToList());
+        var list = expected.ToList();
+        for (var i = 0; i < list.Count; i++) Assert.Equal(list[i], keys[i]);
+    }
+
+    [Fact]
+    public void Remove_EveryKey_LeavesAnEmptyListThatStillAcceptsKeys()
+    {
+        // Arrange
+        var keys = new SortedKeyList<string>(new[] { "B", "A", "C" });
+
+        // Act
+        keys.Remove("A");
+        keys.Remove("B");
+        keys.Remove("C");
+        keys.Add("D");
+
+        // Assert
+        Assert.Equal(1, keys.Count);
+        Assert.Equal("D", keys[0]);
+        Assert.False(keys.Remove("A"));
+    }
+
+    [Fact]
+    public void Indexer_OutsideTheList_Throws()
+    {
+        // Arrange
+        var keys = new SortedKeyList<int>(new[] { 1, 2 });
+
+        // Assert
+        Assert.Throws<ArgumentOutOfRangeException>(() => { _ = keys[2]; });
+        Assert.Throws<ArgumentOutOfRangeException>(() => { _ = keys[-1]; });
+    }
+}
@@ -0,0 +1,47 @@
+using System;
+using Xunit;
+using HelpersV2;
+
+public class TimestampsTests
+{
+    [Fact]
+    public void ParseBound_DateOnlyUpperBound_CoversTheWholeDay()
+    {
+        // Act
+        var to = Timestamps.ParseBound("2024-11-14", "to", upper: true);
+
+        // Assert
+        Assert.Equal(new DateTime(2024, 11, 15).Ticks - 1, to);
+        Assert.True(Timestamps.Parse("2024-11-14T23:59:59.999999") <= to);
+        Assert.True(Timestamps.Parse("2024-11-15T00:00:00") > to);
+    }
+
+    [Fact]
+    public void ParseBound_DateOnlyLowerBound_StartsAtMidnight()
+    {
+        // Act
+        var from = Timestamps.ParseBound("2024-11-14", "from");
+
+        // Assert
+        Assert.Equal(new DateTime(2024, 11, 14).Ticks, from);
+    }
+
+    [Fact]
+    public void ParseBound_UpperBoundWithATime_IsTakenAsGiven()
+    {
+        // Act
+        var to = Timestamps.ParseBound("2024-11-14T12:30:00", "to", upper: true);
+
+        // Assert
+        Assert.Equal(new DateTime(2024, 11, 14, 12, 30, 0).Ticks, to);
+    }
+
+    [Fact]
+    public void ParseBound_MissingIsOpenAndMalformedIsRejected()
+    {
+        // Assert
+        Assert.Null(Timestamps.ParseBound(null, "to", upper: true));
+        Assert.Null(Timestamps.ParseBound("", "from"));
+        Assert.Throws<ArgumentException>(() => Timestamps.ParseBound("yesterday", "to", upper: true));
+    }
+}
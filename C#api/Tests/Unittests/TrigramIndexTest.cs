@@ -0,0 +1,73 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Xunit;
+using HelpersV2;
+
+public class TrigramIndexTests
+{
+    private static readonly string[] Names = { "Amsterdam Depot", "Rotterdam Port", "Damascus", "Adams & Co", "Utrecht", null, "DAM" };
+
+    private static TrigramIndex<int> NewIndex()
+    {
+        var index = new TrigramIndex<int>();
+        for (var id = 0; id < Names.Length; id++) index.Set(id, Names[id]);
+        return index;
+    }
+
+    [Theory]
+    [InlineData("dam")]
+    [InlineData("ERDAM")]
+    [InlineData("rdam ")]
+    [InlineData("trecht")]
+    public void Lookup_FindsEveryRecordContainingTheText(string text)
+    {
+        // Arrange
+        var index = NewIndex();
+        var expected = Enumerable.Range(0, Names.Length)
+            .Where(id => Names[id] != null && Names[id].Contains(text, StringComparison.OrdinalIgnoreCase));
+
+        // Act
+        var candidates = index.Lookup(text)!.Candidates();
+
+        // Assert
+        Assert.True(expected.All(candidates.Contains));
+        Assert.Equal(candidates.OrderBy(id => id).ToList(), candidates.ToList());
+    }
+
+    [Theory]
+    [InlineData(null)]
+    [InlineData("")]
+    [InlineData("da")]
+    public void Lookup_TooShortForATrigram_IsNull(string text)
+    {
+        Assert.Null(NewIndex().Lookup(text));
+    }
+
+    [Fact]
+    public void Lookup_UnknownTrigram_ExpectsNothing()
+    {
+        // Act
+        var lookup = NewIndex().Lookup("xyz");
+
+        // Assert
+        Assert.Equal(0, lookup!.Estimate);
+        Assert.Empty(lookup.Candidates());
+    }
+
+    [Fact]
+    public void SetAndRemove_KeepThePostingsCurrent()
+    {
+        // Arrange
+        var index = NewIndex();
+
+        // Act
+        index.Set(4, "Haarlem");
+        index.Remove(2);
+
+        // Assert
+        Assert.Equal(0, index.Lookup("trecht")!.Estimate);
+        Assert.Equal(new[] { 4 }, index.Lookup("haarl")!.Candidates());
+        Assert.DoesNotContain(2, index.Lookup("dam")!.Candidates());
+    }
+}
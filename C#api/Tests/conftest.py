@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The test modules here and in the subfolders share journal_data.py.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,29 @@
+import json
+import os
+
+
+def GetJsonData(data_root, model):
+    """Returns a pool's records as the API sees them: the snapshot (<model>.json) with
+    its journal (<model>.journal) replayed on top, the way DataJournal loads them."""
+    with open(os.path.join(data_root, f"{model}.json"), 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    journal_path = os.path.join(data_root, f"{model}.journal")
+    if not os.path.exists(journal_path):
+        return data
+
+    key = "Uid" if model == "items" else "Id"
+    records = {str(record[key]): record for record in data}
+    with open(journal_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn last line from an interrupted append; everything before it is valid.
+                break
+            if entry["Op"] == "remove":
+                records.pop(entry["Key"], None)
+            elif entry.get("Record") is not None:
+                records[entry["Key"]] = entry["Record"]
+    return list(records.values())
@@ -2,6 +2,7 @@ import httpx
 import unittest
 import json
 import os
+import journal_data
 from datetime import datetime
 
 class ApiClientsTests(unittest.TestCase):
@@ -38,9 +39,7 @@ class ApiClientsTests(unittest.TestCase):
 
     @classmethod
     def GetJsonData(cls, model):
-        with open(os.path.join(cls.data_root, f"{model}.json"), 'r', encoding='utf-8') as file:
-            data = json.load(file)
-        return data
+        return journal_data.GetJsonData(cls.data_root, model)
 
     
     # GET tests
@@ -53,7 +52,24 @@ class ApiClientsTests(unittest.TestCase):
         response = self.client.get(f"clients/1")
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()['Id'], 1)
-    
+
+    def test_2get_clients_with_cursor(self):
+        first = self.client.get("clients", params={"pageSize": 2})
+        self.assertEqual(first.status_code, 200)
+        cursor = first.json()['NextCursor']
+        second = self.client.get("clients", params={"pageSize": 2, "cursor": cursor})
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual([c['Id'] for c in second.json()['Items']],
+                         [c['Id'] for c in self.client.get("clients", params={"page": 2, "pageSize": 2}).json()['Items']])
+
+        response = self.client.get("clients", params={"cursor": "not a cursor"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_2get_clients_with_invalid_page(self):
+        for params in ({"pageSize": 0}, {"pageSize": -5}, {"page": 0}, {"pageSize": 0, "filter": "Id:gt:1"}):
+            response = self.client.get("clients", params=params)
+            self.assertEqual(response.status_code, 400, params)
+
     def test_get_client_orders(self):
         client_id = 1
         response = self.client.get(f"clients/1/orders")
@@ -66,7 +82,7 @@ class ApiClientsTests(unittest.TestCase):
     def test_search_by_name(self):
         response = self.client.get(f"clients/search?name=Raymond Inc")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
         for client in response.json()["Items"]:
             self.assertEqual(client['Name'], "Raymond Inc")
     
@@ -83,7 +99,7 @@ class ApiClientsTests(unittest.TestCase):
     def test_search_by_country(self):
         response = self.client.get(f"clients/search?country=United States")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
         for country in response.json()["Items"]:
             self.assertEqual(country['Country'], "United States")
 
@@ -102,14 +118,14 @@ class ApiClientsTests(unittest.TestCase):
     def test_search_with_valid_and_invalid_parameter(self):
         response = self.client.get("clients/search?name=Raymond Inc&invalid_param=invalid_value")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0)
+        self.assertTrue(len(response.json()["Items"]) > 0)
         for client in response.json()["Items"]:
             self.assertEqual(client['Name'], "Raymond Inc")      
 
     def test_search_by_name_and_address(self):
         response = self.client.get(f"clients/search?name=Richardson-Ramsey&address=81107 Alyssa Spring Apt. 366")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
         for x in response.json()["Items"]:
             self.assertEqual(x['Name'], "Richardson-Ramsey")
             self.assertEqual(x['Address'], "81107 Alyssa Spring Apt. 366")
@@ -117,7 +133,7 @@ class ApiClientsTests(unittest.TestCase):
     def test_search_by_name_and_country(self):
         response = self.client.get(f"clients/search?name=Raymond Inc&country=United States")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
         for x in response.json()["Items"]:
             self.assertEqual(x['Name'], "Raymond Inc")
             self.assertEqual(x['Country'], "United States")
@@ -125,7 +141,7 @@ class ApiClientsTests(unittest.TestCase):
     def test_search_by_address_and_country(self):
         response = self.client.get(f"clients/search?address=81107 Alyssa Spring Apt. 366&country=United States")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
         for x in response.json()["Items"]:
             self.assertEqual(x['Address'], "81107 Alyssa Spring Apt. 366")
             self.assertEqual(x['Country'], "United States")
@@ -133,7 +149,7 @@ class ApiClientsTests(unittest.TestCase):
     def test_search_by_name_and_address_and_country(self):
         response = self.client.get(f"clients/search?name=Murphy Ltd&address=736 Karen Road&country=United States")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
         for x in response.json()["Items"]:
             self.assertEqual(x['Name'], "Murphy Ltd")
             self.assertEqual(x['Address'], "736 Karen Road")
@@ -226,6 +242,22 @@ class ApiClientsTests(unittest.TestCase):
         self.assertEqual(response.status_code, httpx.codes.OK)
         self.assertNotIn(self.new_client, self.GetJsonData("clients"))
 
+    def test_delete_client_with_orders_names_them(self):
+        response = self.client.post("clients", json=self.new_client)
+        self.assertEqual(response.status_code, 201)
+        client_id = response.json()["Id"]
+        response = self.client.post("orders", json={"Source_Id": 1, "Reference": "ORD123", "Warehouse_Id": 1, "Ship_To": client_id, "Bill_To": client_id, "Items": []})
+        self.assertEqual(response.status_code, 201)
+        order_id = response.json()["Id"]
+
+        response = self.client.delete(f"clients/{client_id}")
+        self.assertEqual(response.status_code, httpx.codes.BAD_REQUEST)
+        self.assertIn(f"orders {order_id}", response.text)
+
+        self.client.delete(f"orders/{order_id}")
+        response = self.client.delete(f"clients/{client_id}")
+        self.assertEqual(response.status_code, httpx.codes.OK)
+
     def test_delete_non_existent_client(self):
         response = self.client.delete("clients/-1")
         self.assertEqual(response.status_code, httpx.codes.BAD_REQUEST)
@@ -2,6 +2,7 @@ import httpx
 import unittest
 import json
 import os
+import journal_data
 from datetime import datetime
 
 class ApiItemLinesTests(unittest.TestCase):
@@ -32,9 +33,7 @@ class ApiItemLinesTests(unittest.TestCase):
 
     @classmethod
     def GetJsonData(cls, model):
-        with open(os.path.join(cls.data_root, f"{model}.json"), 'r') as file:
-            data = json.load(file)
-        return data
+        return journal_data.GetJsonData(cls.data_root, model)
     
     # GET tests
     def test_1get_all_item_lines(self):
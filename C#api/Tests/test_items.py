@@ -2,6 +2,7 @@ import httpx
 import unittest
 import json
 import os
+import journal_data
 from datetime import datetime
 
 class ApiItemsTests(unittest.TestCase):
@@ -45,9 +46,7 @@ class ApiItemsTests(unittest.TestCase):
 
     @classmethod
     def GetJsonData(cls, model):
-        with open(os.path.join(cls.data_root, f"{model}.json"), 'r') as file:
-            data = json.load(file)
-        return data
+        return journal_data.GetJsonData(cls.data_root, model)
     
     # GET tests
     def test_1get_all_items(self):
@@ -70,29 +69,29 @@ class ApiItemsTests(unittest.TestCase):
     def test_search_items_by_code(self):
         response = self.client.get("items/search?code=sjQ23408K")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for code in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for code in response.json()["Items"]:
             self.assertEqual(code['Code'], "sjQ23408K")
     
     def test_search_items_by_upc_code(self):
         response = self.client.get("items/search?upccode=6523540947122")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for item in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for item in response.json()["Items"]:
             self.assertEqual(item['Upc_Code'], "6523540947122")
     
     def test_search_items_by_commodity_code(self):
         response = self.client.get("items/search?commodityCode=oTo304")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for item in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for item in response.json()["Items"]:
             self.assertEqual(item['Commodity_Code'], "oTo304")
     
     def test_search_items_by_supplier_code(self):
         response = self.client.get("items/search?suppliercode=SUP423")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for item in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for item in response.json()["Items"]:
             self.assertEqual(item['Supplier_Code'], "SUP423")
     
     def test_search_items_with_invalid_parameter(self):
@@ -103,34 +102,84 @@ class ApiItemsTests(unittest.TestCase):
     def test_search_items_with_valid_and_invalid_parameter(self):
         response = self.client.get("items/search?code=sjQ23408K&invalid_param=invalid_value")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for item in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for item in response.json()["Items"]:
             self.assertEqual(item['Code'], "sjQ23408K")
     
     def test_search_items_by_code_and_supplier_code(self):
         response = self.client.get("items/search?code=sjQ23408K&supplierCode=SUP423")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for item in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for item in response.json()["Items"]:
             self.assertEqual(item['Code'], "sjQ23408K")
             self.assertEqual(item['Supplier_Code'], "SUP423")
     
     def test_search_items_by_commodity_code_and_upc_code(self):
         response = self.client.get("items/search?commodityCode=p-69292-Xkv&upccode=8196931578335")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for item in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for item in response.json()["Items"]:
             self.assertEqual(item ['Commodity_Code'], "p-69292-Xkv")
             self.assertEqual(item ['Upc_Code'], "8196931578335")
     
     def test_search_items_by_code_and_commodity_code(self):
         response = self.client.get("items/search?code=gVK34692I&commodityCode=p-69292-Xkv")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for item in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for item in response.json()["Items"]:
             self.assertEqual(item['Code'], "gVK34692I")
             self.assertEqual(item['Commodity_Code'], "p-69292-Xkv")
 
+    def test_search_items_is_paginated(self):
+        response = self.client.get("items/search?code=A&pageSize=5")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["Items"]), 5)
+        self.assertGreater(response.json()["TotalCount"], 5)
+        self.assertIn("NextCursor", response.json())
+
+    def test_search_items_exact(self):
+        response = self.client.get("items/search?code=SJQ23408K&exact=true")
+        self.assertEqual(response.status_code, 200)
+        for item in response.json()["Items"]:
+            self.assertEqual(item['Code'].lower(), "sjq23408k")
+
+        response = self.client.get("items/search?code=sjQ23408&exact=true")
+        self.assertEqual(response.status_code, 204)
+
+    def test_get_items_by_upc_code(self):
+        response = self.client.get("items/by-upc/6523540947122")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(len(response.json()["Items"]) > 0)
+        for item in response.json()["Items"]:
+            self.assertEqual(item['Upc_Code'], "6523540947122")
+
+        response = self.client.get("items/by-upc/652354094712")
+        self.assertEqual(response.status_code, 204)
+
+    def test_get_items_by_code_prefix(self):
+        response = self.client.get("items/by-code/sjQ234", params={"prefix": "true"})
+        self.assertEqual(response.status_code, 200)
+        for item in response.json()["Items"]:
+            self.assertTrue(item['Code'].lower().startswith("sjq234"))
+
+    def test_get_items_by_code_prefix_invalid_page_size(self):
+        response = self.client.get("items/by-code/sjQ234", params={"prefix": "true", "pageSize": 0})
+        self.assertEqual(response.status_code, 400)
+
+    def test_get_items_with_fields(self):
+        response = self.client.get("items", params={"fields": "uid,Code"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(len(response.json()["Items"]) > 0)
+        for item in response.json()["Items"]:
+            self.assertEqual(set(item.keys()), {"Uid", "Code"})
+
+        response = self.client.get("items/P000001", params={"fields": "Uid,Description"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json().keys()), {"Uid", "Description"})
+
+        response = self.client.get("items", params={"fields": "Uid,Not_A_Field"})
+        self.assertEqual(response.status_code, 400)
+
     def test_get_item_supplier(self):
         id = "P000006"
         response = self.client.get(f"items/{id}/supplier")
@@ -279,6 +328,14 @@ class ApiItemsTests(unittest.TestCase):
         response = self.client.get("items/ITEM999/transfers")
         self.assertEqual(response.status_code, 204)
 
+    def test_get_item_orders_non_existent_id(self):
+        response = self.client.get("items/ITEM999/orders")
+        self.assertEqual(response.status_code, 204)
+
+    def test_get_item_shipments_non_existent_id(self):
+        response = self.client.get("items/ITEM999/shipments")
+        self.assertEqual(response.status_code, 204)
+
     def test_get_item_transfer_history(self):
         response = self.client.post("items", json=self.new_item)
         self.assertEqual(response.status_code, 201)
@@ -307,13 +364,52 @@ class ApiItemsTests(unittest.TestCase):
 
         response = self.client.get(f"items/{uid}/transfers")
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.json()), 2)
-        self.assertTrue(response.json()[0]['Updated_At'] > response.json()[1]['Updated_At'])
+        transfers = response.json()['Items']
+        self.assertEqual(response.json()['TotalCount'], 2)
+        self.assertEqual(len(transfers), 2)
+        self.assertTrue(transfers[0]['Updated_At'] > transfers[1]['Updated_At'])
+
+        response = self.client.get(f"items/{uid}/transfers?page=2&pageSize=1")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([x['Id'] for x in response.json()['Items']], [secondid])
 
         self.client.delete(f"transfers/{firstid}")
         self.client.delete(f"transfers/{secondid}")
         self.client.delete(f"items/{uid}/force")
 
+    def test_get_item_orders_and_shipments_in_creation_order(self):
+        response = self.client.post("items", json=self.new_item)
+        self.assertEqual(response.status_code, 201)
+        uid = self.GetJsonData("items")[-1].pop("Uid")
+
+        for path, record in [
+            ("orders", {"Source_Id": 1, "Reference": "ORD123", "Warehouse_Id": 1, "Ship_To": 2, "Bill_To": 3}),
+            ("shipments", {"Order_Id": 123, "Source_Id": 1, "Shipment_Type": "Standard", "Carrier_Code": "UPS"}),
+        ]:
+            # Posted newest first, so creation order is the reverse of id order
+            ids = []
+            for created_at in ["2024-11-14T16:10:14.227318", "2023-01-01T08:00:00.000000"]:
+                record.update({"Created_At": created_at, "Updated_At": created_at, "Items": [{"Item_Id": uid, "Amount": 10}]})
+                response = self.client.post(path, json=record)
+                self.assertEqual(response.status_code, 201)
+                ids.append(response.json()["Id"])
+
+            response = self.client.get(f"items/{uid}/{path}")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["TotalCount"], 2)
+            self.assertEqual([x["Id"] for x in response.json()["Items"]], ids[::-1])
+
+            response = self.client.get(f"items/{uid}/{path}", params={"page": 2, "pageSize": 1, "fields": "Id,Created_At"})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["Items"], [{"Id": ids[0], "Created_At": "2024-11-14T16:10:14.227318"}])
+
+            response = self.client.get(f"items/{uid}/{path}", params={"fields": "Id,Colour"})
+            self.assertEqual(response.status_code, 400)
+
+            for id in ids:
+                self.client.delete(f"{path}/{id}")
+        self.client.delete(f"items/{uid}/force")
+
 
 
 if __name__ == '__main__':
@@ -0,0 +1,44 @@
+import unittest
+import json
+import os
+import tempfile
+import journal_data
+
+class JournalDataTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_root = self.tmp.name
+        self.write("clients.json", json.dumps([{"Id": 1, "Name": "A"}, {"Id": 2, "Name": "B"}]))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, content):
+        with open(os.path.join(self.data_root, name), 'w', encoding='utf-8') as file:
+            file.write(content)
+
+    def journal(self, *entries, tail=""):
+        self.write("clients.journal", "".join(json.dumps(entry) + "\n" for entry in entries) + tail)
+
+    def test_snapshot_without_journal(self):
+        self.assertEqual([c["Id"] for c in journal_data.GetJsonData(self.data_root, "clients")], [1, 2])
+
+    def test_replays_add_replace_and_remove(self):
+        self.journal({"Op": "add", "Key": "3", "Record": {"Id": 3, "Name": "C"}},
+                     {"Op": "replace", "Key": "1", "Record": {"Id": 1, "Name": "A2"}},
+                     {"Op": "remove", "Key": "2", "Record": None})
+        self.assertEqual(journal_data.GetJsonData(self.data_root, "clients"),
+                         [{"Id": 1, "Name": "A2"}, {"Id": 3, "Name": "C"}])
+
+    def test_stops_at_a_torn_last_line(self):
+        self.journal({"Op": "remove", "Key": "1", "Record": None},
+                     tail='{"Op": "add", "Key": "3", "Rec')
+        self.assertEqual(journal_data.GetJsonData(self.data_root, "clients"), [{"Id": 2, "Name": "B"}])
+
+    def test_items_are_keyed_by_uid(self):
+        self.write("items.json", json.dumps([{"Uid": "P000001", "Code": "a"}]))
+        self.write("items.journal", json.dumps({"Op": "replace", "Key": "P000001", "Record": {"Uid": "P000001", "Code": "b"}}) + "\n")
+        self.assertEqual(journal_data.GetJsonData(self.data_root, "items"), [{"Uid": "P000001", "Code": "b"}])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import httpx
 import unittest
 import json
 import os
+import journal_data
 from datetime import datetime
 
 class ApiLocationsTests(unittest.TestCase):
@@ -33,9 +34,7 @@ class ApiLocationsTests(unittest.TestCase):
 
     @classmethod
     def GetJsonData(cls, model):
-        with open(os.path.join(cls.data_root, f"{model}.json"), 'r') as file:
-            data = json.load(file)
-        return data
+        return journal_data.GetJsonData(cls.data_root, model)
     
     # GET tests
     def test_1get_all_locations(self):
@@ -54,22 +53,22 @@ class ApiLocationsTests(unittest.TestCase):
     def test_search_locations_by_name(self):
         response = self.client.get("locations/search?name=Row: A, Rack: 1, Shelf: 0")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for name in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for name in response.json()["Items"]:
             self.assertEqual(name['Name'], "Row: A, Rack: 1, Shelf: 0")
     
     def test_search_locations_by_code(self):
         response = self.client.get("locations/search?code=A.1.0")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for code in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for code in response.json()["Items"]:
             self.assertEqual(code['Code'], "A.1.0")
     
     def test_search_locations_by_warehouse_id(self):
         response = self.client.get("locations/search?warehouseid=1")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for location in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for location in response.json()["Items"]:
             self.assertTrue(location['Warehouse_Id'] == 1)
     
     def test_search_locations_with_invalid_parameter(self):
@@ -80,39 +79,39 @@ class ApiLocationsTests(unittest.TestCase):
     def test_search_locations_with_valid_and_invalid_parameter(self):
         response = self.client.get("locations/search?name=Row: A, Rack: 1, Shelf: 0&invalid_param=invalid_value")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for location in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for location in response.json()["Items"]:
             self.assertEqual(location['Name'], "Row: A, Rack: 1, Shelf: 0")
     
     def test_search_locations_by_name_and_code(self):
         response = self.client.get("locations/search?name=Row: A, Rack: 1, Shelf: 0&code=A.1.0")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for x in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for x in response.json()["Items"]:
             self.assertEqual(x['Name'], "Row: A, Rack: 1, Shelf: 0")
             self.assertEqual(x['Code'], "A.1.0")
             
     def test_search_locations_by_name_and_warehouse_id(self):
         response = self.client.get("locations/search?name=Row: A, Rack: 1, Shelf: 0&warehouseid=1")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for x in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for x in response.json()["Items"]:
             self.assertEqual(x['Name'], "Row: A, Rack: 1, Shelf: 0")
             self.assertEqual(x['Warehouse_Id'], 1)
             
     def test_search_locations_by_code_and_warehouse_id(self):
         response = self.client.get("locations/search?code=A.1.0&warehouseid=1")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for x in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for x in response.json()["Items"]:
             self.assertEqual(x['Code'], "A.1.0")
             self.assertEqual(x['Warehouse_Id'], 1)
     
     def test_search_locations_by_name_and_code_and_warehouse_id(self):
         response = self.client.get("locations/search?name=Row: A, Rack: 1, Shelf: 0&code=A.1.0&warehouseid=1")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for x in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for x in response.json()["Items"]:
             self.assertEqual(x['Name'], "Row: A, Rack: 1, Shelf: 0")
             self.assertEqual(x['Code'], "A.1.0")
             self.assertEqual(x['Warehouse_Id'], 1)
@@ -129,6 +128,17 @@ class ApiLocationsTests(unittest.TestCase):
     def test_get_location_warehouse_invalid_id(self):
         response = self.client.get("locations/-1/warehouse")
         self.assertEqual(response.status_code, 204)
+
+    def test_get_location_inventory(self):
+        id = 1
+        response = self.client.get(f"locations/{id}/inventory")
+        self.assertEqual(response.status_code, 200)
+        expected = [x['Id'] for x in self.GetJsonData("inventories") if id in x['Locations']]
+        self.assertEqual(sorted(x['Id'] for x in response.json()), sorted(expected))
+
+    def test_get_location_inventory_invalid_id(self):
+        response = self.client.get("locations/-1/inventory")
+        self.assertEqual(response.status_code, 204)
        
     # POST tests
     def test_4create_location(self):
@@ -2,6 +2,7 @@ import httpx
 import unittest
 import json
 import os
+import journal_data
 from datetime import datetime
 
 class ApiOrdersTests(unittest.TestCase):
@@ -51,9 +52,19 @@ class ApiOrdersTests(unittest.TestCase):
 
     @classmethod
     def GetJsonData(cls, model):
-        with open(os.path.join(cls.data_root, f"{model}.json"), 'r') as file:
-            data = json.load(file)
-        return data
+        return journal_data.GetJsonData(cls.data_root, model)
+
+    def SearchAll(self, path, params):
+        found, cursor = [], None
+        while True:
+            response = self.client.get(path, params=dict(params, pageSize=100, **({"cursor": cursor} if cursor else {})))
+            if response.status_code == 204:
+                return found
+            self.assertEqual(response.status_code, 200)
+            found.extend(response.json()["Items"])
+            cursor = response.json().get("NextCursor")
+            if not cursor:
+                return found
     
     # GET tests
     def test_1get_all_orders(self):
@@ -72,31 +83,51 @@ class ApiOrdersTests(unittest.TestCase):
     def test_search_orders_by_source_id(self):
         response = self.client.get("orders/search?sourceid=33")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for order in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for order in response.json()["Items"]:
             self.assertEqual(order['Source_Id'], 33)
     
     def test_search_orders_by_order_status(self):
         response = self.client.get("orders/search?orderstatus=Delivered")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for order in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for order in response.json()["Items"]:
             self.assertEqual(order['Order_Status'], "Delivered")
     
     def test_search_orders_by_order_date(self):
         response = self.client.get("orders/search?orderdate=2020-05-02T23:13:56Z")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for order in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for order in response.json()["Items"]:
             self.assertEqual(order['Order_Date'], "2020-05-02T23:13:56Z")
 
     def test_search_orders_by_warehouse_id(self):
         response = self.client.get("orders/search?warehouseid=18")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for order in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for order in response.json()["Items"]:
             self.assertEqual(order['Warehouse_Id'], 18)
-    
+
+    def test_search_orders_by_date_range(self):
+        response = self.client.get("orders/search?from=2020-05-01&to=2020-05-31T23:59:59Z&pageSize=100")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for order in response.json()["Items"]:
+            self.assertTrue(order['Order_Date'].startswith("2020-05"), order['Order_Date'])
+
+        response = self.client.get("orders/search?from=not-a-date")
+        self.assertEqual(response.status_code, 400)
+
+    def test_search_orders_to_a_date_includes_that_whole_day(self):
+        # A date-only upper bound runs to the end of the day, so late orders on it are found
+        orders = self.SearchAll("orders/search", {"from": "2020-05-02", "to": "2020-05-02"})
+        self.assertIn("2020-05-02T23:13:56Z", [order["Order_Date"] for order in orders])
+        for order in orders:
+            self.assertTrue(order["Order_Date"].startswith("2020-05-02"), order["Order_Date"])
+
+        until_last_tick = self.SearchAll("orders/search", {"from": "2020-05-02", "to": "2020-05-02T23:59:59.9999999Z"})
+        self.assertEqual([order["Id"] for order in orders], [order["Id"] for order in until_last_tick])
+
     def test_search_orders_with_invalid_parameter(self):
         response = self.client.get("orders/search?invalid_param=invalid_value")
         self.assertEqual(response.status_code, 400)
@@ -105,32 +136,32 @@ class ApiOrdersTests(unittest.TestCase):
     def test_search_orders_with_valid_and_invalid_parameter(self):
         response = self.client.get("orders/search?warehouseid=18&invalid_param=invalid_value")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for order in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for order in response.json()["Items"]:
             self.assertEqual(order['Warehouse_Id'], 18)
 
  
     def test_search_orders_by_order_status_and_order_date(self):
         response = self.client.get("orders/search?status=Delivered&orderDate=2020-05-02T23:13:56Z")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.status_code)
-        for x in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.status_code)
+        for x in response.json()["Items"]:
             self.assertEqual(x['Order_Status'], "Delivered")
             self.assertEqual(x['Order_Date'], "2020-05-02T23:13:56Z")
           
     def test_search_orders_by_order_status_and_source_id(self):
         response = self.client.get("orders/search?orderStatus=Delivered&sourceid=33")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for x in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for x in response.json()["Items"]:
             self.assertEqual(x['Order_Status'], "Delivered")
             self.assertEqual(x['Source_Id'], 33)
             
     def test_search_orders_by_status_and_warehouse_id(self):
         response = self.client.get("orders/search?status=Delivered&warehouseid=18")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for x in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for x in response.json()["Items"]:
             self.assertEqual(x['Order_Status'], "Delivered")
             self.assertEqual(x['Warehouse_Id'], 18)
       
@@ -157,6 +188,20 @@ class ApiOrdersTests(unittest.TestCase):
         ids = [order["Id"] for order in items]
         self.assertEqual(ids, sorted(ids, reverse=True))
         
+    def test_filter_and_sort_orders(self):
+        response = self.client.get("orders?filter=Warehouse_Id:eq:18;Order_Status:in:Delivered|Shipped&sort=-Total_Amount&pageSize=50")
+        self.assertEqual(response.status_code, 200)
+        items = response.json()["Items"]
+        self.assertTrue(len(items) > 0, items)
+        for order in items:
+            self.assertEqual(order['Warehouse_Id'], 18)
+            self.assertIn(order['Order_Status'], ["Delivered", "Shipped"])
+        amounts = [order['Total_Amount'] for order in items]
+        self.assertEqual(amounts, sorted(amounts, reverse=True))
+
+        response = self.client.get("orders?filter=Not_A_Field:eq:1")
+        self.assertEqual(response.status_code, 400)
+
     # POST tests
     def test_4create_order(self):
         response = self.client.post("orders", json=self.new_order)
@@ -218,6 +263,27 @@ class ApiOrdersTests(unittest.TestCase):
         response = self.client.patch("orders/-1", json={"Order_Status": "Shipped"})
         self.assertEqual(response.status_code, 204)
 
+    #Commit tests
+    def test_bcommit_order_is_found_by_status(self):
+        last_id = self.GetJsonData("orders")[-1]['Id']
+        response = self.client.put(f"orders/{last_id}/commit")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get(f"orders/{last_id}/status").text, "Processed")
+
+        for status in ("Processed", "proc"):
+            orders = self.SearchAll("orders/search", {"orderStatus": status, "warehouseId": self.new_order["Warehouse_Id"]})
+            self.assertIn(last_id, [order['Id'] for order in orders])
+            for order in orders:
+                self.assertIn(status.lower(), order['Order_Status'].lower())
+                self.assertEqual(order['Warehouse_Id'], self.new_order["Warehouse_Id"])
+
+        open_orders = self.SearchAll("orders/search", {"orderStatus": "Open", "warehouseId": self.new_order["Warehouse_Id"]})
+        self.assertNotIn(last_id, [order['Id'] for order in open_orders])
+
+    def test_search_orders_by_unknown_status(self):
+        response = self.client.get("orders/search", params={"orderStatus": "NoSuchStatus"})
+        self.assertEqual(response.status_code, 204)
+
     # DELETE tests
     def test_delete_order(self):
         last_id = self.GetJsonData("orders")[-1]['Id']
@@ -2,6 +2,7 @@ import httpx
 import unittest
 import json
 import os
+import journal_data
 from datetime import datetime
 
 class ApiShipmentsTests(unittest.TestCase):
@@ -49,9 +50,19 @@ class ApiShipmentsTests(unittest.TestCase):
 
     @classmethod
     def GetJsonData(cls, model):
-        with open(os.path.join(cls.data_root, f"{model}.json"), 'r') as file:
-            data = json.load(file)
-        return data
+        return journal_data.GetJsonData(cls.data_root, model)
+
+    def SearchAll(self, path, params):
+        found, cursor = [], None
+        while True:
+            response = self.client.get(path, params=dict(params, pageSize=100, **({"cursor": cursor} if cursor else {})))
+            if response.status_code == 204:
+                return found
+            self.assertEqual(response.status_code, 200)
+            found.extend(response.json()["Items"])
+            cursor = response.json().get("NextCursor")
+            if not cursor:
+                return found
     
     # GET tests
     def test_1get_all_shipments(self):
@@ -74,29 +85,29 @@ class ApiShipmentsTests(unittest.TestCase):
     def test_search_shipments_by_order_id(self):
         response = self.client.get("shipments/search?orderid=1")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for item in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for item in response.json()["Items"]:
             self.assertEqual(item['Order_Id'], 1)
     
     def test_search_shipments_by_order_date(self):
         response = self.client.get("shipments/search?orderDate=2000-03-09")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for item in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for item in response.json()["Items"]:
             self.assertEqual(item['Order_Date'], "2000-03-09")
         
     def test_search_shipments_by_shipment_status(self):
         response = self.client.get("shipments/search?shipmentStatus=Pending")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for status in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for status in response.json()["Items"]:
             self.assertEqual(status['Shipment_Status'], "Pending")
     
     def test_search_shipments_by_carrier_code(self):
         response = self.client.get("shipments/search?carriercode=DPD")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for shipment in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for shipment in response.json()["Items"]:
             self.assertEqual(shipment['Carrier_Code'], "DPD")
     
     def test_search_shipments_with_invalid_parameter(self):
@@ -107,31 +118,31 @@ class ApiShipmentsTests(unittest.TestCase):
     def test_search_shipments_with_valid_and_invalid_parameter(self):
         response = self.client.get("shipments/search?carriercode=DPD&invalid_param=invalid_value")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for shipment in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for shipment in response.json()["Items"]:
             self.assertEqual(shipment['Carrier_Code'], "DPD")
     
     def test_search_shipments_by_order_id_and_shipment_status(self):
         response = self.client.get("shipments/search?orderid=1&shipmentstatus=Pending")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for x in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for x in response.json()["Items"]:
             self.assertEqual(x['Order_Id'], 1)
             self.assertEqual(x['Shipment_Status'], "Pending")
     
     def test_search_shipments_by_order_id_and_carrier_code(self):
         response = self.client.get("shipments/search?orderid=1&carriercode=DPD")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for x in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for x in response.json()["Items"]:
             self.assertEqual(x['Order_Id'], 1)
             self.assertEqual(x['Carrier_Code'], "DPD")
     
     def test_search_shipments_by_shipment_status_and_carrier_code(self):
         response = self.client.get("shipments/search?shipmentstatus=Pending&carriercode=DPD")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for x in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for x in response.json()["Items"]:
             self.assertEqual(x['Shipment_Status'], "Pending")
             self.assertEqual(x['Carrier_Code'], "DPD")
 
@@ -232,6 +243,22 @@ class ApiShipmentsTests(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.text, "Planned")
 
+    #Commit tests
+    def test_bcommit_shipment_is_found_by_status(self):
+        last_id = self.GetJsonData("shipments")[-1]['Id']
+        response = self.client.put(f"shipments/{last_id}/commit")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get(f"shipments/{last_id}/status").text, "Shipped")
+
+        order_id = self.GetJsonData("shipments")[-1]['Order_Id']
+        shipments = self.SearchAll("shipments/search", {"shipmentStatus": "shipped", "orderId": order_id})
+        self.assertIn(last_id, [shipment['Id'] for shipment in shipments])
+        for shipment in shipments:
+            self.assertEqual(shipment['Shipment_Status'], "Shipped")
+
+        planned = self.SearchAll("shipments/search", {"shipmentStatus": "Planned", "orderId": order_id})
+        self.assertNotIn(last_id, [shipment['Id'] for shipment in planned])
+
     # DELETE tests
     def test_delete_shipment(self):
         last_id = self.GetJsonData("shipments")[-1]['Id']
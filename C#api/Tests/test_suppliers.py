@@ -2,6 +2,7 @@ import httpx
 import unittest
 import json
 import os
+import journal_data
 from datetime import datetime
 
 class ApiSuppliersTests(unittest.TestCase):
@@ -41,9 +42,7 @@ class ApiSuppliersTests(unittest.TestCase):
 
     @classmethod
     def GetJsonData(cls, model):
-        with open(os.path.join(cls.data_root, f"{model}.json"), 'r') as file:
-            data = json.load(file)
-        return data
+        return journal_data.GetJsonData(cls.data_root, model)
     
     # GET tests
     def test_1get_all_suppliers(self):
@@ -62,29 +61,29 @@ class ApiSuppliersTests(unittest.TestCase):
     def test_search_suppliers_name(self):
         response = self.client.get(f"suppliers/search?name=Lee, Parks and Johnson")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, True)
-        for name in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, True)
+        for name in response.json()["Items"]:
             self.assertEqual(name['Name'], "Lee, Parks and Johnson")
     
     def test_search_suppliers_country(self):
         response = self.client.get(f"suppliers/search?country=Czech Republic")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for country in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for country in response.json()["Items"]:
             self.assertEqual(country['Country'], "Czech Republic")
     
     def test_search_suppliers_code(self):
         response = self.client.get(f"suppliers/search?code=SUP0001")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for code in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for code in response.json()["Items"]:
             self.assertEqual(code['Code'], "SUP0001")
     
     def test_search_suppliers_phone_number(self):
         response = self.client.get(f"suppliers/search?phonenumber=001-910-585-6962x8307")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for contact_name in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for contact_name in response.json()["Items"]:
             self.assertEqual(contact_name['Phonenumber'], "001-910-585-6962x8307")
     
     def test_search_suppliers_with_invalid_parameter(self):
@@ -95,31 +94,31 @@ class ApiSuppliersTests(unittest.TestCase):
     def test_search_suppliers_with_valid_and_invalid_parameter(self):
         response = self.client.get("suppliers/search?code=SUP0001&invalid_param=invalid_value")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for supplier in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for supplier in response.json()["Items"]:
             self.assertEqual(supplier['Code'], "SUP0001")
         
     def test_search_suppliers_code_and_name(self):
         response = self.client.get(f"suppliers/search?code=SUP0001&name=Lee, Parks and Johnson")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for name in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for name in response.json()["Items"]:
             self.assertEqual(name['Code'], "SUP0001")
             self.assertEqual(name['Name'], "Lee, Parks and Johnson")
     
     def test_search_suppliers_country_and_phone_number(self):
         response = self.client.get(f"suppliers/search?country=Saint Martin&phoneNumber=001-733-291-8848x3542")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for city in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for city in response.json()["Items"]:
             self.assertEqual(city['Country'], "Saint Martin")
             self.assertEqual(city['Phonenumber'], "001-733-291-8848x3542")
     
     def test_search_suppliers_name_and_country(self):
         response = self.client.get(f"suppliers/search?name=Lee, Parks and Johnson&country=Czech Republic")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for country in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for country in response.json()["Items"]:
             self.assertEqual(country['Name'], "Lee, Parks and Johnson")
             self.assertEqual(country['Country'], "Czech Republic")
 
@@ -2,6 +2,7 @@ import httpx
 import unittest
 import json
 import os
+import journal_data
 from datetime import datetime
 
 class ApiTransfersTests(unittest.TestCase):
@@ -38,9 +39,19 @@ class ApiTransfersTests(unittest.TestCase):
 
     @classmethod
     def GetJsonData(cls, model):
-        with open(os.path.join(cls.data_root, f"{model}.json"), 'r') as file:
-            data = json.load(file)
-        return data
+        return journal_data.GetJsonData(cls.data_root, model)
+
+    def SearchAll(self, path, params):
+        found, cursor = [], None
+        while True:
+            response = self.client.get(path, params=dict(params, pageSize=100, **({"cursor": cursor} if cursor else {})))
+            if response.status_code == 204:
+                return found
+            self.assertEqual(response.status_code, 200)
+            found.extend(response.json()["Items"])
+            cursor = response.json().get("NextCursor")
+            if not cursor:
+                return found
     
     # GET tests
     def test_1get_all_transfers(self):
@@ -63,29 +74,29 @@ class ApiTransfersTests(unittest.TestCase):
     def test_search_transfers_transfer_from(self):
         response = self.client.get("transfers/search?transferfrom=9229")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for transfer in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for transfer in response.json()["Items"]:
             self.assertEqual(transfer['Transfer_From'], 9229)
     
     def test_search_transfers_transfer_to(self):
         response = self.client.get("transfers/search?transferto=9229")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for transfer in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for transfer in response.json()["Items"]:
             self.assertEqual(transfer['Transfer_To'], 9229)
     
     def test_search_transfers_transfer_status(self):
         response = self.client.get("transfers/search?transferstatus=Completed")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for transfer in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for transfer in response.json()["Items"]:
             self.assertEqual(transfer['Transfer_Status'], "Completed")
             
     def test_search_transfers_created_at(self):
         response = self.client.get("transfers/search?createdat=2000-03-11T13:11:14Z")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for transfer in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for transfer in response.json()["Items"]:
             self.assertEqual(transfer['Created_At'], "2000-03-11T13:11:14Z")
     
     def test_search_transfers_with_invalid_parameter(self):
@@ -96,23 +107,23 @@ class ApiTransfersTests(unittest.TestCase):
     def test_search_transfers_with_valid_and_invalid_parameter(self):
         response = self.client.get("transfers/search?transferstatus=Completed&invalid_param=invalid_value")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for transfer in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for transfer in response.json()["Items"]:
             self.assertEqual(transfer['Transfer_Status'], "Completed")
     
     def test_search_transfers_transfer_status_and_created_at(self):
         response = self.client.get("transfers/search?transferstatus=Completed&createdat=2000-03-11T13:11:14Z")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for x in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for x in response.json()["Items"]:
             self.assertEqual(x['Transfer_Status'], "Completed")
             self.assertEqual(x['Created_At'], "2000-03-11T13:11:14Z")
 
     def test_search_transfers_transfers_status_and_transfer_to(self):
         response = self.client.get("transfers/search?transferstatus=Completed&transferto=9229")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for x in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for x in response.json()["Items"]:
             self.assertEqual(x['Transfer_Status'], "Completed")
             self.assertEqual(x['Transfer_To'], 9229)
 
@@ -197,6 +208,21 @@ class ApiTransfersTests(unittest.TestCase):
         non_existent_transfer["Id"] = -1
         response = self.client.patch
 
+    #Commit tests
+    def test_bcommit_transfer_is_found_by_status(self):
+        last_id = self.GetJsonData("transfers")[-1]['Id']
+        response = self.client.put(f"transfers/{last_id}/commit")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get(f"transfers/{last_id}/status").text, "Processed")
+
+        transfers = self.SearchAll("transfers/search", {"transferStatus": "processed", "transferTo": self.new_transfer["Transfer_To"]})
+        self.assertIn(last_id, [transfer['Id'] for transfer in transfers])
+        for transfer in transfers:
+            self.assertEqual(transfer['Transfer_Status'], "Processed")
+
+        scheduled = self.SearchAll("transfers/search", {"transferStatus": "Scheduled", "transferTo": self.new_transfer["Transfer_To"]})
+        self.assertNotIn(last_id, [transfer['Id'] for transfer in scheduled])
+
     # DELETE tests
     def test_delete_transfer(self):
         last_id = self.GetJsonData("transfers")[-1]['Id']
@@ -2,6 +2,7 @@ import httpx
 import unittest
 import json
 import os
+import journal_data
 from datetime import datetime
 
 class ApiWarehousesTests(unittest.TestCase):
@@ -38,9 +39,7 @@ class ApiWarehousesTests(unittest.TestCase):
 
     @classmethod
     def GetJsonData(cls, model):
-        with open(os.path.join(cls.data_root, f"{model}.json"), 'r') as file:
-            data = json.load(file)
-        return data
+        return journal_data.GetJsonData(cls.data_root, model)
     
     # GET tests
     
@@ -60,36 +59,36 @@ class ApiWarehousesTests(unittest.TestCase):
     def test_search_warehouses_by_name(self):
         response = self.client.get(f"warehouses/search?name=Heemskerk cargo hub")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for item in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for item in response.json()["Items"]:
             self.assertEqual(item['Name'], "Heemskerk cargo hub")
     
     def test_search_warehouses_by_code(self):
         response = self.client.get(f"warehouses/search?code=YQZZNL56")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for item in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for item in response.json()["Items"]:
             self.assertEqual(item['Code'], "YQZZNL56")
 
     def test_search_warehouses_by_name(self):
         response = self.client.get(f"warehouses/search?name=Heemskerk cargo hub")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for item in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for item in response.json()["Items"]:
             self.assertEqual(item['Name'], "Heemskerk cargo hub")
     
     def test_search_warehouses_by_city(self):
         response = self.client.get(f"warehouses/search?city=Heemskerk")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for item in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for item in response.json()["Items"]:
             self.assertEqual(item['City'], "Heemskerk")
 
     def test_search_warehouses_by_country(self):
         response = self.client.get(f"warehouses/search?country=NL")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for response in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for response in response.json()["Items"]:
             self.assertEqual(response['Country'], "NL")
             
     def test_search_warehouses_with_invalid_parameter(self):
@@ -100,23 +99,23 @@ class ApiWarehousesTests(unittest.TestCase):
     def test_search_warehouses_with_valid_and_invalid_parameter(self):
         response = self.client.get("warehouses/search?code=YQZZNL56&invalid_param=invalid_value")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for warehouse in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for warehouse in response.json()["Items"]:
             self.assertEqual(warehouse['Code'], "YQZZNL56")
     
     def test_search_warehouses_by_code_and_country(self):
         response = self.client.get(f"warehouses/search?code=YQZZNL56&country=NL")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for response in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for response in response.json()["Items"]:
             self.assertEqual(response['Code'], "YQZZNL56")
             self.assertEqual(response['Country'], "NL")
     
     def test_search_warehouses_by_code_and_city(self):
         response = self.client.get(f"warehouses/search?code=YQZZNL56&city=Heemskerk")
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(len(response.json()) > 0, response.json())
-        for warehouse in response.json():
+        self.assertTrue(len(response.json()["Items"]) > 0, response.json()["Items"])
+        for warehouse in response.json()["Items"]:
             self.assertEqual(warehouse['Code'], "YQZZNL56")
             self.assertEqual(warehouse['City'], "Heemskerk")
             
@@ -1,4 +1,5 @@
 using System;
+using HelpersV2;
 
 public class Base
 {
@@ -11,4 +12,17 @@ public class Base
         return DateTime.UtcNow.ToString("yyyy-MM-dd HH:mm:ss");
     }
 
+    // Adds a record under the id supplied by the caller (v1 semantics) instead of allocating
+    // one. The pool's sequence is moved past that id first, so later allocations skip it.
+    protected static bool InsertWithId<TKey, T>(RecordIndex<TKey, T> records, DataJournal<T> journal, T record, Func<T, int> idOf) where T : class
+    {
+        lock (records.WriteLock)
+        {
+            journal.Sequence.Observe(idOf(record));
+            if (!records.Add(record)) return false;
+            journal.Add(record);
+            return true;
+        }
+    }
+
 }
@@ -3,6 +3,7 @@ using System.Collections.Generic;
 using System.IO;
 using System.Linq;
 using Newtonsoft.Json;
+using HelpersV2;
 using ProvidersV2;
 namespace ModelsV2;
 
@@ -26,64 +27,90 @@ public class Clients : Base
 {
     private string dataPath;
     private List<Client> data;
+    private DataJournal<Client> journal;
+    private RecordIndex<int?, Client> records;
+    // The pools whose records keep one of these from being deleted.
+    private static readonly string[] Dependents = { "orders" };
+    private RecordFilter<int?, Client> filters;
+    private TrigramIndex<int?> nameTrigrams;
+    private TrigramIndex<int?> addressTrigrams;
+    private TrigramIndex<int?> countryTrigrams;
+    private TrigramIndex<int?> contactNameTrigrams;
 
     public Clients(string rootPath, bool isDebug = false)
     {
         dataPath = Path.Combine(rootPath, "clients.json");
+        journal = new DataJournal<Client>(dataPath, x => x.Id.ToString(), () => data);
+        records = new RecordIndex<int?, Client>(x => x.Id);
+        nameTrigrams = records.AddTrigrams(x => x.Name);
+        addressTrigrams = records.AddTrigrams(x => x.Address);
+        countryTrigrams = records.AddTrigrams(x => x.Country);
+        contactNameTrigrams = records.AddTrigrams(x => x.Contact_name);
+        filters = new RecordFilter<int?, Client>(records)
+            .Index("Name", nameTrigrams)
+            .Index("Address", addressTrigrams)
+            .Index("Country", countryTrigrams)
+            .Index("Contact_name", contactNameTrigrams);
         Load(isDebug);
         bool test = data.Select(x => x.Id).ToList().Distinct().Count() == 9820;
     }
 
     public List<Client> GetClients()
     {
-        return data;
+        return records.InKeyOrder.ToList();
+    }
+
+    public PaginatedResponse<Client> GetClientsPage(int page, int pageSize, bool descending = false, string cursor = null, string filter = null, string sort = null)
+    {
+        if (filter != null || sort != null) return filters.Page(filter, sort, page, pageSize, descending, cursor);
+        return PaginationHelper.Paginate(records.Keys, records.Get, page, pageSize, descending, cursor);
     }
 
     public Client GetClient(int clientId)
     {
-        return data.Find(x => Convert.ToInt64(x.Id) == clientId);
+        return records.Get(clientId);
     }
 
-    public List<Client> SearchClients(string name = null, string address = null, string country = null, string contactName = null)
+    public IEnumerable<Client> SearchClients(string name = null, string address = null, string country = null, string contactName = null)
     {
         if (string.IsNullOrEmpty(name) && string.IsNullOrEmpty(country) && string.IsNullOrEmpty(address) && string.IsNullOrEmpty(country) && string.IsNullOrEmpty(contactName))
         {
             throw new ArgumentException("At least one search parameter must be provided.");
         }
 
-        var query = data.AsQueryable();
+        var query = new RecordQuery<int?, Client>(records);
         
         if (!string.IsNullOrEmpty(name))
         {
-            query = query.Where(client => client.Name.Contains(name, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(client => client.Name.Contains(name, StringComparison.OrdinalIgnoreCase), nameTrigrams.Lookup(name));
         }
 
         if (!string.IsNullOrEmpty(address))
         {
-            query = query.Where(client => client.Address.Contains(address, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(client => client.Address.Contains(address, StringComparison.OrdinalIgnoreCase), addressTrigrams.Lookup(address));
         }
 
         if (!string.IsNullOrEmpty(country))
         {
-            query = query.Where(client => client.Country.Contains(country, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(client => client.Country.Contains(country, StringComparison.OrdinalIgnoreCase), countryTrigrams.Lookup(country));
         }
 
         if (!string.IsNullOrEmpty(contactName))
         {
-            query = query.Where(client => client.Contact_name.Contains(contactName, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(client => client.Contact_name.Contains(contactName, StringComparison.OrdinalIgnoreCase), contactNameTrigrams.Lookup(contactName));
         }
         
-        if (query.Count() == 0)
+        if (!query.Any())
         {
             throw new ArgumentException("No clients found.");
         }
 
-        return query.ToList();
+        return query;
     }
 
     public int GetNextAvailableId()
     {
-        return data.Count > 0 ? data.Max(c => (int)c.Id) + 1 : 1;
+        return journal.Sequence.Next();
     }
 
     public bool AddClient(Client client)
@@ -91,52 +118,75 @@ public class Clients : Base
         client.Id = GetNextAvailableId();
         if (client.Created_at == null) client.Created_at = GetTimestamp();
         if (client.Updated_at == null) client.Updated_at = GetTimestamp();
-        data.Add(client);
+        if (!records.Add(client)) return false;
+        journal.Add(client);
         return true;
     }
 
-    public bool UpdateClient(int clientId, Client client)
+    public bool InsertClient(Client client)
     {
-        client.Updated_at = GetTimestamp();
-        var index = data.FindIndex(existingClient => existingClient.Id == clientId);
+        if (client.Created_at == null) client.Created_at = GetTimestamp();
+        if (client.Updated_at == null) client.Updated_at = GetTimestamp();
+        return InsertWithId(records, journal, client, x => (int)x.Id);
+    }
 
-        if (index >= 0)
+    public bool UpdateClient(int clientId, Client client)
+    {
+        lock (records.WriteLock)
         {
-            client.Id = data[index].Id;
-            client.Created_at = data[index].Created_at;
-            data[index] = client;
-            return true;
+            client.Updated_at = GetTimestamp();
+            var index = records.IndexOf(clientId);
+
+            if (index >= 0)
+            {
+                client.Id = data[index].Id;
+                client.Created_at = data[index].Created_at;
+                records.Replace(index, client);
+                journal.Replace(client);
+                return true;
+            }
+            return false;
         }
-        return false;
     }
 
     public bool ReplaceClient(int clientId, Client newClientData)
     { 
+        lock (records.WriteLock)
+        {
         
 
-        var index = data.FindIndex(existingClient => existingClient.Id == clientId);
-        var existingClient = data.FirstOrDefault(existingClient => existingClient.Id == clientId);
+            var index = records.IndexOf(clientId);
+            var existingClient = records.Get(clientId);
 
-        if (index < 0)
-        {
+            if (index < 0)
+            {
 
-            return false;
+                return false;
 
-        }
+            }
 
-        if (!string.IsNullOrEmpty(newClientData.Name)) existingClient.Name = newClientData.Name;
-        if (!string.IsNullOrEmpty(newClientData.Address)) existingClient.Address = newClientData.Address;
-        if (!string.IsNullOrEmpty(newClientData.City)) existingClient.City = newClientData.City;
-        if (!string.IsNullOrEmpty(newClientData.Zip_code)) existingClient.Zip_code = newClientData.Zip_code;
-        if (!string.IsNullOrEmpty(newClientData.Province)) existingClient.Province = newClientData.Province;
-        if (!string.IsNullOrEmpty(newClientData.Country)) existingClient.Country = newClientData.Country;
-        if (!string.IsNullOrEmpty(newClientData.Contact_name)) existingClient.Contact_name = newClientData.Contact_name;
-        if (!string.IsNullOrEmpty(newClientData.Contact_phone)) existingClient.Contact_phone = newClientData.Contact_phone;
-        if (!string.IsNullOrEmpty(newClientData.Contact_email)) existingClient.Contact_email = newClientData.Contact_email;
-        existingClient.Updated_at = GetTimestamp();
+            if (!string.IsNullOrEmpty(newClientData.Name)) existingClient.Name = newClientData.Name;
+            if (!string.IsNullOrEmpty(newClientData.Address)) existingClient.Address = newClientData.Address;
+            if (!string.IsNullOrEmpty(newClientData.City)) existingClient.City = newClientData.City;
+            if (!string.IsNullOrEmpty(newClientData.Zip_code)) existingClient.Zip_code = newClientData.Zip_code;
+            if (!string.IsNullOrEmpty(newClientData.Province)) existingClient.Province = newClientData.Province;
+            if (!string.IsNullOrEmpty(newClientData.Country)) existingClient.Country = newClientData.Country;
+            if (!string.IsNullOrEmpty(newClientData.Contact_name)) existingClient.Contact_name = newClientData.Contact_name;
+            if (!string.IsNullOrEmpty(newClientData.Contact_phone)) existingClient.Contact_phone = newClientData.Contact_phone;
+            if (!string.IsNullOrEmpty(newClientData.Contact_email)) existingClient.Contact_email = newClientData.Contact_email;
+            existingClient.Updated_at = GetTimestamp();
+            records.Refresh(existingClient);
+            journal.Replace(existingClient);
     
-        return true;
+            return true;
 
+        }
+    }
+
+    // The records that keep a client from being deleted, by pool.
+    public Dictionary<string, List<string>> GetClientDependents(int clientId)
+    {
+        return DataProvider.References.GetReferrers("clients", clientId, Dependents);
     }
 
     public bool RemoveClient(int clientId, bool force = false)
@@ -144,16 +194,24 @@ public class Clients : Base
         var client = GetClient(clientId);
         if (client == null) return false;
 
-        var orders = DataProvider.fetch_order_pool().GetOrders();
+        if (force) return Delete(client);
 
-        if (force) return data.Remove(client);
-        
-        if (orders.Any(order => order.Ship_To == clientId || order.Bill_To == clientId))
+        if (DataProvider.References.IsReferenced("clients", clientId, Dependents))
         {
             return false;
         }
 
-        return data.Remove(client);
+        return Delete(client);
+    }
+
+    private bool Delete(Client client)
+    {
+        lock (records.WriteLock)
+        {
+            if (!records.Remove(client)) return false;
+            journal.Remove(client);
+            return true;
+        }
     }
 
     private void Load(bool isDebug)
@@ -164,21 +222,15 @@ public class Clients : Base
         }
         else
         {
-            using (var reader = new StreamReader(dataPath))
-            {
-                var json = reader.ReadToEnd();
-                data = JsonConvert.DeserializeObject<List<Client>>(json);
-            }
+            data = journal.Load();
         }
+        records.Load(data);
+        journal.Sequence.Seed(data.Count > 0 ? data.Max(x => x.Id ?? 0) + 1 : 1);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(dataPath))
-        {
-            var json = JsonConvert.SerializeObject(data, Formatting.Indented);
-            writer.Write(json);
-        }
+        DataProvider.Commit(journal);
     }
 }
 
@@ -1,8 +1,10 @@
 using System;
 using System.Collections.Generic;
 using System.IO;
+using System.Linq;
 using System.Text.Json;
 using Newtonsoft.Json;
+using HelpersV2;
 using ProvidersV2;
 namespace ModelsV2;
 
@@ -22,127 +24,315 @@ public class Inventory
     public string? Updated_At { get; set; }
 }
 
+// What a user restricted to a set of warehouses can see: the inventories with a location
+// in one of those warehouses and the items they hold.
+public class WarehouseView
+{
+    public HashSet<int> Warehouses { get; }
+    public SortedSet<int?> InventoryIds { get; } = new SortedSet<int?>();
+    public SortedSet<string> ItemIds { get; } = new SortedSet<string>(StringComparer.Ordinal);
+    internal Dictionary<int?, string> Members { get; } = new Dictionary<int?, string>();
+    internal Dictionary<string, int> ItemCounts { get; } = new Dictionary<string, int>();
+
+    public WarehouseView(IEnumerable<int> warehouses)
+    {
+        Warehouses = new HashSet<int>(warehouses);
+    }
+}
+
 public class Inventories : Base
 {
     private string _dataPath;
     private List<Inventory> _data;
+    private DataJournal<Inventory> _journal;
+    private RecordIndex<int?, Inventory> _records;
+    private RecordFilter<int?, Inventory> _filters;
+    private SecondaryIndex<string, int?> _byItem;
+    private SecondaryIndex<int, int?> _byLocation;
+    private RunningTotals<string, int?> _itemTotals;
+    private readonly Dictionary<string, WarehouseView> _views = new Dictionary<string, WarehouseView>();
 
     public Inventories(string rootPath, bool isDebug = false)
     {
         _dataPath = Path.Combine(rootPath, "inventories.json");
+        _journal = new DataJournal<Inventory>(_dataPath, x => x.Id.ToString(), () => _data);
+        _records = new RecordIndex<int?, Inventory>(x => x.Id);
+        _byItem = _records.AddIndex(x => x.Item_Id);
+        _byLocation = _records.AddMultiIndex(x => x.Locations);
+        _itemTotals = _records.AddTotals(x => x.Item_Id, x => new[] { x.Total_Expected, x.Total_Ordered, x.Total_Allocated, x.Total_Available }, 4);
+        _records.AddObserver(UpdateViews, ClearViews);
+        _filters = new RecordFilter<int?, Inventory>(_records)
+            .Index("Item_Id", _byItem);
         Load(isDebug);
     }
 
     public List<Inventory> GetInventories()
     {
-        return _data;
+        return _records.InKeyOrder.ToList();
+    }
+
+    public PaginatedResponse<Inventory> GetInventoriesPage(int page, int pageSize, bool descending = false, string cursor = null, string filter = null, string sort = null, SortedSet<int?> scope = null)
+    {
+        if (filter != null || sort != null || scope != null) return _filters.Page(filter, sort, page, pageSize, descending, cursor, scope);
+        return PaginationHelper.Paginate(_records.Keys, _records.Get, page, pageSize, descending, cursor);
     }
 
     public Inventory GetInventory(int inventoryId)
     {
-        return _data.Find(x => x.Id == inventoryId);
+        return _records.Get(inventoryId);
     }
 
     public List<Inventory> GetInventoriesForItem(string itemId)
     {
-        return _data.FindAll(x => x.Item_Id == itemId);
+        return _records.GetMany(_byItem.Get(itemId));
     }
 
-    public Dictionary<string, int> GetInventoryTotalsForItem(string itemId)
+    public List<Inventory> GetInventoriesForLocation(int locationId)
+    {
+        return _records.GetMany(_byLocation.Get(locationId));
+    }
+
+    public bool HasInventoriesForLocation(int locationId)
     {
-        var result = new Dictionary<string, int>
+        return _byLocation.Any(locationId);
+    }
+
+    // Views are built on first use per warehouse set and kept up to date from then on,
+    // both here and, through RefreshLocation, when a location moves or disappears. Callers
+    // get a copy taken under the lock, since those updates can run while they page.
+    public SortedSet<int?> GetInventoryIdsInWarehouses(IEnumerable<int> warehouses)
+    {
+        lock (_views) return new SortedSet<int?>(GetWarehouseView(warehouses).InventoryIds);
+    }
+
+    public SortedSet<string> GetItemIdsInWarehouses(IEnumerable<int> warehouses)
+    {
+        lock (_views) return new SortedSet<string>(GetWarehouseView(warehouses).ItemIds, StringComparer.Ordinal);
+    }
+
+    // Callers hold the _views lock.
+    private WarehouseView GetWarehouseView(IEnumerable<int> warehouses)
+    {
+        var ids = warehouses.Distinct().OrderBy(x => x).ToList();
+        var name = string.Join(",", ids);
+        if (_views.TryGetValue(name, out var view)) return view;
+
+        view = new WarehouseView(ids);
+        var locations = DataProvider.fetch_location_pool();
+        foreach (var warehouseId in ids)
         {
-            { "total_expected", 0 },
-            { "total_ordered", 0 },
-            { "total_allocated", 0 },
-            { "total_available", 0 }
-        };
+            foreach (var location in locations.GetLocationsInWarehouse(warehouseId))
+            {
+                foreach (var inventory in GetInventoriesForLocation((int)location.Id)) UpdateView(view, inventory.Id, inventory);
+            }
+        }
+        _views[name] = view;
+        return view;
+    }
 
-        foreach (var x in _data)
+    public void RefreshLocation(int locationId)
+    {
+        lock (_views)
         {
-            if (x.Item_Id == itemId)
+            if (_views.Count == 0) return;
+            foreach (var inventory in GetInventoriesForLocation(locationId)) UpdateViews(inventory.Id, inventory);
+        }
+    }
+
+    private void UpdateViews(int? inventoryId, Inventory? inventory)
+    {
+        lock (_views)
+        {
+            foreach (var view in _views.Values) UpdateView(view, inventoryId, inventory);
+        }
+    }
+
+    private void ClearViews()
+    {
+        lock (_views) _views.Clear();
+    }
+
+    private static void UpdateView(WarehouseView view, int? inventoryId, Inventory? inventory)
+    {
+        if (view.Members.Remove(inventoryId, out var oldItemId))
+        {
+            view.InventoryIds.Remove(inventoryId);
+            if (oldItemId != null && --view.ItemCounts[oldItemId] == 0)
             {
-                result["total_expected"] += Convert.ToInt32(x.Total_Expected);
-                result["total_ordered"] += Convert.ToInt32(x.Total_Ordered);
-                result["total_allocated"] += Convert.ToInt32(x.Total_Allocated);
-                result["total_available"] += Convert.ToInt32(x.Total_Available);
+                view.ItemCounts.Remove(oldItemId);
+                view.ItemIds.Remove(oldItemId);
             }
         }
+        if (inventory == null || inventory.Locations == null) return;
+
+        var locations = DataProvider.fetch_location_pool();
+        if (!inventory.Locations.Any(id => locations.GetLocation(id) is Location location && view.Warehouses.Contains(location.Warehouse_Id))) return;
+
+        view.Members[inventoryId] = inventory.Item_Id;
+        view.InventoryIds.Add(inventoryId);
+        if (inventory.Item_Id != null)
+        {
+            view.ItemCounts[inventory.Item_Id] = view.ItemCounts.GetValueOrDefault(inventory.Item_Id) + 1;
+            view.ItemIds.Add(inventory.Item_Id);
+        }
+    }
 
-        return result;
+    public Dictionary<string, int> GetInventoryTotalsForItem(string itemId)
+    {
+        var totals = _itemTotals.Get(itemId);
+        return new Dictionary<string, int>
+        {
+            { "total_expected", (int)totals[0] },
+            { "total_ordered", (int)totals[1] },
+            { "total_allocated", (int)totals[2] },
+            { "total_available", (int)totals[3] }
+        };
     }
 
     public bool AddInventory(Inventory inventory)
     {
-        if (DataProvider.fetch_item_pool().GetItems().Any(x => x.Uid == inventory.Item_Id) && !DataProvider.fetch_item_pool().GetItems().Any(x => x.Uid == inventory.Item_Id && x.Code == inventory.Item_Reference)) return false;
-        inventory.Id = _data.Count > 0 ? _data.Max(i => i.Id) + 1 : 1;
+        if (!MatchesItem(inventory.Item_Id, inventory.Item_Reference)) return false;
+        inventory.Id = _journal.Sequence.Next();
         if (inventory.Created_At == null) inventory.Created_At = GetTimestamp();
         if (inventory.Updated_At == null) inventory.Updated_At = GetTimestamp();
-        _data.Add(inventory);
+        if (!_records.Add(inventory)) return false;
+        _journal.Add(inventory);
         return true;
     }
 
-    public bool UpdateInventory(int inventoryId, Inventory inventory)
+    public bool InsertInventory(Inventory inventory)
+    {
+        if (inventory.Created_At == null) inventory.Created_At = GetTimestamp();
+        if (inventory.Updated_At == null) inventory.Updated_At = GetTimestamp();
+        return InsertWithId(_records, _journal, inventory, x => (int)x.Id);
+    }
+
+    // Replaces the stored record as-is, without the defaults UpdateInventory applies.
+    public bool OverwriteInventory(int inventoryId, Inventory inventory)
     {
-        if (DataProvider.fetch_item_pool().GetItems().Any(x => x.Uid == inventory.Item_Id) && !DataProvider.fetch_item_pool().GetItems().Any(x => x.Uid == inventory.Item_Id && x.Code == inventory.Item_Reference)) return false;
-        inventory.Updated_At = GetTimestamp();
-        var index = _data.FindIndex(x => x.Id == inventoryId);
-        if (index >= 0)
+        lock (_records.WriteLock)
         {
-            inventory.Id = _data[index].Id;
+            var index = _records.IndexOf(inventoryId);
+            if (index < 0) return false;
+
+            inventory.Updated_At = GetTimestamp();
             inventory.Created_At = _data[index].Created_At;
-            _data[index] = inventory;
+            _records.Replace(index, inventory);
+            _journal.Replace(inventory);
             return true;
         }
-
-        return false;
     }
-    
-    public bool ReplaceInventory(int inventoryId, Inventory newInventoryData)
-    {
-        var index = _data.FindIndex(existingInventory => existingInventory.Id == inventoryId);
-        var existingInventory = _data.FirstOrDefault(existingInventory => existingInventory.Id == inventoryId);
 
-        if (index < 0)
+    public bool UpdateInventory(int inventoryId, Inventory inventory)
+    {
+        lock (_records.WriteLock)
         {
+            if (!MatchesItem(inventory.Item_Id, inventory.Item_Reference)) return false;
+            inventory.Updated_At = GetTimestamp();
+            var index = _records.IndexOf(inventoryId);
+            if (index >= 0)
+            {
+                inventory.Id = _data[index].Id;
+                inventory.Created_At = _data[index].Created_At;
+                _records.Replace(index, inventory);
+                _journal.Replace(inventory);
+                return true;
+            }
 
             return false;
-
         }
+    }
 
-        if (!string.IsNullOrEmpty(newInventoryData.Item_Id) || !string.IsNullOrEmpty(newInventoryData.Item_Reference))
+    // Changes Total_On_Hand of several inventories as one step: when one of them cannot be
+    // updated, the ones already changed get their old amount back and false is returned.
+    public bool AdjustOnHand(List<(Inventory Inventory, int Delta)> changes)
+    {
+        lock (_records.WriteLock)
         {
-            string itemIdToCheck = !string.IsNullOrEmpty(newInventoryData.Item_Id) ? newInventoryData.Item_Id : existingInventory.Item_Id;
-            string itemReferenceToCheck = !string.IsNullOrEmpty(newInventoryData.Item_Reference) ? newInventoryData.Item_Reference : existingInventory.Item_Reference;
-            if (DataProvider.fetch_item_pool().GetItems().Any(x => x.Uid == itemIdToCheck) && 
-                !DataProvider.fetch_item_pool().GetItems().Any(x => x.Uid == itemIdToCheck && x.Code == itemReferenceToCheck))
+            for (int i = 0; i < changes.Count; i++)
             {
+                var (inventory, delta) = changes[i];
+                inventory.Total_On_Hand += delta;
+                if (UpdateInventory((int)inventory.Id, inventory)) continue;
+
+                inventory.Total_On_Hand -= delta;
+                for (int j = i - 1; j >= 0; j--)
+                {
+                    changes[j].Inventory.Total_On_Hand -= changes[j].Delta;
+                    UpdateInventory((int)changes[j].Inventory.Id, changes[j].Inventory);
+                }
                 return false;
             }
+            return true;
         }
+    }
 
-        if (!string.IsNullOrEmpty(newInventoryData.Item_Id)) existingInventory.Item_Id = newInventoryData.Item_Id;
-        if (!string.IsNullOrEmpty(newInventoryData.Description)) existingInventory.Description = newInventoryData.Description;
-        if (!string.IsNullOrEmpty(newInventoryData.Item_Reference)) existingInventory.Item_Reference = newInventoryData.Item_Reference;
-        if (newInventoryData.Locations != null && newInventoryData.Locations.Count > 0) existingInventory.Locations = newInventoryData.Locations;
-        if (newInventoryData.Total_On_Hand != 0) existingInventory.Total_On_Hand = newInventoryData.Total_On_Hand;
-        if (newInventoryData.Total_Expected != 0) existingInventory.Total_Expected = newInventoryData.Total_Expected;
-        if (newInventoryData.Total_Ordered != 0) existingInventory.Total_Ordered = newInventoryData.Total_Ordered;
-        if (newInventoryData.Total_Allocated != 0) existingInventory.Total_Allocated = newInventoryData.Total_Allocated;
-        if (newInventoryData.Total_Available != 0) existingInventory.Total_Available = newInventoryData.Total_Available;
-        existingInventory.Updated_At = GetTimestamp();
+    public bool ReplaceInventory(int inventoryId, Inventory newInventoryData)
+    {
+        lock (_records.WriteLock)
+        {
+            var index = _records.IndexOf(inventoryId);
+            var existingInventory = _records.Get(inventoryId);
 
-        return true;
+            if (index < 0)
+            {
+
+                return false;
+
+            }
+
+            if (!string.IsNullOrEmpty(newInventoryData.Item_Id) || !string.IsNullOrEmpty(newInventoryData.Item_Reference))
+            {
+                string itemIdToCheck = !string.IsNullOrEmpty(newInventoryData.Item_Id) ? newInventoryData.Item_Id : existingInventory.Item_Id;
+                string itemReferenceToCheck = !string.IsNullOrEmpty(newInventoryData.Item_Reference) ? newInventoryData.Item_Reference : existingInventory.Item_Reference;
+                if (!MatchesItem(itemIdToCheck, itemReferenceToCheck))
+                {
+                    return false;
+                }
+            }
+
+            if (!string.IsNullOrEmpty(newInventoryData.Item_Id)) existingInventory.Item_Id = newInventoryData.Item_Id;
+            if (!string.IsNullOrEmpty(newInventoryData.Description)) existingInventory.Description = newInventoryData.Description;
+            if (!string.IsNullOrEmpty(newInventoryData.Item_Reference)) existingInventory.Item_Reference = newInventoryData.Item_Reference;
+            if (newInventoryData.Locations != null && newInventoryData.Locations.Count > 0) existingInventory.Locations = newInventoryData.Locations;
+            if (newInventoryData.Total_On_Hand != 0) existingInventory.Total_On_Hand = newInventoryData.Total_On_Hand;
+            if (newInventoryData.Total_Expected != 0) existingInventory.Total_Expected = newInventoryData.Total_Expected;
+            if (newInventoryData.Total_Ordered != 0) existingInventory.Total_Ordered = newInventoryData.Total_Ordered;
+            if (newInventoryData.Total_Allocated != 0) existingInventory.Total_Allocated = newInventoryData.Total_Allocated;
+            if (newInventoryData.Total_Available != 0) existingInventory.Total_Available = newInventoryData.Total_Available;
+            existingInventory.Updated_At = GetTimestamp();
+            _records.Refresh(existingInventory);
+            _journal.Replace(existingInventory);
+
+            return true;
+        }
     }
 
     public bool RemoveInventory(int inventoryId, bool force = false)
     {
         var inventory = GetInventory(inventoryId);
         if (inventory == null) return false;
-        if (force) return _data.Remove(inventory);
+        if (force) return Delete(inventory);
         if (DataProvider.fetch_item_pool().GetItem(inventory.Item_Id) != null) return false;
 
-        return _data.Remove(inventory);
+        return Delete(inventory);
+    }
+
+    // An inventory may point at an unknown item, but not at a known item under another code.
+    private static bool MatchesItem(string itemId, string itemReference)
+    {
+        var item = DataProvider.fetch_item_pool().GetItem(itemId);
+        return item == null || item.Code == itemReference;
+    }
+
+    private bool Delete(Inventory inventory)
+    {
+        lock (_records.WriteLock)
+        {
+            if (!_records.Remove(inventory)) return false;
+            _journal.Remove(inventory);
+            return true;
+        }
     }
 
     private void Load(bool isDebug)
@@ -153,21 +343,15 @@ public class Inventories : Base
         }
         else
         {
-            using (var reader = new StreamReader(_dataPath))
-            {
-                var json = reader.ReadToEnd();
-                _data = JsonConvert.DeserializeObject<List<Inventory>>(json);
-            }
+            _data = _journal.Load();
         }
+        _records.Load(_data);
+        _journal.Sequence.Seed(_data.Count > 0 ? _data.Max(x => x.Id ?? 0) + 1 : 1);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(_dataPath))
-        {
-            var json = JsonConvert.SerializeObject(_data, Formatting.Indented);
-            writer.Write(json);
-        }
+        DataProvider.Commit(_journal);
     }
 }
 
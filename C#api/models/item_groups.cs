@@ -1,8 +1,10 @@
 using System;
 using System.Collections.Generic;
 using System.IO;
+using System.Linq;
 using System.Text.Json;
 using Newtonsoft.Json;
+using HelpersV2;
 using ProvidersV2;
 namespace ModelsV2;
 
@@ -19,76 +21,113 @@ public class ItemGroups : Base
 {
     private readonly string _dataPath;
     private List<ItemGroup> _data;
+    private DataJournal<ItemGroup> _journal;
+    private RecordIndex<int?, ItemGroup> _records;
+    private RecordFilter<int?, ItemGroup> _filters;
 
     public ItemGroups(string rootPath, bool isDebug = false)
     {
         _dataPath = Path.Combine(rootPath, "item_groups.json");
+        _journal = new DataJournal<ItemGroup>(_dataPath, x => x.Id.ToString(), () => _data);
+        _records = new RecordIndex<int?, ItemGroup>(x => x.Id);
+        _filters = new RecordFilter<int?, ItemGroup>(_records);
         Load(isDebug);
     }
 
     public List<ItemGroup> GetItemGroups()
     {
-        return _data;
+        return _records.InKeyOrder.ToList();
+    }
+
+    public PaginatedResponse<ItemGroup> GetItemGroupsPage(int page, int pageSize, bool descending = false, string cursor = null, string filter = null, string sort = null)
+    {
+        if (filter != null || sort != null) return _filters.Page(filter, sort, page, pageSize, descending, cursor);
+        return PaginationHelper.Paginate(_records.Keys, _records.Get, page, pageSize, descending, cursor);
     }
 
     public ItemGroup GetItemGroup(int itemGroupId)
     {
-        return _data.Find(x => x.Id == itemGroupId);
+        return _records.Get(itemGroupId);
     }
 
     public bool AddItemGroup(ItemGroup itemGroup)
     {
 
-        itemGroup.Id = _data.Count > 0 ? _data.Max(ig => ig.Id) + 1 : 1;
+        itemGroup.Id = _journal.Sequence.Next();
         if (itemGroup.Created_At == null) itemGroup.Created_At = GetTimestamp();
         if (itemGroup.Updated_At == null) itemGroup.Updated_At = GetTimestamp();
-        _data.Add(itemGroup);
+        if (!_records.Add(itemGroup)) return false;
+        _journal.Add(itemGroup);
         return true;
     }
 
+    public bool InsertItemGroup(ItemGroup itemGroup)
+    {
+        if (itemGroup.Created_At == null) itemGroup.Created_At = GetTimestamp();
+        if (itemGroup.Updated_At == null) itemGroup.Updated_At = GetTimestamp();
+        return InsertWithId(_records, _journal, itemGroup, x => (int)x.Id);
+    }
+
     public bool UpdateItemGroup(int itemGroupId, ItemGroup itemGroup)
     {
-        itemGroup.Updated_At = GetTimestamp();
-        var index = _data.FindIndex(x => x.Id == itemGroupId);
-        if (index >= 0)
+        lock (_records.WriteLock)
         {
-            itemGroup.Id = _data[index].Id;
-            itemGroup.Created_At = _data[index].Created_At;
-            _data[index] = itemGroup;
-            return true;
-        }
+            itemGroup.Updated_At = GetTimestamp();
+            var index = _records.IndexOf(itemGroupId);
+            if (index >= 0)
+            {
+                itemGroup.Id = _data[index].Id;
+                itemGroup.Created_At = _data[index].Created_At;
+                _records.Replace(index, itemGroup);
+                _journal.Replace(itemGroup);
+                return true;
+            }
 
-        return false;
+            return false;
+        }
     }
 
     public bool ReplaceItemGroup(int itemGroupId, ItemGroup newItemGroup)
     {
-        var index = _data.FindIndex(existingItemGroup => existingItemGroup.Id == itemGroupId);
-        var existingItemGroup = _data.FirstOrDefault(existingItemGroup => existingItemGroup.Id == itemGroupId);
-
-        if (index < 0)
+        lock (_records.WriteLock)
         {
+            var index = _records.IndexOf(itemGroupId);
+            var existingItemGroup = _records.Get(itemGroupId);
 
-            return false;
+            if (index < 0)
+            {
 
-        }
+                return false;
+
+            }
 
-        if (!string.IsNullOrEmpty(newItemGroup.Name)) existingItemGroup.Name = newItemGroup.Name;
-        if (!string.IsNullOrEmpty(newItemGroup.Description)) existingItemGroup.Description = newItemGroup.Description;
-        existingItemGroup.Updated_At = GetTimestamp();
+            if (!string.IsNullOrEmpty(newItemGroup.Name)) existingItemGroup.Name = newItemGroup.Name;
+            if (!string.IsNullOrEmpty(newItemGroup.Description)) existingItemGroup.Description = newItemGroup.Description;
+            existingItemGroup.Updated_At = GetTimestamp();
+            _journal.Replace(existingItemGroup);
 
-        return true;
+            return true;
+        }
     }
 
     public bool RemoveItemGroup(int itemGroupId, bool force = false)
     {
         var itemGroup = GetItemGroup(itemGroupId);
         if (itemGroup == null) return false;
-        if (force) return _data.Remove(itemGroup);
-        var items = DataProvider.fetch_item_pool().GetItemsForItemGroup(itemGroupId);
-        if (items.Count() != 0) return false;
+        if (force) return Delete(itemGroup);
+        if (DataProvider.fetch_item_pool().HasItemsForItemGroup(itemGroupId)) return false;
+
+        return Delete(itemGroup);
+    }
 
-        return _data.Remove(itemGroup);
+    private bool Delete(ItemGroup itemGroup)
+    {
+        lock (_records.WriteLock)
+        {
+            if (!_records.Remove(itemGroup)) return false;
+            _journal.Remove(itemGroup);
+            return true;
+        }
     }
 
     private void Load(bool isDebug)
@@ -99,20 +138,14 @@ public class ItemGroups : Base
         }
         else
         {
-            using (var reader = new StreamReader(_dataPath))
-            {
-                var json = reader.ReadToEnd();
-                _data = JsonConvert.DeserializeObject<List<ItemGroup>>(json);
-            }
+            _data = _journal.Load();
         }
+        _records.Load(_data);
+        _journal.Sequence.Seed(_data.Count > 0 ? _data.Max(x => x.Id ?? 0) + 1 : 1);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(_dataPath))
-        {
-            var json = JsonConvert.SerializeObject(_data, Formatting.Indented);
-            writer.Write(json);
-        }
+        DataProvider.Commit(_journal);
     }
 }
@@ -1,8 +1,10 @@
 using System;
 using System.Collections.Generic;
 using System.IO;
+using System.Linq;
 using System.Text.Json;
 using Newtonsoft.Json;
+using HelpersV2;
 using ProvidersV2;
 namespace ModelsV2;
 
@@ -20,75 +22,112 @@ public class ItemLines : Base
 {
     private readonly string _dataPath;
     private List<ItemLine> _data;
+    private DataJournal<ItemLine> _journal;
+    private RecordIndex<int?, ItemLine> _records;
+    private RecordFilter<int?, ItemLine> _filters;
 
     public ItemLines(string rootPath, bool isDebug = false)
     {
         _dataPath = Path.Combine(rootPath, "item_lines.json");
+        _journal = new DataJournal<ItemLine>(_dataPath, x => x.Id.ToString(), () => _data);
+        _records = new RecordIndex<int?, ItemLine>(x => x.Id);
+        _filters = new RecordFilter<int?, ItemLine>(_records);
         Load(isDebug);
     }
 
     public List<ItemLine> GetItemLines()
     {
-        return _data;
+        return _records.InKeyOrder.ToList();
+    }
+
+    public PaginatedResponse<ItemLine> GetItemLinesPage(int page, int pageSize, bool descending = false, string cursor = null, string filter = null, string sort = null)
+    {
+        if (filter != null || sort != null) return _filters.Page(filter, sort, page, pageSize, descending, cursor);
+        return PaginationHelper.Paginate(_records.Keys, _records.Get, page, pageSize, descending, cursor);
     }
 
     public ItemLine GetItemLine(int itemlineId)
     {
-        return _data.Find(x => x.Id == itemlineId);
+        return _records.Get(itemlineId);
     }
 
     public bool AddItemline(ItemLine itemline)
     {
-        itemline.Id = _data.Count > 0 ? _data.Max(il => il.Id) + 1 : 1;
+        itemline.Id = _journal.Sequence.Next();
         if (itemline.Created_At == null) itemline.Created_At = GetTimestamp();
         if (itemline.Updated_At == null) itemline.Updated_At = GetTimestamp();
-        _data.Add(itemline);
+        if (!_records.Add(itemline)) return false;
+        _journal.Add(itemline);
         return true;
     }
 
+    public bool InsertItemline(ItemLine itemline)
+    {
+        if (itemline.Created_At == null) itemline.Created_At = GetTimestamp();
+        if (itemline.Updated_At == null) itemline.Updated_At = GetTimestamp();
+        return InsertWithId(_records, _journal, itemline, x => (int)x.Id);
+    }
+
     public bool UpdateItemline(int itemlineId, ItemLine itemline)
     {
-        itemline.Updated_At = GetTimestamp();
-        var index = _data.FindIndex(x => x.Id == itemlineId);
-        if (index >= 0)
+        lock (_records.WriteLock)
         {
-            itemline.Id = _data[index].Id;
-            itemline.Created_At = _data[index].Created_At;
-            _data[index] = itemline;
-            return true;
-        }
+            itemline.Updated_At = GetTimestamp();
+            var index = _records.IndexOf(itemlineId);
+            if (index >= 0)
+            {
+                itemline.Id = _data[index].Id;
+                itemline.Created_At = _data[index].Created_At;
+                _records.Replace(index, itemline);
+                _journal.Replace(itemline);
+                return true;
+            }
 
-        return false;
+            return false;
+        }
     }
 
     public bool ReplaceItemLine(int itemLineId , ItemLine newItemLine)
     {
-        var index = _data.FindIndex(existingItemLine => existingItemLine.Id == itemLineId);
-        var existingItemLine = _data.FirstOrDefault(existingItemLine => existingItemLine.Id == itemLineId);
-
-        if (index < 0)
+        lock (_records.WriteLock)
         {
+            var index = _records.IndexOf(itemLineId);
+            var existingItemLine = _records.Get(itemLineId);
 
-            return false;
+            if (index < 0)
+            {
 
-        }
+                return false;
+
+            }
 
-        if (!string.IsNullOrEmpty(newItemLine.Name)) existingItemLine.Name = newItemLine.Name;
-        if (!string.IsNullOrEmpty(newItemLine.Description)) existingItemLine.Description = newItemLine.Description;
-        existingItemLine.Updated_At = GetTimestamp();
+            if (!string.IsNullOrEmpty(newItemLine.Name)) existingItemLine.Name = newItemLine.Name;
+            if (!string.IsNullOrEmpty(newItemLine.Description)) existingItemLine.Description = newItemLine.Description;
+            existingItemLine.Updated_At = GetTimestamp();
+            _journal.Replace(existingItemLine);
 
-        return true;
+            return true;
+        }
     }
 
     public bool RemoveItemline(int itemlineId, bool force = false)
     {
         var itemline = GetItemLine(itemlineId);
         if (itemline == null) return false;
-        if (force) return _data.Remove(itemline);
-        var items = DataProvider.fetch_item_pool().GetItemsForItemLine(itemlineId);
-        if (items.Count() != 0) return false;
+        if (force) return Delete(itemline);
+        if (DataProvider.fetch_item_pool().HasItemsForItemLine(itemlineId)) return false;
+
+        return Delete(itemline);
+    }
 
-        return _data.Remove(itemline);
+    private bool Delete(ItemLine itemLine)
+    {
+        lock (_records.WriteLock)
+        {
+            if (!_records.Remove(itemLine)) return false;
+            _journal.Remove(itemLine);
+            return true;
+        }
     }
 
     private void Load(bool isDebug)
@@ -99,20 +138,14 @@ public class ItemLines : Base
         }
         else
         {
-            using (var reader = new StreamReader(_dataPath))
-            {
-                var json = reader.ReadToEnd();
-                _data = JsonConvert.DeserializeObject<List<ItemLine>>(json);
-            }
+            _data = _journal.Load();
         }
+        _records.Load(_data);
+        _journal.Sequence.Seed(_data.Count > 0 ? _data.Max(x => x.Id ?? 0) + 1 : 1);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(_dataPath))
-        {
-            var json = JsonConvert.SerializeObject(_data, Formatting.Indented);
-            writer.Write(json);
-        }
+        DataProvider.Commit(_journal);
     }
 }
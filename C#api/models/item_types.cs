@@ -1,8 +1,10 @@
 using System;
 using System.Collections.Generic;
 using System.IO;
+using System.Linq;
 using System.Text.Json;
 using Newtonsoft.Json;
+using HelpersV2;
 using ProvidersV2;
 namespace ModelsV2;
 
@@ -20,50 +22,74 @@ public class ItemTypes : Base
 {
     private readonly string _dataPath;
     private List<ItemType> _data;
+    private DataJournal<ItemType> _journal;
+    private RecordIndex<int?, ItemType> _records;
+    private RecordFilter<int?, ItemType> _filters;
 
     public ItemTypes(string rootPath, bool isDebug = false)
     {
         _dataPath = Path.Combine(rootPath, "item_types.json");
+        _journal = new DataJournal<ItemType>(_dataPath, x => x.Id.ToString(), () => _data);
+        _records = new RecordIndex<int?, ItemType>(x => x.Id);
+        _filters = new RecordFilter<int?, ItemType>(_records);
         Load(isDebug);
     }
 
     public List<ItemType> GetItemTypes()
     {
-        return _data;
+        return _records.InKeyOrder.ToList();
+    }
+
+    public PaginatedResponse<ItemType> GetItemTypesPage(int page, int pageSize, bool descending = false, string cursor = null, string filter = null, string sort = null)
+    {
+        if (filter != null || sort != null) return _filters.Page(filter, sort, page, pageSize, descending, cursor);
+        return PaginationHelper.Paginate(_records.Keys, _records.Get, page, pageSize, descending, cursor);
     }
 
     public ItemType GetItemType(int itemtypeId)
     {
-        return _data.Find(x => x.Id == itemtypeId);
+        return _records.Get(itemtypeId);
     }
 
     public bool AddItemtype(ItemType itemtype)
     {
-        itemtype.Id = _data.Count > 0 ? _data.Max(it => it.Id) + 1 : 1;
+        itemtype.Id = _journal.Sequence.Next();
         if (itemtype.Created_At == null) itemtype.Created_At = GetTimestamp();
         if (itemtype.Updated_At == null) itemtype.Updated_At = GetTimestamp();
-        _data.Add(itemtype);
+        if (!_records.Add(itemtype)) return false;
+        _journal.Add(itemtype);
         return true;
     }
 
+    public bool InsertItemtype(ItemType itemtype)
+    {
+        if (itemtype.Created_At == null) itemtype.Created_At = GetTimestamp();
+        if (itemtype.Updated_At == null) itemtype.Updated_At = GetTimestamp();
+        return InsertWithId(_records, _journal, itemtype, x => (int)x.Id);
+    }
+
     public bool UpdateItemtype(int itemtypeId, ItemType itemtype)
     {
-        itemtype.Updated_At = GetTimestamp();
-        var index = _data.FindIndex(x => x.Id == itemtypeId);
-        if (index >= 0)
+        lock (_records.WriteLock)
         {
-            itemtype.Id = _data[index].Id;
-            itemtype.Created_At = _data[index].Created_At;
-            _data[index] = itemtype;
-            return true;
-        }
+            itemtype.Updated_At = GetTimestamp();
+            var index = _records.IndexOf(itemtypeId);
+            if (index >= 0)
+            {
+                itemtype.Id = _data[index].Id;
+                itemtype.Created_At = _data[index].Created_At;
+                _records.Replace(index, itemtype);
+                _journal.Replace(itemtype);
+                return true;
+            }
 
-        return false;
+            return false;
+        }
     }
         public bool ReplaceItemType(int itemTypeId , ItemType newItemType)
     {
-        var index = _data.FindIndex(existingItemType => existingItemType.Id == itemTypeId);
-        var existingItemType = _data.FirstOrDefault(existingItemType => existingItemType.Id == itemTypeId);
+        var index = _records.IndexOf(itemTypeId);
+        var existingItemType = _records.Get(itemTypeId);
 
         if (index < 0)
         {
@@ -75,6 +101,7 @@ public class ItemTypes : Base
         if (!string.IsNullOrEmpty(newItemType.Name)) existingItemType.Name = newItemType.Name;
         if (!string.IsNullOrEmpty(newItemType.Description)) existingItemType.Description = newItemType.Description;
         existingItemType.Updated_At = GetTimestamp();
+        _journal.Replace(existingItemType);
 
         return true;
     }
@@ -83,11 +110,20 @@ public class ItemTypes : Base
     {
         var itemtype = GetItemType(itemtypeId);
         if (itemtype == null) return false;
-        if (force) return _data.Remove(itemtype);
-        var items = DataProvider.fetch_item_pool().GetItemsForItemType(itemtypeId);
-        if (items.Count() != 0) return false;
+        if (force) return Delete(itemtype);
+        if (DataProvider.fetch_item_pool().HasItemsForItemType(itemtypeId)) return false;
+
+        return Delete(itemtype);
+    }
 
-        return _data.Remove(itemtype);
+    private bool Delete(ItemType itemType)
+    {
+        lock (_records.WriteLock)
+        {
+            if (!_records.Remove(itemType)) return false;
+            _journal.Remove(itemType);
+            return true;
+        }
     }
 
     private void Load(bool isDebug)
@@ -98,20 +134,14 @@ public class ItemTypes : Base
         }
         else
         {
-            using (var reader = new StreamReader(_dataPath))
-            {
-                var json = reader.ReadToEnd();
-                _data = JsonConvert.DeserializeObject<List<ItemType>>(json);
-            }
+            _data = _journal.Load();
         }
+        _records.Load(_data);
+        _journal.Sequence.Seed(_data.Count > 0 ? _data.Max(x => x.Id ?? 0) + 1 : 1);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(_dataPath))
-        {
-            var json = JsonConvert.SerializeObject(_data, Formatting.Indented);
-            writer.Write(json);
-        }
+        DataProvider.Commit(_journal);
     }
 }
@@ -3,6 +3,7 @@ using System.Collections.Generic;
 using System.IO;
 using System.Linq;
 using Newtonsoft.Json;
+using HelpersV2;
 using ProvidersV2;
 namespace ModelsV2;
 
@@ -33,72 +34,168 @@ public class Items : Base
 {
     private string dataPath;
     private List<Item> data;
+    private DataJournal<Item> journal;
+    private RecordIndex<string, Item> records;
+    // The pools whose records keep one of these from being deleted.
+    private static readonly string[] Dependents = { "orders", "shipments", "transfers" };
+    private RecordFilter<string, Item> filters;
+    private SecondaryIndex<int, string> byItemLine;
+    private SecondaryIndex<int, string> byItemGroup;
+    private SecondaryIndex<int, string> byItemType;
+    private SecondaryIndex<int, string> bySupplier;
+    private PrefixIndex<string> byCode;
+    private PrefixIndex<string> byUpcCode;
+    private PrefixIndex<string> bySupplierCode;
+    private PrefixIndex<string> bySupplierPartNumber;
+    private TrigramIndex<string> codeTrigrams;
+    private TrigramIndex<string> upcCodeTrigrams;
+    private TrigramIndex<string> commodityCodeTrigrams;
+    private TrigramIndex<string> supplierCodeTrigrams;
 
     public Items(string rootPath, bool isDebug = false)
     {
         dataPath = Path.Combine(rootPath, "items.json");
+        journal = new DataJournal<Item>(dataPath, x => x.Uid, () => data);
+        records = new RecordIndex<string, Item>(x => x.Uid);
+        byItemLine = records.AddIndex(x => x.Item_Line);
+        byItemGroup = records.AddIndex(x => x.Item_Group);
+        byItemType = records.AddIndex(x => x.Item_Type);
+        bySupplier = records.AddIndex(x => x.Supplier_Id);
+        byCode = records.AddPrefixIndex(x => x.Code);
+        byUpcCode = records.AddPrefixIndex(x => x.Upc_Code);
+        bySupplierCode = records.AddPrefixIndex(x => x.Supplier_Code);
+        bySupplierPartNumber = records.AddPrefixIndex(x => x.Supplier_Part_Number);
+        codeTrigrams = records.AddTrigrams(x => x.Code);
+        upcCodeTrigrams = records.AddTrigrams(x => x.Upc_Code);
+        commodityCodeTrigrams = records.AddTrigrams(x => x.Commodity_Code);
+        supplierCodeTrigrams = records.AddTrigrams(x => x.Supplier_Code);
+        filters = new RecordFilter<string, Item>(records)
+            .Index("Item_Line", byItemLine)
+            .Index("Item_Group", byItemGroup)
+            .Index("Item_Type", byItemType)
+            .Index("Supplier_Id", bySupplier)
+            .Index("Code", byCode)
+            .Index("Code", codeTrigrams)
+            .Index("Upc_Code", byUpcCode)
+            .Index("Upc_Code", upcCodeTrigrams)
+            .Index("Commodity_Code", commodityCodeTrigrams)
+            .Index("Supplier_Code", bySupplierCode)
+            .Index("Supplier_Code", supplierCodeTrigrams)
+            .Index("Supplier_Part_Number", bySupplierPartNumber);
         Load(isDebug);
     }
 
     public List<Item> GetItems()
     {
-        return data;
+        return records.InKeyOrder.ToList();
+    }
+
+    public PaginatedResponse<Item> GetItemsPage(int page, int pageSize, bool descending = false, string cursor = null, string filter = null, string sort = null, SortedSet<string> scope = null)
+    {
+        if (filter != null || sort != null || scope != null) return filters.Page(filter, sort, page, pageSize, descending, cursor, scope);
+        return PaginationHelper.Paginate(records.Keys, records.Get, page, pageSize, descending, cursor);
     }
 
     public Item GetItem(string itemId)
     {
-        return data.Find(item => item.Uid == itemId);
+        return records.Get(itemId);
     }
 
     public List<Item> GetItemsForItemLine(int itemLineId)
     {
-        return data.Where(item => item.Item_Line == itemLineId).ToList();
+        return records.GetMany(byItemLine.Get(itemLineId));
+    }
+
+    public bool HasItemsForItemLine(int itemLineId)
+    {
+        return byItemLine.Any(itemLineId);
     }
 
     public List<Item> GetItemsForItemGroup(int itemGroupId)
     {
-        return data.Where(item => item.Item_Group == itemGroupId).ToList();
+        return records.GetMany(byItemGroup.Get(itemGroupId));
+    }
+
+    public bool HasItemsForItemGroup(int itemGroupId)
+    {
+        return byItemGroup.Any(itemGroupId);
     }
 
     public List<Item> GetItemsForItemType(int itemTypeId)
     {
-        return data.Where(item => item.Item_Type == itemTypeId).ToList();
+        return records.GetMany(byItemType.Get(itemTypeId));
+    }
+
+    public bool HasItemsForItemType(int itemTypeId)
+    {
+        return byItemType.Any(itemTypeId);
     }
 
     public List<Item> GetItemsForSupplier(int supplierId)
     {
-        return data.Where(item => item.Supplier_Id== supplierId).ToList();
+        return records.GetMany(bySupplier.Get(supplierId));
     }
 
-    public List<Transfer> GetTransfersForItem(string itemId)
+    public bool HasItemsForSupplier(int supplierId)
     {
-        var transfers = DataProvider.fetch_transfer_pool().GetTransfers();
-        return transfers.Where(transfer => transfer.Items.Any(item => item.Item_Id == itemId)).ToList();
+        return bySupplier.Any(supplierId);
     }
 
-    private string GenerateNextId()
+    // Whole-value lookups ignore case like search does; with prefix set they match the start of the value.
+    public List<Item> GetItemsByCode(string code, bool prefix = false)
     {
-        if (data.Count == 0)
-        {
-            return "P000001";
-        }
+        return records.GetMany(prefix ? byCode.StartingWith(code) : byCode.Get(code));
+    }
+
+    public List<Item> GetItemsByUpcCode(string upcCode, bool prefix = false)
+    {
+        return records.GetMany(prefix ? byUpcCode.StartingWith(upcCode) : byUpcCode.Get(upcCode));
+    }
+
+    public List<Item> GetItemsBySupplierCode(string supplierCode, bool prefix = false)
+    {
+        return records.GetMany(prefix ? bySupplierCode.StartingWith(supplierCode) : bySupplierCode.Get(supplierCode));
+    }
 
-        var maxId = data.Max(item => item.Uid);
-        var numericPart = int.Parse(maxId.Substring(1));
-        numericPart = (numericPart + 1) % 1000000; // Wrap around to 1 after 999999
+    public List<Item> GetItemsBySupplierPartNumber(string supplierPartNumber, bool prefix = false)
+    {
+        return records.GetMany(prefix ? bySupplierPartNumber.StartingWith(supplierPartNumber) : bySupplierPartNumber.Get(supplierPartNumber));
+    }
+
+    public PaginatedResponse<Transfer> GetTransfersForItemPage(string itemId, int page, int pageSize)
+    {
+        return DataProvider.fetch_transfer_pool().GetTransfersForItemPage(itemId, page, pageSize);
+    }
+
+    private string GenerateNextId()
+    {
+        var numericPart = journal.Sequence.Next() % 1000000; // Wrap around to 1 after 999999
         return $"P{numericPart:D6}";
     }
 
+    private static int UidNumber(string uid)
+    {
+        return uid != null && uid.Length > 1 && int.TryParse(uid.Substring(1), out var number) ? number : 0;
+    }
+
     public bool AddItem(Item item)
     {
         item.Uid = GenerateNextId();
         if (item.Created_At == null) item.Created_At = GetTimestamp();
         if (item.Updated_At == null) item.Updated_At = GetTimestamp();
-        data.Add(item);
+        if (!records.Add(item)) return false;
+        journal.Add(item);
         return true;
     }
 
-    public List<Item> SearchItems(string code = null, string upcCode = null, string commodityCode = null, string supplierCode = null)
+    public bool InsertItem(Item item)
+    {
+        if (item.Created_At == null) item.Created_At = GetTimestamp();
+        if (item.Updated_At == null) item.Updated_At = GetTimestamp();
+        return InsertWithId(records, journal, item, x => UidNumber(x.Uid));
+    }
+
+    public IEnumerable<Item> SearchItems(string code = null, string upcCode = null, string commodityCode = null, string supplierCode = null, bool exact = false)
     {
         if (string.IsNullOrEmpty(code) && string.IsNullOrEmpty(upcCode) &&
             string.IsNullOrEmpty(commodityCode) && string.IsNullOrEmpty(supplierCode))
@@ -106,92 +203,116 @@ public class Items : Base
             throw new ArgumentException("At least one search parameter must be provided.");
         }
 
-        var query = data.AsQueryable();
+        Func<string, string, bool> matches = exact
+            ? (value, term) => string.Equals(value, term, StringComparison.OrdinalIgnoreCase)
+            : (value, term) => value.Contains(term, StringComparison.OrdinalIgnoreCase);
+
+        var query = new RecordQuery<string, Item>(records);
         
         if (!string.IsNullOrEmpty(code))
         {
-            query = query.Where(item => item.Code.Contains(code, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(item => matches(item.Code, code), exact ? byCode.Lookup(code) : codeTrigrams.Lookup(code));
         }
 
         if (!string.IsNullOrEmpty(upcCode))
         {
-            query = query.Where(item => item.Upc_Code.Contains(upcCode, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(item => matches(item.Upc_Code, upcCode), exact ? byUpcCode.Lookup(upcCode) : upcCodeTrigrams.Lookup(upcCode));
         }
 
         if (!string.IsNullOrEmpty(commodityCode))
         {
-            query = query.Where(item => item.Commodity_Code.Contains(commodityCode, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(item => matches(item.Commodity_Code, commodityCode), commodityCodeTrigrams.Lookup(commodityCode));
         }
 
         if (!string.IsNullOrEmpty(supplierCode))
         {
-            query = query.Where(item => item.Supplier_Code.Contains(supplierCode, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(item => matches(item.Supplier_Code, supplierCode), exact ? bySupplierCode.Lookup(supplierCode) : supplierCodeTrigrams.Lookup(supplierCode));
         }
 
-        return query.ToList();
+        return query;
     }
 
     public bool UpdateItem(string itemId, Item item)
     {
-        item.Updated_At = GetTimestamp();
-        var index = data.FindIndex(existingItem => existingItem.Uid == itemId);
-
-        if (index >= 0)
+        lock (records.WriteLock)
         {
-            item.Uid = data[index].Uid;
-            item.Created_At = data[index].Created_At;
-            data[index] = item;
-            return true;
+            item.Updated_At = GetTimestamp();
+            var index = records.IndexOf(itemId);
+
+            if (index >= 0)
+            {
+                item.Uid = data[index].Uid;
+                item.Created_At = data[index].Created_At;
+                records.Replace(index, item);
+                journal.Replace(item);
+                return true;
+            }
+            return false;
         }
-        return false;
     }
 
     public bool ReplaceItem(string itemUid, Item newItemData)
     {
-        var index = data.FindIndex(existingItem => existingItem.Uid == itemUid);
-        var existingItem = data.FirstOrDefault(existingItem => existingItem.Uid == itemUid);
-
-        if (index < 0)
+        lock (records.WriteLock)
         {
-            return false;
-        }
+            var index = records.IndexOf(itemUid);
+            var existingItem = records.Get(itemUid);
+
+            if (index < 0)
+            {
+                return false;
+            }
 
-        if (!string.IsNullOrEmpty(newItemData.Code)) existingItem.Code = newItemData.Code;
-        if (!string.IsNullOrEmpty(newItemData.Description)) existingItem.Description = newItemData.Description;
-        if (!string.IsNullOrEmpty(newItemData.Short_Description)) existingItem.Short_Description = newItemData.Short_Description;
-        if (!string.IsNullOrEmpty(newItemData.Upc_Code)) existingItem.Upc_Code = newItemData.Upc_Code;
-        if (!string.IsNullOrEmpty(newItemData.Model_Number)) existingItem.Model_Number = newItemData.Model_Number;
-        if (!string.IsNullOrEmpty(newItemData.Commodity_Code)) existingItem.Commodity_Code = newItemData.Commodity_Code;
-        if (newItemData.Item_Line != 0) existingItem.Item_Line = newItemData.Item_Line;
-        if (newItemData.Item_Group != 0) existingItem.Item_Group = newItemData.Item_Group;
-        if (newItemData.Item_Type != 0) existingItem.Item_Type = newItemData.Item_Type;
-        if (newItemData.Unit_Purchase_Quantity != 0) existingItem.Unit_Purchase_Quantity = newItemData.Unit_Purchase_Quantity;
-        if (newItemData.Unit_Order_Quantity != 0) existingItem.Unit_Order_Quantity = newItemData.Unit_Order_Quantity;
-        if (newItemData.Pack_Order_Quantity != 0) existingItem.Pack_Order_Quantity = newItemData.Pack_Order_Quantity;
-        if (newItemData.Supplier_Id != 0) existingItem.Supplier_Id = newItemData.Supplier_Id;
-        if (!string.IsNullOrEmpty(newItemData.Supplier_Code)) existingItem.Supplier_Code = newItemData.Supplier_Code;
-        if (!string.IsNullOrEmpty(newItemData.Supplier_Part_Number)) existingItem.Supplier_Part_Number = newItemData.Supplier_Part_Number;
-        existingItem.Updated_At = GetTimestamp();
+            if (!string.IsNullOrEmpty(newItemData.Code)) existingItem.Code = newItemData.Code;
+            if (!string.IsNullOrEmpty(newItemData.Description)) existingItem.Description = newItemData.Description;
+            if (!string.IsNullOrEmpty(newItemData.Short_Description)) existingItem.Short_Description = newItemData.Short_Description;
+            if (!string.IsNullOrEmpty(newItemData.Upc_Code)) existingItem.Upc_Code = newItemData.Upc_Code;
+            if (!string.IsNullOrEmpty(newItemData.Model_Number)) existingItem.Model_Number = newItemData.Model_Number;
+            if (!string.IsNullOrEmpty(newItemData.Commodity_Code)) existingItem.Commodity_Code = newItemData.Commodity_Code;
+            if (newItemData.Item_Line != 0) existingItem.Item_Line = newItemData.Item_Line;
+            if (newItemData.Item_Group != 0) existingItem.Item_Group = newItemData.Item_Group;
+            if (newItemData.Item_Type != 0) existingItem.Item_Type = newItemData.Item_Type;
+            if (newItemData.Unit_Purchase_Quantity != 0) existingItem.Unit_Purchase_Quantity = newItemData.Unit_Purchase_Quantity;
+            if (newItemData.Unit_Order_Quantity != 0) existingItem.Unit_Order_Quantity = newItemData.Unit_Order_Quantity;
+            if (newItemData.Pack_Order_Quantity != 0) existingItem.Pack_Order_Quantity = newItemData.Pack_Order_Quantity;
+            if (newItemData.Supplier_Id != 0) existingItem.Supplier_Id = newItemData.Supplier_Id;
+            if (!string.IsNullOrEmpty(newItemData.Supplier_Code)) existingItem.Supplier_Code = newItemData.Supplier_Code;
+            if (!string.IsNullOrEmpty(newItemData.Supplier_Part_Number)) existingItem.Supplier_Part_Number = newItemData.Supplier_Part_Number;
+            existingItem.Updated_At = GetTimestamp();
+            records.Refresh(existingItem);
+            journal.Replace(existingItem);
         
-        return true;
+            return true;
+        }
+    }
+    // The records that keep a item from being deleted, by pool.
+    public Dictionary<string, List<string>> GetItemDependents(string itemId)
+    {
+        return DataProvider.References.GetReferrers("items", itemId, Dependents);
     }
+
     public bool RemoveItem(string itemId, bool force = false)
     {
         var item = GetItem(itemId);
-        if (force) return data.Remove(item);
+        if (force) return Delete(item);
         if (item == null) return false;
 
-        var orders = DataProvider.fetch_order_pool().GetOrders(); 
-        var shipments = DataProvider.fetch_shipment_pool().GetShipments();
-        var transfers = DataProvider.fetch_transfer_pool().GetTransfers();
-
-        if (orders.Any(x => x.Items.Any(y => y.Item_Id == itemId)) || shipments.Any(x => x.Items.Any(y => y.Item_Id == itemId)) || transfers.Any(x => x.Items.Any(y => y.Item_Id == itemId)))
+        if (DataProvider.References.IsReferenced("items", itemId, Dependents))
         {
             return false;
         }
 
+        return Delete(item);
+    }
 
-        return data.Remove(item);
+    private bool Delete(Item item)
+    {
+        lock (records.WriteLock)
+        {
+            if (!records.Remove(item)) return false;
+            journal.Remove(item);
+            return true;
+        }
     }
 
     private void Load(bool isDebug)
@@ -202,20 +323,14 @@ public class Items : Base
         }
         else
         {
-            using (var reader = new StreamReader(dataPath))
-            {
-                var json = reader.ReadToEnd();
-                data = JsonConvert.DeserializeObject<List<Item>>(json);
-            }
+            data = journal.Load();
         }
+        records.Load(data);
+        journal.Sequence.Seed(data.Count > 0 ? data.Max(item => UidNumber(item.Uid)) + 1 : 1);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(dataPath))
-        {
-            var json = JsonConvert.SerializeObject(data, Formatting.Indented);
-            writer.Write(json);
-        }
+        DataProvider.Commit(journal);
     }
 }
@@ -3,6 +3,7 @@ using System.Collections.Generic;
 using System.IO;
 using System.Linq;
 using Newtonsoft.Json;
+using HelpersV2;
 using ProvidersV2;
 namespace ModelsV2;
 
@@ -20,110 +21,164 @@ public class Locations : Base
 {
     private string dataPath;
     private List<Location> data;
+    private DataJournal<Location> journal;
+    private RecordIndex<int?, Location> records;
+    private RecordFilter<int?, Location> filters;
+    private SecondaryIndex<int, int?> byWarehouse;
+    private TrigramIndex<int?> nameTrigrams;
+    private TrigramIndex<int?> codeTrigrams;
 
     public Locations(string rootPath, bool isDebug = false)
     {
         dataPath = Path.Combine(rootPath, "locations.json");
+        journal = new DataJournal<Location>(dataPath, x => x.Id.ToString(), () => data);
+        records = new RecordIndex<int?, Location>(x => x.Id);
+        byWarehouse = records.AddIndex(x => x.Warehouse_Id);
+        records.AddObserver((id, location) => DataProvider.fetch_inventory_pool()?.RefreshLocation((int)id), () => { });
+        nameTrigrams = records.AddTrigrams(x => x.Name);
+        codeTrigrams = records.AddTrigrams(x => x.Code);
+        filters = new RecordFilter<int?, Location>(records)
+            .Index("Warehouse_Id", byWarehouse)
+            .Index("Name", nameTrigrams)
+            .Index("Code", codeTrigrams);
         Load(isDebug);
     }
 
     public List<Location> GetLocations()
     {
-        return data;
+        return records.InKeyOrder.ToList();
+    }
+
+    public PaginatedResponse<Location> GetLocationsPage(int page, int pageSize, bool descending = false, string cursor = null, string filter = null, string sort = null)
+    {
+        if (filter != null || sort != null) return filters.Page(filter, sort, page, pageSize, descending, cursor);
+        return PaginationHelper.Paginate(records.Keys, records.Get, page, pageSize, descending, cursor);
+    }
+
+    // The locations in the given warehouses, paged in Id order like the full listing.
+    public PaginatedResponse<Location> GetLocationsInWarehousesPage(IEnumerable<int> warehouseIds, int page, int pageSize, string cursor = null)
+    {
+        var keys = warehouseIds.Distinct().SelectMany(byWarehouse.Get).OrderBy(id => id).ToList();
+        return PaginationHelper.Paginate(keys, records.Get, page, pageSize, cursor: cursor);
     }
 
     public Location GetLocation(int locationId)
     {
-        return data.FirstOrDefault(location => location.Id == locationId);
+        return records.Get(locationId);
     }
 
     public List<Location> GetLocationsInWarehouse(int warehouseId)
     {
-        return data.Where(location => location.Warehouse_Id == warehouseId).ToList();
+        return records.GetMany(byWarehouse.Get(warehouseId));
     }
 
-    public List<Location> SearchLocations(string name = null, int? warehouseId = null, string code = null)
+    public IEnumerable<Location> SearchLocations(string name = null, int? warehouseId = null, string code = null)
     {
         if (string.IsNullOrEmpty(name) && !warehouseId.HasValue && string.IsNullOrEmpty(code))
         {
             throw new ArgumentException("At least one search parameter must be provided.");
         }
 
-        var query = data.AsQueryable();
+        var query = new RecordQuery<int?, Location>(records);
 
         if (!string.IsNullOrEmpty(name))
         {
-            query = query.Where(location => location.Name.Contains(name, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(location => location.Name.Contains(name, StringComparison.OrdinalIgnoreCase), nameTrigrams.Lookup(name));
         }
 
         if (warehouseId.HasValue)
         {
-            query = query.Where(location => location.Warehouse_Id == warehouseId.Value);
+            query = query.Where(location => location.Warehouse_Id == warehouseId.Value, byWarehouse.Lookup(warehouseId.Value));
         }
 
         if (!string.IsNullOrEmpty(code))
         {
-            query = query.Where(location => location.Code.Contains(code, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(location => location.Code.Contains(code, StringComparison.OrdinalIgnoreCase), codeTrigrams.Lookup(code));
         }
 
-        return query.ToList();
+        return query;
     }
     public bool AddLocation(Location location)
     {
-        location.Id = data.Count > 0 ? data.Max(l => l.Id) + 1 : 1;
+        location.Id = journal.Sequence.Next();
         if (location.Created_At == null) location.Created_At = GetTimestamp();
         if (location.Updated_At == null) location.Updated_At = GetTimestamp();
-        data.Add(location);
+        if (!records.Add(location)) return false;
+        journal.Add(location);
         return true;
     }
 
-    public bool UpdateLocation(int locationId, Location location)
+    public bool InsertLocation(Location location)
     {
-        location.Updated_At = GetTimestamp();
-        var index = data.FindIndex(existingLocation => existingLocation.Id == locationId);
+        if (location.Created_At == null) location.Created_At = GetTimestamp();
+        if (location.Updated_At == null) location.Updated_At = GetTimestamp();
+        return InsertWithId(records, journal, location, x => (int)x.Id);
+    }
 
-        if (index >= 0)
+    public bool UpdateLocation(int locationId, Location location)
+    {
+        lock (records.WriteLock)
         {
-            location.Id = data[index].Id;
-            location.Created_At = data[index].Created_At;
-            data[index] = location;
-            return true;
+            location.Updated_At = GetTimestamp();
+            var index = records.IndexOf(locationId);
+
+            if (index >= 0)
+            {
+                location.Id = data[index].Id;
+                location.Created_At = data[index].Created_At;
+                records.Replace(index, location);
+                journal.Replace(location);
+                return true;
+            }
+            return false;
         }
-        return false;
     }
 
     public bool ReplaceLocation(int locationId, Location newLocationData)
     {
-        var index = data.FindIndex(existingLocation => existingLocation.Id == locationId);
-        var existingLocation = data.FirstOrDefault(existingLocation => existingLocation.Id == locationId);
-
-        if (index < 0)
+        lock (records.WriteLock)
         {
-            return false;
-        }
+            var index = records.IndexOf(locationId);
+            var existingLocation = records.Get(locationId);
+
+            if (index < 0)
+            {
+                return false;
+            }
         
-        if (!string.IsNullOrEmpty(newLocationData.Code)) existingLocation.Code = newLocationData.Code;
-        if (!string.IsNullOrEmpty(newLocationData.Name)) existingLocation.Name = newLocationData.Name;
-        if (newLocationData.Warehouse_Id != 0) existingLocation.Warehouse_Id = newLocationData.Warehouse_Id;
-        existingLocation.Updated_At = GetTimestamp();
+            if (!string.IsNullOrEmpty(newLocationData.Code)) existingLocation.Code = newLocationData.Code;
+            if (!string.IsNullOrEmpty(newLocationData.Name)) existingLocation.Name = newLocationData.Name;
+            if (newLocationData.Warehouse_Id != 0) existingLocation.Warehouse_Id = newLocationData.Warehouse_Id;
+            existingLocation.Updated_At = GetTimestamp();
+            records.Refresh(existingLocation);
+            journal.Replace(existingLocation);
 
-        return true;
+            return true;
+        }
     }
 
     public bool RemoveLocation(int locationId, bool force = false)
     {
         var location = GetLocation(locationId);
         if (location == null) return false;
-        if (force) return data.Remove(location);
+        if (force) return Delete(location);
 
-        var inventories = DataProvider.fetch_inventory_pool().GetInventories();
-
-        if (inventories.Any(inventory => inventory.Locations.Any(l => l == locationId)))
+        if (DataProvider.fetch_inventory_pool().HasInventoriesForLocation(locationId))
         {
             return false;
         }
 
-        return data.Remove(location);
+        return Delete(location);
+    }
+
+    private bool Delete(Location location)
+    {
+        lock (records.WriteLock)
+        {
+            if (!records.Remove(location)) return false;
+            journal.Remove(location);
+            return true;
+        }
     }
 
     private void Load(bool isDebug)
@@ -134,20 +189,14 @@ public class Locations : Base
         }
         else
         {
-            using (var reader = new StreamReader(dataPath))
-            {
-                var json = reader.ReadToEnd();
-                data = JsonConvert.DeserializeObject<List<Location>>(json);
-            }
+            data = journal.Load();
         }
+        records.Load(data);
+        journal.Sequence.Seed(data.Count > 0 ? data.Max(x => x.Id ?? 0) + 1 : 1);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(dataPath))
-        {
-            var json = JsonConvert.SerializeObject(data, Formatting.Indented);
-            writer.Write(json);
-        }
+        DataProvider.Commit(journal);
     }
 }
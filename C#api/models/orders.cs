@@ -3,6 +3,7 @@ using System.Collections.Generic;
 using System.IO;
 using System.Linq;
 using Newtonsoft.Json;
+using HelpersV2;
 using ProvidersV2;
 namespace ModelsV2;
 
@@ -41,23 +42,76 @@ public class Orders : Base
 {
     private string dataPath;
     private List<Order> data;
-    private Inventories inventory;
+    private DataJournal<Order> journal;
+    private RecordIndex<int?, Order> records;
+    private RecordFilter<int?, Order> filters;
+    private SecondaryIndex<string, int?> byItem;
+    private SecondaryIndex<int?, int?> byClient;
+    private SecondaryIndex<int?, int?> byShipment;
+    private SecondaryIndex<string, int?> byStatus;
+    private SecondaryIndex<int, int?> byWarehouse;
+    private SecondaryIndex<int, int?> bySource;
+    private RangeIndex<int?> byOrderDate;
 
     public Orders(string rootPath, bool isDebug = false)
     {
         dataPath = Path.Combine(rootPath, "orders.json");
+        journal = new DataJournal<Order>(dataPath, x => x.Id.ToString(), () => data);
+        records = new RecordIndex<int?, Order>(x => x.Id);
+        records.AddReferences(DataProvider.References, "orders", References);
+        byItem = records.AddMultiIndex(x => x.Items?.Select(item => item.Item_Id), x => Timestamps.Parse(x.Created_At) ?? long.MinValue);
+        byClient = records.AddMultiIndex(x => new[] { x.Ship_To, x.Bill_To });
+        byShipment = records.AddIndex(x => x.Shipment_Id);
+        byStatus = records.AddIndex(x => x.Order_Status);
+        byWarehouse = records.AddIndex(x => x.Warehouse_Id);
+        bySource = records.AddIndex(x => x.Source_Id);
+        byOrderDate = records.AddRangeIndex(x => Timestamps.Parse(x.Order_Date));
+        filters = new RecordFilter<int?, Order>(records)
+            .Index("Order_Date", byOrderDate)
+            .Index("Order_Status", byStatus)
+            .Index("Source_Id", bySource)
+            .Index("Warehouse_Id", byWarehouse)
+            .Index("Shipment_Id", byShipment);
         Load(isDebug);
-        inventory = new Inventories(rootPath);
+    }
+
+    private static IEnumerable<(string Pool, object Key)> References(Order order)
+    {
+        yield return ("clients", order.Ship_To);
+        yield return ("clients", order.Bill_To);
+        yield return ("warehouses", order.Warehouse_Id);
+        yield return ("shipments", order.Shipment_Id);
+        if (order.Items == null) yield break;
+        foreach (var item in order.Items) yield return ("items", item.Item_Id);
     }
 
     public List<Order> GetOrders()
     {
-        return data;
+        return records.InKeyOrder.ToList();
+    }
+
+    public PaginatedResponse<Order> GetOrdersPage(int page, int pageSize, bool descending = false, string cursor = null, string filter = null, string sort = null)
+    {
+        if (filter != null || sort != null) return filters.Page(filter, sort, page, pageSize, descending, cursor);
+        return PaginationHelper.Paginate(records.Keys, records.Get, page, pageSize, descending, cursor);
+    }
+
+    // The orders of the given warehouses, paged in Id order like the full listing.
+    public PaginatedResponse<Order> GetOrdersInWarehousesPage(IEnumerable<int> warehouseIds, int page, int pageSize, bool descending = false, string cursor = null)
+    {
+        var keys = warehouseIds.Distinct().SelectMany(byWarehouse.Get).OrderBy(id => id).ToList();
+        return PaginationHelper.Paginate(keys, records.Get, page, pageSize, descending, cursor);
     }
 
     public Order GetOrder(int orderId)
     {
-        return data.FirstOrDefault(order => order.Id == orderId);
+        return records.Get(orderId);
+    }
+
+    // In the order they were created, straight from the item index.
+    public PaginatedResponse<Order> GetOrdersForItemPage(string itemId, int page, int pageSize)
+    {
+        return PaginationHelper.PaginateInOrder(byItem.Get(itemId), records.Get, page, pageSize);
     }
 
     public List<OrderItem> GetItemsInOrder(int orderId)
@@ -68,43 +122,76 @@ public class Orders : Base
 
     public List<Order> GetOrdersInShipment(int shipmentId)
     {
-        return data.Where(order => order.Shipment_Id == shipmentId).ToList();
+        return records.GetMany(byShipment.Get(shipmentId));
     }
 
     public List<Order> GetOrdersForClient(int clientId)
     {
-        return data.Where(order => order.Ship_To == clientId ||
-                                   order.Bill_To == clientId).ToList();
+        return records.GetMany(byClient.Get(clientId));
     }
 
     public bool AddOrder(Order order)
     {
-        order.Id = data.Count > 0 ? data.Max(o => o.Id) + 1 : 1;
+        order.Id = journal.Sequence.Next();
         if (order.Created_At == null) order.Created_At = GetTimestamp();
         if (order.Updated_At == null) order.Updated_At = GetTimestamp();
         order.Order_Status = "Open";
-        data.Add(order);
+        if (!records.Add(order)) return false;
+        journal.Add(order);
         return true;
     }
 
-    public List<Order> SearchOrders(int? sourceId = null, string orderStatus = null, string orderDate = null, int? warehouseId = null, string createdAt = null)
+    public bool InsertOrder(Order order)
+    {
+        if (order.Created_At == null) order.Created_At = GetTimestamp();
+        if (order.Updated_At == null) order.Updated_At = GetTimestamp();
+        return InsertWithId(records, journal, order, x => (int)x.Id);
+    }
+
+    // Replaces the stored record as-is, without the defaults UpdateOrder applies.
+    public bool OverwriteOrder(int orderId, Order order)
+    {
+        lock (records.WriteLock)
+        {
+            var index = records.IndexOf(orderId);
+            if (index < 0) return false;
+
+            order.Updated_At = GetTimestamp();
+            order.Created_At = data[index].Created_At;
+            records.Replace(index, order);
+            journal.Replace(order);
+            return true;
+        }
+    }
+
+    public IEnumerable<Order> SearchOrders(int? sourceId = null, string orderStatus = null, string orderDate = null, int? warehouseId = null, string createdAt = null, string from = null, string to = null)
     {
         if (!sourceId.HasValue && string.IsNullOrEmpty(orderStatus) && string.IsNullOrEmpty(orderDate) &&
-            !warehouseId.HasValue)
+            !warehouseId.HasValue &&
+            string.IsNullOrEmpty(from) && string.IsNullOrEmpty(to))
         {
             throw new ArgumentException("At least one search parameter must be provided.");
         }
 
-        var query = data.AsQueryable();
+        var fromTicks = Timestamps.ParseBound(from, "from");
+        var toTicks = Timestamps.ParseBound(to, "to", upper: true);
+        var dated = fromTicks.HasValue || toTicks.HasValue;
+
+        var query = new RecordQuery<int?, Order>(records);
+
+        if (dated)
+        {
+            query = query.Where(order => byOrderDate.IsBetween(order.Id, fromTicks, toTicks), byOrderDate.Lookup(fromTicks, toTicks));
+        }
         
         if (sourceId.HasValue)
         {
-            query = query.Where(order => order.Source_Id == sourceId.Value);
+            query = query.Where(order => order.Source_Id == sourceId.Value, bySource.Lookup(sourceId.Value));
         }
 
         if (!string.IsNullOrEmpty(orderStatus))
         {
-            query = query.Where(order => order.Order_Status.Contains(orderStatus, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(order => order.Order_Status.Contains(orderStatus, StringComparison.OrdinalIgnoreCase), byStatus.LookupWhere(status => status.Contains(orderStatus, StringComparison.OrdinalIgnoreCase)));
         }
 
         if (!string.IsNullOrEmpty(orderDate))
@@ -114,63 +201,73 @@ public class Orders : Base
 
         if (warehouseId.HasValue)
         {
-            query = query.Where(order => order.Warehouse_Id == warehouseId.Value);
+            query = query.Where(order => order.Warehouse_Id == warehouseId.Value, byWarehouse.Lookup(warehouseId.Value));
         }
 
-        return query.ToList();
+        return query;
     }
 
 
     public bool UpdateOrder(int orderId, Order order)
     {
-        order.Updated_At = GetTimestamp();
-        var index = data.FindIndex(existingOrder => Convert.ToInt64(existingOrder.Id) == orderId);
-        if (index >= 0)
+        lock (records.WriteLock)
         {
-            order.Id = data[index].Id;
-            order.Created_At = data[index].Created_At;
-            order.Order_Status = "Open";
-            data[index] = order;
-            return true;
+            order.Updated_At = GetTimestamp();
+            var index = records.IndexOf(orderId);
+            if (index >= 0)
+            {
+                order.Id = data[index].Id;
+                order.Created_At = data[index].Created_At;
+                order.Order_Status = "Open";
+                records.Replace(index, order);
+                journal.Replace(order);
+                return true;
+            }
+            return false;
         }
-        return false;
     }
 
     public bool ReplaceOrder(int orderId, Order newOrderData)
     {
-        var index = data.FindIndex(existingOrder => existingOrder.Id == orderId);
-        var existingOrder = data.FirstOrDefault(existingOrder => existingOrder.Id == orderId);
-
-        if (index < 0)
+        lock (records.WriteLock)
         {
-            return false;
-        }
+            var index = records.IndexOf(orderId);
+            var existingOrder = records.Get(orderId);
 
-        if (newOrderData.Source_Id != 0) existingOrder.Source_Id = newOrderData.Source_Id;
-        if (!string.IsNullOrEmpty(newOrderData.Order_Date)) existingOrder.Order_Date = newOrderData.Order_Date;
-        if (!string.IsNullOrEmpty(newOrderData.Request_Date)) existingOrder.Request_Date = newOrderData.Request_Date;
-        if (!string.IsNullOrEmpty(newOrderData.Reference)) existingOrder.Reference = newOrderData.Reference;
-        if (!string.IsNullOrEmpty(newOrderData.Reference_Extra)) existingOrder.Reference_Extra = newOrderData.Reference_Extra;
-        if (!string.IsNullOrEmpty(newOrderData.Order_Status)) existingOrder.Order_Status = newOrderData.Order_Status;
-        if (!string.IsNullOrEmpty(newOrderData.Notes)) existingOrder.Notes = newOrderData.Notes;
-        if (!string.IsNullOrEmpty(newOrderData.Shipping_Notes)) existingOrder.Shipping_Notes = newOrderData.Shipping_Notes;
-        if (!string.IsNullOrEmpty(newOrderData.Picking_Notes)) existingOrder.Picking_Notes = newOrderData.Picking_Notes;
-        if (newOrderData.Warehouse_Id != 0) existingOrder.Warehouse_Id = newOrderData.Warehouse_Id;
-        if (newOrderData.Ship_To != 0) existingOrder.Ship_To = newOrderData.Ship_To;
-        if (newOrderData.Bill_To != 0) existingOrder.Bill_To = newOrderData.Bill_To;
-        if (newOrderData.Shipment_Id != 0) existingOrder.Shipment_Id = newOrderData.Shipment_Id;
-        if (newOrderData.Total_Amount != 0) existingOrder.Total_Amount = newOrderData.Total_Amount;
-        if (newOrderData.Total_Discount != 0) existingOrder.Total_Discount = newOrderData.Total_Discount;
-        if (newOrderData.Total_Tax != 0) existingOrder.Total_Tax = newOrderData.Total_Tax;
-        if (newOrderData.Total_Surcharge != 0) existingOrder.Total_Surcharge = newOrderData.Total_Surcharge;
-        existingOrder.Updated_At = GetTimestamp();
+            if (index < 0)
+            {
+                return false;
+            }
 
-        return true;
+            if (newOrderData.Source_Id != 0) existingOrder.Source_Id = newOrderData.Source_Id;
+            if (!string.IsNullOrEmpty(newOrderData.Order_Date)) existingOrder.Order_Date = newOrderData.Order_Date;
+            if (!string.IsNullOrEmpty(newOrderData.Request_Date)) existingOrder.Request_Date = newOrderData.Request_Date;
+            if (!string.IsNullOrEmpty(newOrderData.Reference)) existingOrder.Reference = newOrderData.Reference;
+            if (!string.IsNullOrEmpty(newOrderData.Reference_Extra)) existingOrder.Reference_Extra = newOrderData.Reference_Extra;
+            if (!string.IsNullOrEmpty(newOrderData.Order_Status)) existingOrder.Order_Status = newOrderData.Order_Status;
+            if (!string.IsNullOrEmpty(newOrderData.Notes)) existingOrder.Notes = newOrderData.Notes;
+            if (!string.IsNullOrEmpty(newOrderData.Shipping_Notes)) existingOrder.Shipping_Notes = newOrderData.Shipping_Notes;
+            if (!string.IsNullOrEmpty(newOrderData.Picking_Notes)) existingOrder.Picking_Notes = newOrderData.Picking_Notes;
+            if (newOrderData.Warehouse_Id != 0) existingOrder.Warehouse_Id = newOrderData.Warehouse_Id;
+            if (newOrderData.Ship_To != 0) existingOrder.Ship_To = newOrderData.Ship_To;
+            if (newOrderData.Bill_To != 0) existingOrder.Bill_To = newOrderData.Bill_To;
+            if (newOrderData.Shipment_Id != 0) existingOrder.Shipment_Id = newOrderData.Shipment_Id;
+            if (newOrderData.Total_Amount != 0) existingOrder.Total_Amount = newOrderData.Total_Amount;
+            if (newOrderData.Total_Discount != 0) existingOrder.Total_Discount = newOrderData.Total_Discount;
+            if (newOrderData.Total_Tax != 0) existingOrder.Total_Tax = newOrderData.Total_Tax;
+            if (newOrderData.Total_Surcharge != 0) existingOrder.Total_Surcharge = newOrderData.Total_Surcharge;
+            existingOrder.Updated_At = GetTimestamp();
+            records.Refresh(existingOrder);
+            journal.Replace(existingOrder);
+
+            return true;
+        }
     }
 
     public void UpdateItemsInOrder(int orderId, List<Item> items)
     {
         var order = GetOrder(orderId);
+        var inventory = DataProvider.fetch_inventory_pool();
         List<Item> currentItems = new List<Item>();
         foreach (var i in order.Items) currentItems.Add(DataProvider.fetch_item_pool().GetItem(i.Item_Id));
 
@@ -222,19 +319,17 @@ public class Orders : Base
 
     public void UpdateOrdersInShipment(int shipmentId, List<Order> orders)
     {
+        // The orders in the body are fresh copies, so membership goes by id.
+        var orderIds = new HashSet<int?>(orders.Select(order => order.Id));
         var packedOrders = GetOrdersInShipment(shipmentId);
-        
+
         foreach (var packedOrder in packedOrders)
         {
-            if (!orders.Contains(packedOrder))
+            if (!orderIds.Contains(packedOrder.Id))
             {
-                var order = GetOrder((int)packedOrder.Id);
-                if (order != null)
-                {
-                    order.Shipment_Id = -1;
-                    order.Order_Status = "Scheduled";
-                    UpdateOrder((int)packedOrder.Id, order);
-                }
+                packedOrder.Shipment_Id = -1;
+                packedOrder.Order_Status = "Scheduled";
+                OverwriteOrder((int)packedOrder.Id, packedOrder);
             }
         }
 
@@ -245,7 +340,7 @@ public class Orders : Base
             {
                 orderToUpdate.Shipment_Id = shipmentId;
                 orderToUpdate.Order_Status = "Packed";
-                UpdateOrder((int)order.Id, orderToUpdate);
+                OverwriteOrder((int)order.Id, orderToUpdate);
             }
         }
     }
@@ -255,7 +350,17 @@ public class Orders : Base
         var order = GetOrder(orderId);
         if (order == null) return false;
 
-        return data.Remove(order);
+        return Delete(order);
+    }
+
+    private bool Delete(Order order)
+    {
+        lock (records.WriteLock)
+        {
+            if (!records.Remove(order)) return false;
+            journal.Remove(order);
+            return true;
+        }
     }
 
     private void Load(bool isDebug)
@@ -266,20 +371,14 @@ public class Orders : Base
         }
         else
         {
-            using (var reader = new StreamReader(dataPath))
-            {
-                var json = reader.ReadToEnd();
-                data = JsonConvert.DeserializeObject<List<Order>>(json);
-            }
+            data = journal.Load();
         }
+        records.Load(data);
+        journal.Sequence.Seed(data.Count > 0 ? data.Max(x => x.Id ?? 0) + 1 : 1);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(dataPath))
-        {
-            var json = JsonConvert.SerializeObject(data, Formatting.Indented);
-            writer.Write(json);
-        }
+        DataProvider.Commit(journal);
     }
 }
@@ -5,6 +5,7 @@ using System.Linq;
 namespace ModelsV2;
 using ProvidersV2;
 using Newtonsoft.Json;
+using HelpersV2;
 
 public class ShipmentItem
 {
@@ -38,23 +39,62 @@ public class Shipments : Base
 {
     private string dataPath;
     private List<Shipment> data;
-    private Inventories inventory;
+    private DataJournal<Shipment> journal;
+    private RecordIndex<int?, Shipment> records;
+    // The pools whose records keep one of these from being deleted.
+    private static readonly string[] Dependents = { "orders" };
+    private RecordFilter<int?, Shipment> filters;
+    private SecondaryIndex<string, int?> byItem;
+    private SecondaryIndex<string, int?> byStatus;
+    private SecondaryIndex<int, int?> byOrder;
+    private SecondaryIndex<string, int?> byCarrier;
+    private RangeIndex<int?> byOrderDate;
 
     public Shipments(string rootPath, bool isDebug = false)
     {
         dataPath = Path.Combine(rootPath, "shipments.json");
+        journal = new DataJournal<Shipment>(dataPath, x => x.Id.ToString(), () => data);
+        records = new RecordIndex<int?, Shipment>(x => x.Id);
+        records.AddReferences(DataProvider.References, "shipments", References);
+        byItem = records.AddMultiIndex(x => x.Items?.Select(item => item.Item_Id), x => Timestamps.Parse(x.Created_At) ?? long.MinValue);
+        byStatus = records.AddIndex(x => x.Shipment_Status);
+        byOrder = records.AddIndex(x => x.Order_Id);
+        byCarrier = records.AddIndex(x => x.Carrier_Code);
+        byOrderDate = records.AddRangeIndex(x => Timestamps.Parse(x.Order_Date));
+        filters = new RecordFilter<int?, Shipment>(records)
+            .Index("Order_Date", byOrderDate)
+            .Index("Shipment_Status", byStatus)
+            .Index("Order_Id", byOrder)
+            .Index("Carrier_Code", byCarrier);
         Load(isDebug);
-        inventory = new Inventories(rootPath);
+    }
+
+    private static IEnumerable<(string Pool, object Key)> References(Shipment shipment)
+    {
+        if (shipment.Items == null) yield break;
+        foreach (var item in shipment.Items) yield return ("items", item.Item_Id);
     }
 
     public List<Shipment> GetShipments()
     {
-        return data;
+        return records.InKeyOrder.ToList();
+    }
+
+    public PaginatedResponse<Shipment> GetShipmentsPage(int page, int pageSize, bool descending = false, string cursor = null, string filter = null, string sort = null)
+    {
+        if (filter != null || sort != null) return filters.Page(filter, sort, page, pageSize, descending, cursor);
+        return PaginationHelper.Paginate(records.Keys, records.Get, page, pageSize, descending, cursor);
     }
 
     public Shipment GetShipment(int shipmentId)
     {
-        return data.FirstOrDefault(shipment => shipment.Id == shipmentId);
+        return records.Get(shipmentId);
+    }
+
+    // In the order they were created, straight from the item index.
+    public PaginatedResponse<Shipment> GetShipmentsForItemPage(string itemId, int page, int pageSize)
+    {
+        return PaginationHelper.PaginateInOrder(byItem.Get(itemId), records.Get, page, pageSize);
     }
 
     public List<ShipmentItem> GetItemsInShipment(int shipmentId)
@@ -65,27 +105,61 @@ public class Shipments : Base
 
     public bool AddShipment(Shipment shipment)
     {
-        shipment.Id = data.Count > 0 ? data.Max(s => s.Id) + 1 : 1;
+        shipment.Id = journal.Sequence.Next();
         if (shipment.Created_At == null) shipment.Created_At = GetTimestamp();
         if (shipment.Updated_At == null) shipment.Updated_At = GetTimestamp();
         shipment.Shipment_Status = "Planned";
-        data.Add(shipment);
+        if (!records.Add(shipment)) return false;
+        journal.Add(shipment);
         return true;
     }
 
-     public List<Shipment> SearchShipments(int? orderId = null,string orderDate = null,string shipmentStatus = null, string carrierCode = null)
+    public bool InsertShipment(Shipment shipment)
+    {
+        if (shipment.Created_At == null) shipment.Created_At = GetTimestamp();
+        if (shipment.Updated_At == null) shipment.Updated_At = GetTimestamp();
+        return InsertWithId(records, journal, shipment, x => (int)x.Id);
+    }
+
+    // Replaces the stored record as-is, without the defaults UpdateShipment applies.
+    public bool OverwriteShipment(int shipmentId, Shipment shipment)
+    {
+        lock (records.WriteLock)
+        {
+            var index = records.IndexOf(shipmentId);
+            if (index < 0) return false;
+
+            shipment.Updated_At = GetTimestamp();
+            shipment.Created_At = data[index].Created_At;
+            records.Replace(index, shipment);
+            journal.Replace(shipment);
+            return true;
+        }
+    }
+
+     public IEnumerable<Shipment> SearchShipments(int? orderId = null,string orderDate = null,string shipmentStatus = null, string carrierCode = null, string from = null, string to = null)
     {
         if (!orderId.HasValue && string.IsNullOrEmpty(orderDate) &&
-            string.IsNullOrEmpty(shipmentStatus) && string.IsNullOrEmpty(carrierCode))
+            string.IsNullOrEmpty(shipmentStatus) && string.IsNullOrEmpty(carrierCode) &&
+            string.IsNullOrEmpty(from) && string.IsNullOrEmpty(to))
         {
             throw new ArgumentException("At least one search parameter must be provided.");
         }
 
-        var query = data.AsQueryable();
+        var fromTicks = Timestamps.ParseBound(from, "from");
+        var toTicks = Timestamps.ParseBound(to, "to", upper: true);
+        var dated = fromTicks.HasValue || toTicks.HasValue;
+
+        var query = new RecordQuery<int?, Shipment>(records);
+
+        if (dated)
+        {
+            query = query.Where(shipment => byOrderDate.IsBetween(shipment.Id, fromTicks, toTicks), byOrderDate.Lookup(fromTicks, toTicks));
+        }
 
         if (orderId.HasValue)
         {
-            query = query.Where(shipment => shipment.Order_Id == orderId.Value);
+            query = query.Where(shipment => shipment.Order_Id == orderId.Value, byOrder.Lookup(orderId.Value));
         }
 
         if (!string.IsNullOrEmpty(orderDate))
@@ -95,68 +169,79 @@ public class Shipments : Base
         
         if (!string.IsNullOrEmpty(shipmentStatus))
         {
-            query = query.Where(shipment => shipment.Shipment_Status.Contains(shipmentStatus, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(shipment => shipment.Shipment_Status.Contains(shipmentStatus, StringComparison.OrdinalIgnoreCase), byStatus.LookupWhere(status => status.Contains(shipmentStatus, StringComparison.OrdinalIgnoreCase)));
         }
         
         if (!string.IsNullOrEmpty(carrierCode))
         {
-            query = query.Where(shipment => shipment.Carrier_Code.Contains(carrierCode, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(shipment => shipment.Carrier_Code.Contains(carrierCode, StringComparison.OrdinalIgnoreCase), byCarrier.LookupWhere(carrier => carrier.Contains(carrierCode, StringComparison.OrdinalIgnoreCase)));
         }
 
-        return query.ToList();
+        return query;
     }
 
 
     public bool UpdateShipment(int shipmentId, Shipment shipment)
     {
-        shipment.Updated_At = GetTimestamp();
-        var index = data.FindIndex(existingShipment => existingShipment.Id== shipmentId);
-        
-        if (index >= 0)
+        lock (records.WriteLock)
         {
-            shipment.Id = data[index].Id;
-            shipment.Created_At = data[index].Created_At;
-            shipment.Shipment_Status = "Planned";
-            data[index] = shipment;
-            return true;
+            shipment.Updated_At = GetTimestamp();
+            var index = records.IndexOf(shipmentId);
+        
+            if (index >= 0)
+            {
+                shipment.Id = data[index].Id;
+                shipment.Created_At = data[index].Created_At;
+                shipment.Shipment_Status = "Planned";
+                records.Replace(index, shipment);
+                journal.Replace(shipment);
+                return true;
+            }
+            return false;
         }
-        return false;
     }
 
     public bool ReplaceShipment(int shipmentId, Shipment newShipmentData)
     {
-        var index = data.FindIndex(existingShipment => existingShipment.Id == shipmentId);
-        var existingShipment = data.FirstOrDefault(existingShipment => existingShipment.Id == shipmentId);
-
-        if (index < 0)
+        lock (records.WriteLock)
         {
-            return false;
-        }
+            var index = records.IndexOf(shipmentId);
+            var existingShipment = records.Get(shipmentId);
 
-        if (newShipmentData.Order_Id != 0) existingShipment.Order_Id = newShipmentData.Order_Id;
-        if (newShipmentData.Source_Id != 0) existingShipment.Source_Id = newShipmentData.Source_Id;
-        if (!string.IsNullOrEmpty(newShipmentData.Order_Date)) existingShipment.Order_Date = newShipmentData.Order_Date;
-        if (!string.IsNullOrEmpty(newShipmentData.Request_Date)) existingShipment.Request_Date = newShipmentData.Request_Date;
-        if (!string.IsNullOrEmpty(newShipmentData.Shipment_Date)) existingShipment.Shipment_Date = newShipmentData.Shipment_Date;
-        if (!string.IsNullOrEmpty(newShipmentData.Shipment_Type)) existingShipment.Shipment_Type = newShipmentData.Shipment_Type;
-        if (!string.IsNullOrEmpty(newShipmentData.Shipment_Status)) existingShipment.Shipment_Status = newShipmentData.Shipment_Status;
-        if (!string.IsNullOrEmpty(newShipmentData.Notes)) existingShipment.Notes = newShipmentData.Notes;
-        if (!string.IsNullOrEmpty(newShipmentData.Carrier_Code)) existingShipment.Carrier_Code = newShipmentData.Carrier_Code;
-        if (!string.IsNullOrEmpty(newShipmentData.Carrier_Description)) existingShipment.Carrier_Description = newShipmentData.Carrier_Description;
-        if (!string.IsNullOrEmpty(newShipmentData.Service_Code)) existingShipment.Service_Code = newShipmentData.Service_Code;
-        if (!string.IsNullOrEmpty(newShipmentData.Payment_Type)) existingShipment.Payment_Type = newShipmentData.Payment_Type;
-        if (!string.IsNullOrEmpty(newShipmentData.Transfer_Mode)) existingShipment.Transfer_Mode = newShipmentData.Transfer_Mode;
-        if (newShipmentData.Total_Package_Count != 0) existingShipment.Total_Package_Count = newShipmentData.Total_Package_Count;
-        if (newShipmentData.Total_Package_Weight != 0) existingShipment.Total_Package_Weight = newShipmentData.Total_Package_Weight;
-
-        existingShipment.Updated_At = GetTimestamp();
+            if (index < 0)
+            {
+                return false;
+            }
 
-        return true;
+            if (newShipmentData.Order_Id != 0) existingShipment.Order_Id = newShipmentData.Order_Id;
+            if (newShipmentData.Source_Id != 0) existingShipment.Source_Id = newShipmentData.Source_Id;
+            if (!string.IsNullOrEmpty(newShipmentData.Order_Date)) existingShipment.Order_Date = newShipmentData.Order_Date;
+            if (!string.IsNullOrEmpty(newShipmentData.Request_Date)) existingShipment.Request_Date = newShipmentData.Request_Date;
+            if (!string.IsNullOrEmpty(newShipmentData.Shipment_Date)) existingShipment.Shipment_Date = newShipmentData.Shipment_Date;
+            if (!string.IsNullOrEmpty(newShipmentData.Shipment_Type)) existingShipment.Shipment_Type = newShipmentData.Shipment_Type;
+            if (!string.IsNullOrEmpty(newShipmentData.Shipment_Status)) existingShipment.Shipment_Status = newShipmentData.Shipment_Status;
+            if (!string.IsNullOrEmpty(newShipmentData.Notes)) existingShipment.Notes = newShipmentData.Notes;
+            if (!string.IsNullOrEmpty(newShipmentData.Carrier_Code)) existingShipment.Carrier_Code = newShipmentData.Carrier_Code;
+            if (!string.IsNullOrEmpty(newShipmentData.Carrier_Description)) existingShipment.Carrier_Description = newShipmentData.Carrier_Description;
+            if (!string.IsNullOrEmpty(newShipmentData.Service_Code)) existingShipment.Service_Code = newShipmentData.Service_Code;
+            if (!string.IsNullOrEmpty(newShipmentData.Payment_Type)) existingShipment.Payment_Type = newShipmentData.Payment_Type;
+            if (!string.IsNullOrEmpty(newShipmentData.Transfer_Mode)) existingShipment.Transfer_Mode = newShipmentData.Transfer_Mode;
+            if (newShipmentData.Total_Package_Count != 0) existingShipment.Total_Package_Count = newShipmentData.Total_Package_Count;
+            if (newShipmentData.Total_Package_Weight != 0) existingShipment.Total_Package_Weight = newShipmentData.Total_Package_Weight;
+
+            existingShipment.Updated_At = GetTimestamp();
+
+            records.Refresh(existingShipment);
+            journal.Replace(existingShipment);
+
+            return true;
+        }
     }
 
     public void UpdateItemsInShipment(int shipmentId, List<Item> items)
     {
         var shipment = GetShipment(shipmentId);
+        var inventory = DataProvider.fetch_inventory_pool();
         List<Item> currentItems = new List<Item>();
         foreach (var i in shipment.Items) currentItems.Add(DataProvider.fetch_item_pool().GetItem(i.Item_Id));
         foreach (var currentItem in currentItems)
@@ -204,19 +289,34 @@ public class Shipments : Base
         UpdateShipment(shipmentId, shipment);
     }
 
+    // The records that keep a shipment from being deleted, by pool.
+    public Dictionary<string, List<string>> GetShipmentDependents(int shipmentId)
+    {
+        return DataProvider.References.GetReferrers("shipments", shipmentId, Dependents);
+    }
+
     public bool RemoveShipment(int shipmentId, bool force = true)
     {
         var shipment = GetShipment(shipmentId);
         if (shipment == null) return false;
-        if (force) return data.Remove(shipment);
+        if (force) return Delete(shipment);
 
-        var orders = DataProvider.fetch_order_pool().GetOrders();
-        if (orders.Any(order => order.Shipment_Id == shipmentId))
+        if (DataProvider.References.IsReferenced("shipments", shipmentId, Dependents))
         {
             return false;
         }
 
-        return data.Remove(shipment);
+        return Delete(shipment);
+    }
+
+    private bool Delete(Shipment shipment)
+    {
+        lock (records.WriteLock)
+        {
+            if (!records.Remove(shipment)) return false;
+            journal.Remove(shipment);
+            return true;
+        }
     }
 
     private void Load(bool isDebug)
@@ -227,20 +327,14 @@ public class Shipments : Base
         }
         else
         {
-            using (var reader = new StreamReader(dataPath))
-            {
-                var json = reader.ReadToEnd();
-                data = JsonConvert.DeserializeObject<List<Shipment>>(json);
-            }
+            data = journal.Load();
         }
+        records.Load(data);
+        journal.Sequence.Seed(data.Count > 0 ? data.Max(x => x.Id ?? 0) + 1 : 1);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(dataPath))
-        {
-            var json = JsonConvert.SerializeObject(data, Formatting.Indented);
-            writer.Write(json);
-        }
+        DataProvider.Commit(journal);
     }
 }
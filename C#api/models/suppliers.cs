@@ -5,6 +5,7 @@ using System.Linq;
 namespace ModelsV2;
 using ProvidersV2;
 using Newtonsoft.Json;
+using HelpersV2;
 using Microsoft.VisualBasic;
 
 public class Supplier
@@ -29,33 +30,65 @@ public class Suppliers : Base
 {
     private string dataPath;
     private List<Supplier> data;
+    private DataJournal<Supplier> journal;
+    private RecordIndex<int?, Supplier> records;
+    private RecordFilter<int?, Supplier> filters;
+    private TrigramIndex<int?> nameTrigrams;
+    private TrigramIndex<int?> countryTrigrams;
+    private TrigramIndex<int?> codeTrigrams;
+    private TrigramIndex<int?> phoneNumberTrigrams;
 
     public Suppliers(string rootPath, bool isDebug = false)
     {
         dataPath = Path.Combine(rootPath, "suppliers.json");
+        journal = new DataJournal<Supplier>(dataPath, x => x.Id.ToString(), () => data);
+        records = new RecordIndex<int?, Supplier>(x => x.Id);
+        nameTrigrams = records.AddTrigrams(x => x.Name);
+        countryTrigrams = records.AddTrigrams(x => x.Country);
+        codeTrigrams = records.AddTrigrams(x => x.Code);
+        phoneNumberTrigrams = records.AddTrigrams(x => x.Phonenumber);
+        filters = new RecordFilter<int?, Supplier>(records)
+            .Index("Name", nameTrigrams)
+            .Index("Country", countryTrigrams)
+            .Index("Code", codeTrigrams)
+            .Index("Phonenumber", phoneNumberTrigrams);
         Load(isDebug);
     }
 
     public List<Supplier> GetSuppliers()
     {
-        return data;
+        return records.InKeyOrder.ToList();
+    }
+
+    public PaginatedResponse<Supplier> GetSuppliersPage(int page, int pageSize, bool descending = false, string cursor = null, string filter = null, string sort = null)
+    {
+        if (filter != null || sort != null) return filters.Page(filter, sort, page, pageSize, descending, cursor);
+        return PaginationHelper.Paginate(records.Keys, records.Get, page, pageSize, descending, cursor);
     }
 
     public Supplier GetSupplier(int supplierId)
     {
-        return data.FirstOrDefault(supplier => supplier.Id == supplierId);
+        return records.Get(supplierId);
     }
 
     public bool AddSupplier(Supplier supplier)
     {
-        supplier.Id = data.Count > 0 ? data.Max(s => s.Id) + 1 : 1;
+        supplier.Id = journal.Sequence.Next();
         if (supplier.Created_At == null) supplier.Created_At = GetTimestamp();
         if (supplier.Updated_At == null) supplier.Updated_At = GetTimestamp();
-        data.Add(supplier);
+        if (!records.Add(supplier)) return false;
+        journal.Add(supplier);
         return true;
     }
 
-    public List<Supplier> SearchSuppliers(string name = null, string country = null, string code = null, string phoneNumber = null)
+    public bool InsertSupplier(Supplier supplier)
+    {
+        if (supplier.Created_At == null) supplier.Created_At = GetTimestamp();
+        if (supplier.Updated_At == null) supplier.Updated_At = GetTimestamp();
+        return InsertWithId(records, journal, supplier, x => (int)x.Id);
+    }
+
+    public IEnumerable<Supplier> SearchSuppliers(string name = null, string country = null, string code = null, string phoneNumber = null)
     {
         if (string.IsNullOrEmpty(name) && string.IsNullOrEmpty(country) &&
             string.IsNullOrEmpty(code) && string.IsNullOrEmpty(phoneNumber))
@@ -63,86 +96,103 @@ public class Suppliers : Base
             throw new ArgumentException("At least one search parameter must be provided.");
         }
 
-        var query = data.AsQueryable();
+        var query = new RecordQuery<int?, Supplier>(records);
 
         if (!string.IsNullOrEmpty(name))
         {
-            query = query.Where(supplier => supplier.Name.Contains(name, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(supplier => supplier.Name.Contains(name, StringComparison.OrdinalIgnoreCase), nameTrigrams.Lookup(name));
         }
 
 
         if (!string.IsNullOrEmpty(country))
         {
-            query = query.Where(supplier => supplier.Country.Contains(country, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(supplier => supplier.Country.Contains(country, StringComparison.OrdinalIgnoreCase), countryTrigrams.Lookup(country));
         }
 
         if (!string.IsNullOrEmpty(code))
         {
-            query = query.Where(supplier => supplier.Code.Contains(code, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(supplier => supplier.Code.Contains(code, StringComparison.OrdinalIgnoreCase), codeTrigrams.Lookup(code));
         }
 
         if (!string.IsNullOrEmpty(phoneNumber))
         {
-            query = query.Where(supplier => supplier.Phonenumber.Contains(phoneNumber, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(supplier => supplier.Phonenumber.Contains(phoneNumber, StringComparison.OrdinalIgnoreCase), phoneNumberTrigrams.Lookup(phoneNumber));
         }
 
-        return query.ToList();
+        return query;
     }
 
     public bool UpdateSupplier(int supplierId, Supplier supplier)
     {
-        supplier.Updated_At = GetTimestamp();
-        var index = data.FindIndex(existingSupplier => existingSupplier.Id == supplierId);
-        
-        if (index >= 0)
+        lock (records.WriteLock)
         {
-            supplier.Id = data[index].Id;
-            supplier.Created_At = data[index].Created_At;
-            data[index] = supplier;
-            return true;
+            supplier.Updated_At = GetTimestamp();
+            var index = records.IndexOf(supplierId);
+        
+            if (index >= 0)
+            {
+                supplier.Id = data[index].Id;
+                supplier.Created_At = data[index].Created_At;
+                records.Replace(index, supplier);
+                journal.Replace(supplier);
+                return true;
+            }
+            return false;
         }
-        return false;
     }
 
     public bool ReplaceSupplier(int supplierId, Supplier newSupplierData)
     {
+        lock (records.WriteLock)
+        {
+            var index = records.IndexOf(supplierId);
+            var existingSupplier = records.Get(supplierId);
 
-    var index = data.FindIndex(existingSupplier => existingSupplier.Id == supplierId);
-    var existingSupplier = data.FirstOrDefault(existingSupplier => existingSupplier.Id == supplierId);
+            if (index < 0)
+            {
+                return false;
+            }
 
-    if (index < 0)
-    {
-        return false;
-    }
+            if (!string.IsNullOrEmpty(newSupplierData.Code)) existingSupplier.Code = newSupplierData.Code;
+            if (!string.IsNullOrEmpty(newSupplierData.Name)) existingSupplier.Name = newSupplierData.Name;
+            if (!string.IsNullOrEmpty(newSupplierData.Address)) existingSupplier.Address = newSupplierData.Address;
+            if (!string.IsNullOrEmpty(newSupplierData.Address_Extra)) existingSupplier.Address_Extra = newSupplierData.Address_Extra;
+            if (!string.IsNullOrEmpty(newSupplierData.City)) existingSupplier.City = newSupplierData.City;
+            if (!string.IsNullOrEmpty(newSupplierData.Zip_Code)) existingSupplier.Zip_Code = newSupplierData.Zip_Code;
+            if (!string.IsNullOrEmpty(newSupplierData.Province)) existingSupplier.Province = newSupplierData.Province;
+            if (!string.IsNullOrEmpty(newSupplierData.Country)) existingSupplier.Country = newSupplierData.Country;
+            if (!string.IsNullOrEmpty(newSupplierData.Contact_Name)) existingSupplier.Contact_Name = newSupplierData.Contact_Name;
+            if (!string.IsNullOrEmpty(newSupplierData.Phonenumber)) existingSupplier.Phonenumber = newSupplierData.Phonenumber;
+            if (!string.IsNullOrEmpty(newSupplierData.Reference)) existingSupplier.Reference = newSupplierData.Reference;
+            existingSupplier.Updated_At = GetTimestamp();
+            records.Refresh(existingSupplier);
+            journal.Replace(existingSupplier);
 
-    if (!string.IsNullOrEmpty(newSupplierData.Code)) existingSupplier.Code = newSupplierData.Code;
-    if (!string.IsNullOrEmpty(newSupplierData.Name)) existingSupplier.Name = newSupplierData.Name;
-    if (!string.IsNullOrEmpty(newSupplierData.Address)) existingSupplier.Address = newSupplierData.Address;
-    if (!string.IsNullOrEmpty(newSupplierData.Address_Extra)) existingSupplier.Address_Extra = newSupplierData.Address_Extra;
-    if (!string.IsNullOrEmpty(newSupplierData.City)) existingSupplier.City = newSupplierData.City;
-    if (!string.IsNullOrEmpty(newSupplierData.Zip_Code)) existingSupplier.Zip_Code = newSupplierData.Zip_Code;
-    if (!string.IsNullOrEmpty(newSupplierData.Province)) existingSupplier.Province = newSupplierData.Province;
-    if (!string.IsNullOrEmpty(newSupplierData.Country)) existingSupplier.Country = newSupplierData.Country;
-    if (!string.IsNullOrEmpty(newSupplierData.Contact_Name)) existingSupplier.Contact_Name = newSupplierData.Contact_Name;
-    if (!string.IsNullOrEmpty(newSupplierData.Phonenumber)) existingSupplier.Phonenumber = newSupplierData.Phonenumber;
-    if (!string.IsNullOrEmpty(newSupplierData.Reference)) existingSupplier.Reference = newSupplierData.Reference;
-    existingSupplier.Updated_At = GetTimestamp();
-
-    return true;
+            return true;
+        }
     }
     public bool RemoveSupplier(int supplierId, bool force = false)
     {
         var supplier = GetSupplier(supplierId);
         if (supplier == null) return false;
-        if (force) return data.Remove(supplier);
+        if (force) return Delete(supplier);
 
-        var items = DataProvider.fetch_item_pool().GetItems(); 
-        if (items.Any(item => item.Supplier_Id == supplierId))
+        if (DataProvider.fetch_item_pool().HasItemsForSupplier(supplierId))
         {
             return false;
         }
 
-        return data.Remove(supplier);
+        return Delete(supplier);
+    }
+
+    private bool Delete(Supplier supplier)
+    {
+        lock (records.WriteLock)
+        {
+            if (!records.Remove(supplier)) return false;
+            journal.Remove(supplier);
+            return true;
+        }
     }
 
     private void Load(bool isDebug)
@@ -153,20 +203,14 @@ public class Suppliers : Base
         }
         else
         {
-            using (var reader = new StreamReader(dataPath))
-            {
-                var json = reader.ReadToEnd();
-                data = JsonConvert.DeserializeObject<List<Supplier>>(json);
-            }
+            data = journal.Load();
         }
+        records.Load(data);
+        journal.Sequence.Seed(data.Count > 0 ? data.Max(x => x.Id ?? 0) + 1 : 1);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(dataPath))
-        {
-            var json = JsonConvert.SerializeObject(data, Formatting.Indented);
-            writer.Write(json);
-        }
+        DataProvider.Commit(journal);
     }
 }
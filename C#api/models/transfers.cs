@@ -5,6 +5,7 @@ using System.Linq;
 namespace ModelsV2;
 using ProvidersV2;
 using Newtonsoft.Json;
+using HelpersV2;
 
 public class TransferItem
 {
@@ -27,21 +28,60 @@ public class Transfers : Base
 {
     private string dataPath;
     private List<Transfer> data;
+    private DataJournal<Transfer> journal;
+    private RecordIndex<int?, Transfer> records;
+    private RecordFilter<int?, Transfer> filters;
+    private SecondaryIndex<string, int?> byItem;
+    private SecondaryIndex<string, int?> byStatus;
+    private SecondaryIndex<int?, int?> byTransferFrom;
+    private SecondaryIndex<int?, int?> byTransferTo;
+    private RangeIndex<int?> byCreatedAt;
 
     public Transfers(string rootPath, bool isDebug = false)
     {
         dataPath = Path.Combine(rootPath, "transfers.json");
+        journal = new DataJournal<Transfer>(dataPath, x => x.Id.ToString(), () => data);
+        records = new RecordIndex<int?, Transfer>(x => x.Id);
+        records.AddReferences(DataProvider.References, "transfers", References);
+        byItem = records.AddMultiIndex(x => x.Items?.Select(item => item.Item_Id), x => Timestamps.Parse(x.Created_At) ?? long.MinValue);
+        byStatus = records.AddIndex(x => x.Transfer_Status);
+        byTransferFrom = records.AddIndex(x => x.Transfer_From);
+        byTransferTo = records.AddIndex(x => x.Transfer_To);
+        byCreatedAt = records.AddRangeIndex(x => Timestamps.Parse(x.Created_At));
+        filters = new RecordFilter<int?, Transfer>(records)
+            .Index("Created_At", byCreatedAt)
+            .Index("Transfer_Status", byStatus)
+            .Index("Transfer_From", byTransferFrom)
+            .Index("Transfer_To", byTransferTo);
         Load(isDebug);
     }
 
+    private static IEnumerable<(string Pool, object Key)> References(Transfer transfer)
+    {
+        if (transfer.Items == null) yield break;
+        foreach (var item in transfer.Items) yield return ("items", item.Item_Id);
+    }
+
     public List<Transfer> GetTransfers()
     {
-        return data;
+        return records.InKeyOrder.ToList();
+    }
+
+    public PaginatedResponse<Transfer> GetTransfersPage(int page, int pageSize, bool descending = false, string cursor = null, string filter = null, string sort = null)
+    {
+        if (filter != null || sort != null) return filters.Page(filter, sort, page, pageSize, descending, cursor);
+        return PaginationHelper.Paginate(records.Keys, records.Get, page, pageSize, descending, cursor);
     }
 
     public Transfer GetTransfer(int transferId)
     {
-        return data.FirstOrDefault(transfer => transfer.Id == transferId);
+        return records.Get(transferId);
+    }
+
+    // In the order they were created, straight from the item index.
+    public PaginatedResponse<Transfer> GetTransfersForItemPage(string itemId, int page, int pageSize)
+    {
+        return PaginationHelper.PaginateInOrder(byItem.Get(itemId), records.Get, page, pageSize);
     }
 
     public List<TransferItem> GetItemsInTransfer(int transferId)
@@ -52,36 +92,54 @@ public class Transfers : Base
 
     public bool AddTransfer(Transfer transfer)
     {
-        transfer.Id = data.Count > 0 ? data.Max(t => t.Id) + 1 : 1;
+        transfer.Id = journal.Sequence.Next();
         transfer.Transfer_Status = "Scheduled";
         if (transfer.Created_At == null) transfer.Created_At = GetTimestamp();
         if (transfer.Updated_At == null) transfer.Updated_At = GetTimestamp();
-        data.Add(transfer);
+        if (!records.Add(transfer)) return false;
+        journal.Add(transfer);
         return true;
     }
 
-    public List<Transfer> SearchTransfers(int? transferFrom = null, int? transferTo = null, string transferStatus = null, string createdAt = null)
+    public bool InsertTransfer(Transfer transfer)
+    {
+        if (transfer.Created_At == null) transfer.Created_At = GetTimestamp();
+        if (transfer.Updated_At == null) transfer.Updated_At = GetTimestamp();
+        return InsertWithId(records, journal, transfer, x => (int)x.Id);
+    }
+
+    public IEnumerable<Transfer> SearchTransfers(int? transferFrom = null, int? transferTo = null, string transferStatus = null, string createdAt = null, string from = null, string to = null)
     {
-        if (!transferFrom.HasValue && !transferTo.HasValue && string.IsNullOrEmpty(transferStatus) && string.IsNullOrEmpty(createdAt))
+        if (!transferFrom.HasValue && !transferTo.HasValue && string.IsNullOrEmpty(transferStatus) && string.IsNullOrEmpty(createdAt) &&
+            string.IsNullOrEmpty(from) && string.IsNullOrEmpty(to))
         {
             throw new ArgumentException("At least one search parameter must be provided.");
         }
 
-        var query = data.AsQueryable();
+        var fromTicks = Timestamps.ParseBound(from, "from");
+        var toTicks = Timestamps.ParseBound(to, "to", upper: true);
+        var dated = fromTicks.HasValue || toTicks.HasValue;
+
+        var query = new RecordQuery<int?, Transfer>(records);
+
+        if (dated)
+        {
+            query = query.Where(transfer => byCreatedAt.IsBetween(transfer.Id, fromTicks, toTicks), byCreatedAt.Lookup(fromTicks, toTicks));
+        }
 
         if (transferFrom.HasValue)
         {
-            query = query.Where(transfer => transfer.Transfer_From == transferFrom.Value);
+            query = query.Where(transfer => transfer.Transfer_From == transferFrom.Value, byTransferFrom.Lookup(transferFrom.Value));
         }
 
         if (transferTo.HasValue)
         {
-            query = query.Where(transfer => transfer.Transfer_To == transferTo.Value);
+            query = query.Where(transfer => transfer.Transfer_To == transferTo.Value, byTransferTo.Lookup(transferTo.Value));
         }
 
         if (!string.IsNullOrEmpty(transferStatus))
         {
-            query = query.Where(transfer => transfer.Transfer_Status.Contains(transferStatus, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(transfer => transfer.Transfer_Status.Contains(transferStatus, StringComparison.OrdinalIgnoreCase), byStatus.LookupWhere(status => status.Contains(transferStatus, StringComparison.OrdinalIgnoreCase)));
         }
 
         if (!string.IsNullOrEmpty(createdAt))
@@ -89,41 +147,50 @@ public class Transfers : Base
             query = query.Where(transfer => transfer.Created_At.Contains(createdAt, StringComparison.OrdinalIgnoreCase));
         }
 
-        return query.ToList();
+        return query;
     }
 
     public bool UpdateTransfer(int transferId, Transfer transfer)
     {
-        transfer.Updated_At = GetTimestamp();
-        var index = data.FindIndex(existingTransfer => existingTransfer.Id == transferId);
-        
-        if (index >= 0)
+        lock (records.WriteLock)
         {
-            transfer.Id = data[index].Id;
-            transfer.Created_At = data[index].Created_At;
-            data[index] = transfer;
-            return true;
+            transfer.Updated_At = GetTimestamp();
+            var index = records.IndexOf(transferId);
+        
+            if (index >= 0)
+            {
+                transfer.Id = data[index].Id;
+                transfer.Created_At = data[index].Created_At;
+                records.Replace(index, transfer);
+                journal.Replace(transfer);
+                return true;
+            }
+            return false;
         }
-        return false;
     }
 
     public bool ReplaceTransfer(int transferId, Transfer newTransferData)
     {
-        var index = data.FindIndex(existingTransfer => existingTransfer.Id == transferId);
-        var existingTransfer = data.FirstOrDefault(existingTransfer => existingTransfer.Id == transferId);
-
-        if (index < 0)
+        lock (records.WriteLock)
         {
-            return false;
-        }
+            var index = records.IndexOf(transferId);
+            var existingTransfer = records.Get(transferId);
 
-        if (!string.IsNullOrEmpty(newTransferData.Reference)) existingTransfer.Reference = newTransferData.Reference;   
-        if (newTransferData.Transfer_From != null) existingTransfer.Transfer_From = newTransferData.Transfer_From;
-        if (newTransferData.Transfer_To != null) existingTransfer.Transfer_To = newTransferData.Transfer_To;
-        if (!string.IsNullOrEmpty(newTransferData.Transfer_Status)) existingTransfer.Transfer_Status = newTransferData.Transfer_Status;
-        existingTransfer.Updated_At = GetTimestamp();
+            if (index < 0)
+            {
+                return false;
+            }
+
+            if (!string.IsNullOrEmpty(newTransferData.Reference)) existingTransfer.Reference = newTransferData.Reference;   
+            if (newTransferData.Transfer_From != null) existingTransfer.Transfer_From = newTransferData.Transfer_From;
+            if (newTransferData.Transfer_To != null) existingTransfer.Transfer_To = newTransferData.Transfer_To;
+            if (!string.IsNullOrEmpty(newTransferData.Transfer_Status)) existingTransfer.Transfer_Status = newTransferData.Transfer_Status;
+            existingTransfer.Updated_At = GetTimestamp();
+            records.Refresh(existingTransfer);
+            journal.Replace(existingTransfer);
         
-        return true;
+            return true;
+        }
     }
 
     public bool RemoveTransfer(int transferId)
@@ -131,7 +198,17 @@ public class Transfers : Base
         var transfer = GetTransfer(transferId);
         if (transfer == null) return false;
 
-        return data.Remove(transfer);
+        return Delete(transfer);
+    }
+
+    private bool Delete(Transfer transfer)
+    {
+        lock (records.WriteLock)
+        {
+            if (!records.Remove(transfer)) return false;
+            journal.Remove(transfer);
+            return true;
+        }
     }
 
     private void Load(bool isDebug)
@@ -142,20 +219,14 @@ public class Transfers : Base
         }
         else
         {
-            using (var reader = new StreamReader(dataPath))
-            {
-                var json = File.ReadAllText(dataPath);
-                data = JsonConvert.DeserializeObject<List<Transfer>>(json);
-            }
+            data = journal.Load();
         }
+        records.Load(data);
+        journal.Sequence.Seed(data.Count > 0 ? data.Max(x => x.Id ?? 0) + 1 : 1);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(dataPath))
-        {
-            var json = JsonConvert.SerializeObject(data, Formatting.Indented);
-            writer.Write(json);
-        }
+        DataProvider.Commit(journal);
     }
 }
@@ -5,6 +5,7 @@ using System.Linq;
 namespace ModelsV2;
 using ProvidersV2;
 using Newtonsoft.Json; // Ensure you have Newtonsoft.Json package installed
+using HelpersV2;
 using Microsoft.AspNetCore.Mvc;
 using System.Security.Authentication;
 
@@ -35,106 +36,155 @@ public class Warehouses : Base
 {
     private string dataPath;
     private List<Warehouse> data;
+    private DataJournal<Warehouse> journal;
+    private RecordIndex<int?, Warehouse> records;
+    // The pools whose records keep one of these from being deleted.
+    private static readonly string[] Dependents = { "orders" };
+    private RecordFilter<int?, Warehouse> filters;
+    private TrigramIndex<int?> codeTrigrams;
+    private TrigramIndex<int?> nameTrigrams;
+    private TrigramIndex<int?> cityTrigrams;
+    private TrigramIndex<int?> countryTrigrams;
 
     public Warehouses(string rootPath, bool isDebug = false)
     {
         dataPath = Path.Combine(rootPath, "warehouses.json");
         dataPath = dataPath.Replace("\\", "/");
+        journal = new DataJournal<Warehouse>(dataPath, x => x.Id.ToString(), () => data);
+        records = new RecordIndex<int?, Warehouse>(x => x.Id);
+        codeTrigrams = records.AddTrigrams(x => x.Code);
+        nameTrigrams = records.AddTrigrams(x => x.Name);
+        cityTrigrams = records.AddTrigrams(x => x.City);
+        countryTrigrams = records.AddTrigrams(x => x.Country);
+        filters = new RecordFilter<int?, Warehouse>(records)
+            .Index("Code", codeTrigrams)
+            .Index("Name", nameTrigrams)
+            .Index("City", cityTrigrams)
+            .Index("Country", countryTrigrams);
         Load(isDebug);
     }
 
     public List<Warehouse> GetWarehouses()
     {
-        return data;
+        return records.InKeyOrder.ToList();
+    }
+
+    public PaginatedResponse<Warehouse> GetWarehousesPage(int page, int pageSize, bool descending = false, string cursor = null, string filter = null, string sort = null)
+    {
+        if (filter != null || sort != null) return filters.Page(filter, sort, page, pageSize, descending, cursor);
+        return PaginationHelper.Paginate(records.Keys, records.Get, page, pageSize, descending, cursor);
     }
 
     public Warehouse GetWarehouse(int warehouseId)
     {
-        return data.FirstOrDefault(warehouse => warehouse.Id == warehouseId);
+        return records.Get(warehouseId);
     }
 
     public bool AddWarehouse(Warehouse warehouse)
     {
-        warehouse.Id = data.Count > 0 ? data.Max(w => w.Id) + 1 : 1;
+        warehouse.Id = journal.Sequence.Next();
         if (warehouse.Created_At == null) warehouse.Created_At = GetTimestamp();
         if (warehouse.Updated_At == null) warehouse.Updated_At = GetTimestamp();
-        data.Add(warehouse);
+        if (!records.Add(warehouse)) return false;
+        journal.Add(warehouse);
         return true;
     }
 
-    public List<Warehouse> SearchWarehouses(string code = null, string name = null, string city = null ,string country = null)
+    public bool InsertWarehouse(Warehouse warehouse)
+    {
+        if (warehouse.Created_At == null) warehouse.Created_At = GetTimestamp();
+        if (warehouse.Updated_At == null) warehouse.Updated_At = GetTimestamp();
+        return InsertWithId(records, journal, warehouse, x => (int)x.Id);
+    }
+
+    public IEnumerable<Warehouse> SearchWarehouses(string code = null, string name = null, string city = null ,string country = null)
     {
         if (string.IsNullOrEmpty(code) && string.IsNullOrEmpty(name) && string.IsNullOrEmpty(city) && string.IsNullOrEmpty(country))
         {
             throw new ArgumentException("At least one search parameter must be provided.");
         }
 
-        var query = data.AsQueryable();
+        var query = new RecordQuery<int?, Warehouse>(records);
 
         if (!string.IsNullOrEmpty(code))
         {
-            query = query.Where(warehouse => warehouse.Code.Contains(code, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(warehouse => warehouse.Code.Contains(code, StringComparison.OrdinalIgnoreCase), codeTrigrams.Lookup(code));
         }
 
         if (!string.IsNullOrEmpty(name))
         {
-            query = query.Where(warehouse => warehouse.Name.Contains(name, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(warehouse => warehouse.Name.Contains(name, StringComparison.OrdinalIgnoreCase), nameTrigrams.Lookup(name));
         }
 
         if (!string.IsNullOrEmpty(city))
         {
-            query = query.Where(warehouse => warehouse.City.Contains(city, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(warehouse => warehouse.City.Contains(city, StringComparison.OrdinalIgnoreCase), cityTrigrams.Lookup(city));
         }
 
         if (!string.IsNullOrEmpty(country))
         {
-            query = query.Where(warehouse => warehouse.Country.Contains(country, StringComparison.OrdinalIgnoreCase));
+            query = query.Where(warehouse => warehouse.Country.Contains(country, StringComparison.OrdinalIgnoreCase), countryTrigrams.Lookup(country));
         }
-        return query.ToList();
+        return query;
     }
 
     public bool UpdateWarehouse(int warehouseId, Warehouse warehouse)
     {
-        warehouse.Updated_At = GetTimestamp();
-        var index = data.FindIndex(existingWarehouse => existingWarehouse.Id == warehouseId);
-        
-        if (index >= 0)
+        lock (records.WriteLock)
         {
-            warehouse.Id = data[index].Id;
-            warehouse.Created_At = data[index].Created_At;
-            data[index] = warehouse;
-            return true;
+            warehouse.Updated_At = GetTimestamp();
+            var index = records.IndexOf(warehouseId);
+        
+            if (index >= 0)
+            {
+                warehouse.Id = data[index].Id;
+                warehouse.Created_At = data[index].Created_At;
+                records.Replace(index, warehouse);
+                journal.Replace(warehouse);
+                return true;
+            }
+            return false;
         }
-        return false;
     }
 
     public bool ReplaceWarehouse(int warehouseId, Warehouse newWarehouseData)
     {
-        var index = data.FindIndex(existingWarehouse => existingWarehouse.Id == warehouseId);
-        var existingWarehouse = data.FirstOrDefault(existingWarehouse => existingWarehouse.Id == warehouseId);
-
-        if (index < 0) 
+        lock (records.WriteLock)
         {
-            return false;
-        }
+            var index = records.IndexOf(warehouseId);
+            var existingWarehouse = records.Get(warehouseId);
 
-        if (!string.IsNullOrEmpty(newWarehouseData.Code)) existingWarehouse.Code = newWarehouseData.Code;
-        if (!string.IsNullOrEmpty(newWarehouseData.Name)) existingWarehouse.Name = newWarehouseData.Name;
-        if (!string.IsNullOrEmpty(newWarehouseData.Address)) existingWarehouse.Address = newWarehouseData.Address;
-        if (!string.IsNullOrEmpty(newWarehouseData.Zip)) existingWarehouse.Zip = newWarehouseData.Zip;
-        if (!string.IsNullOrEmpty(newWarehouseData.City)) existingWarehouse.City = newWarehouseData.City;
-        if (!string.IsNullOrEmpty(newWarehouseData.Province)) existingWarehouse.Province = newWarehouseData.Province;
-        if (!string.IsNullOrEmpty(newWarehouseData.Country)) existingWarehouse.Country = newWarehouseData.Country;
-        if (newWarehouseData.Contact != null)
-        {
-            if (!string.IsNullOrEmpty(newWarehouseData.Contact.Name)) existingWarehouse.Contact.Name = newWarehouseData.Contact.Name;
-            if (!string.IsNullOrEmpty(newWarehouseData.Contact.Phone)) existingWarehouse.Contact.Phone = newWarehouseData.Contact.Phone;
-            if (!string.IsNullOrEmpty(newWarehouseData.Contact.Email)) existingWarehouse.Contact.Email = newWarehouseData.Contact.Email;
-        }
-        existingWarehouse.Updated_At = GetTimestamp();
+            if (index < 0) 
+            {
+                return false;
+            }
 
-        return true;
+            if (!string.IsNullOrEmpty(newWarehouseData.Code)) existingWarehouse.Code = newWarehouseData.Code;
+            if (!string.IsNullOrEmpty(newWarehouseData.Name)) existingWarehouse.Name = newWarehouseData.Name;
+            if (!string.IsNullOrEmpty(newWarehouseData.Address)) existingWarehouse.Address = newWarehouseData.Address;
+            if (!string.IsNullOrEmpty(newWarehouseData.Zip)) existingWarehouse.Zip = newWarehouseData.Zip;
+            if (!string.IsNullOrEmpty(newWarehouseData.City)) existingWarehouse.City = newWarehouseData.City;
+            if (!string.IsNullOrEmpty(newWarehouseData.Province)) existingWarehouse.Province = newWarehouseData.Province;
+            if (!string.IsNullOrEmpty(newWarehouseData.Country)) existingWarehouse.Country = newWarehouseData.Country;
+            if (newWarehouseData.Contact != null)
+            {
+                if (!string.IsNullOrEmpty(newWarehouseData.Contact.Name)) existingWarehouse.Contact.Name = newWarehouseData.Contact.Name;
+                if (!string.IsNullOrEmpty(newWarehouseData.Contact.Phone)) existingWarehouse.Contact.Phone = newWarehouseData.Contact.Phone;
+                if (!string.IsNullOrEmpty(newWarehouseData.Contact.Email)) existingWarehouse.Contact.Email = newWarehouseData.Contact.Email;
+            }
+            existingWarehouse.Updated_At = GetTimestamp();
+            records.Refresh(existingWarehouse);
+            journal.Replace(existingWarehouse);
+
+            return true;
 
+        }
+    }
+
+    // The records that keep a warehouse from being deleted, by pool.
+    public Dictionary<string, List<string>> GetWarehouseDependents(int warehouseId)
+    {
+        return DataProvider.References.GetReferrers("warehouses", warehouseId, Dependents);
     }
 
     public bool RemoveWarehouse(int warehouseId, bool force = false)
@@ -142,14 +192,23 @@ public class Warehouses : Base
         var warehouse = GetWarehouse(warehouseId);
         if (warehouse == null) return false;
 
-        if (force) return data.Remove(warehouse);
-        var orders = DataProvider.fetch_order_pool().GetOrders(); 
-        if (orders.Any(order => order.Warehouse_Id == warehouseId))
+        if (force) return Delete(warehouse);
+        if (DataProvider.References.IsReferenced("warehouses", warehouseId, Dependents))
         {
             return false;
         }
 
-        return data.Remove(warehouse);
+        return Delete(warehouse);
+    }
+
+    private bool Delete(Warehouse warehouse)
+    {
+        lock (records.WriteLock)
+        {
+            if (!records.Remove(warehouse)) return false;
+            journal.Remove(warehouse);
+            return true;
+        }
     }
 
     private void Load(bool isDebug)
@@ -160,20 +219,14 @@ public class Warehouses : Base
         }
         else
         {
-            using (var reader = new StreamReader(dataPath))
-            {
-                var json = reader.ReadToEnd();
-                data = JsonConvert.DeserializeObject<List<Warehouse>>(json);
-            }
+            data = journal.Load();
         }
+        records.Load(data);
+        journal.Sequence.Seed(data.Count > 0 ? data.Max(x => x.Id ?? 0) + 1 : 1);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(dataPath))
-        {
-            var json = JsonConvert.SerializeObject(data, Formatting.Indented);
-            writer.Write(json);
-        }
+        DataProvider.Commit(journal);
     }
 }
@@ -1,6 +1,11 @@
 using System;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
 using ModelsV2;
+using InterfacesV2;
 using System.IO;
+using HelpersV2;
 namespace ProvidersV2;
 
 class DataProvider
@@ -23,21 +28,60 @@ class DataProvider
     private static Clients _clients;
     private static Shipments _shipments;
 
+    private static volatile JournalFlusher? _flusher;
 
-    public static void Init()
+    public static ReferenceTracker References { get; } = new ReferenceTracker();
+
+    public static void Init(int flushIntervalMs = 1000, int flushBatchSize = 100, bool durableWrites = false)
+    {
+        var loader = new PoolLoader(ROOT_PATH);
+        var warehouses = loader.Load("warehouses", () => new Warehouses(ROOT_PATH, DEBUG), pool => pool.GetWarehouses().Count);
+        var locations = loader.Load("locations", () => new Locations(ROOT_PATH, DEBUG), pool => pool.GetLocations().Count);
+        var transfers = loader.Load("transfers", () => new Transfers(ROOT_PATH, DEBUG), pool => pool.GetTransfers().Count);
+        var items = loader.Load("items", () => new Items(ROOT_PATH, DEBUG), pool => pool.GetItems().Count);
+        var itemLines = loader.Load("item_lines", () => new ItemLines(ROOT_PATH, DEBUG), pool => pool.GetItemLines().Count);
+        var itemGroups = loader.Load("item_groups", () => new ItemGroups(ROOT_PATH, DEBUG), pool => pool.GetItemGroups().Count);
+        var itemTypes = loader.Load("item_types", () => new ItemTypes(ROOT_PATH, DEBUG), pool => pool.GetItemTypes().Count);
+        var inventories = loader.Load("inventories", () => new Inventories(ROOT_PATH, DEBUG), pool => pool.GetInventories().Count);
+        var suppliers = loader.Load("suppliers", () => new Suppliers(ROOT_PATH, DEBUG), pool => pool.GetSuppliers().Count);
+        var orders = loader.Load("orders", () => new Orders(ROOT_PATH, DEBUG), pool => pool.GetOrders().Count);
+        var clients = loader.Load("clients", () => new Clients(ROOT_PATH, DEBUG), pool => pool.GetClients().Count);
+        var shipments = loader.Load("shipments", () => new Shipments(ROOT_PATH, DEBUG), pool => pool.GetShipments().Count);
+        Console.WriteLine(loader.Report("DataProvider v2"));
+
+        _warehouses = warehouses.Result;
+        _locations = locations.Result;
+        _transfers = transfers.Result;
+        _items = items.Result;
+        _itemLines = itemLines.Result;
+        _itemGroups = itemGroups.Result;
+        _itemTypes = itemTypes.Result;
+        _inventories = inventories.Result;
+        _suppliers = suppliers.Result;
+        _orders = orders.Result;
+        _clients = clients.Result;
+        _shipments = shipments.Result;
+
+        _flusher = new JournalFlusher(flushIntervalMs, flushBatchSize, durableWrites);
+    }
+
+    // Hands the pool's pending journal entries to the background flusher; before Init
+    // (or after Stop) they are written straight away.
+    public static void Commit(IJournal journal)
+    {
+        var flusher = _flusher;
+        if (flusher == null)
+        {
+            journal.Flush();
+            return;
+        }
+        flusher.Commit(journal);
+    }
+
+    public static void Stop()
     {
-        _warehouses = new Warehouses(ROOT_PATH, DEBUG);
-        _locations = new Locations(ROOT_PATH, DEBUG);
-        _transfers = new Transfers(ROOT_PATH, DEBUG);
-        _items = new Items(ROOT_PATH, DEBUG);
-        _itemLines = new ItemLines(ROOT_PATH, DEBUG);
-        _itemGroups = new ItemGroups(ROOT_PATH, DEBUG);
-        _itemTypes = new ItemTypes(ROOT_PATH, DEBUG);
-        _inventories = new Inventories(ROOT_PATH, DEBUG);
-        _suppliers = new Suppliers(ROOT_PATH, DEBUG);
-        _orders = new Orders(ROOT_PATH, DEBUG);
-        _clients = new Clients(ROOT_PATH, DEBUG);
-        _shipments = new Shipments(ROOT_PATH, DEBUG);
+        _flusher?.Stop();
+        _flusher = null;
     }
 
     public static Warehouses fetch_warehouse_pool() => _warehouses;
@@ -1,5 +1,6 @@
 using Microsoft.AspNetCore.Mvc;
 using Models;
+using ModelsV2;
 using Providers;
 namespace Processors;
 [ApiController]
@@ -50,7 +51,7 @@ public class ClientsController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "clients", "post");
         if (auth != null) return auth;
 
-        if (client.Id == -10) return BadRequest("ID not given in body");
+        if (client.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_client_pool().AddClient(client);
         if (!success) return NotFound("ID already exists in data");
@@ -65,7 +66,7 @@ public class ClientsController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "clients", "put");
         if (auth != null) return auth;
 
-        if (client.Id == -10) return BadRequest("ID not given in body");
+        if (client.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_client_pool().UpdateClient(id, client);
         if (!success) return NotFound("ID not found or ID in Body and Route are not matching");
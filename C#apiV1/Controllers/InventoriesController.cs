@@ -1,5 +1,6 @@
 using Microsoft.AspNetCore.Mvc;
 using Models;
+using ModelsV2;
 using Providers;
 namespace Processors;
 
@@ -41,7 +42,7 @@ public class InventoriesController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "inventories", "post");
         if (auth != null) return auth;
 
-        if (inventory.Id == -10) return BadRequest("ID not given in body");
+        if (inventory.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_inventory_pool().AddInventory(inventory);
         if (!success) return NotFound("ID already exists in data");
@@ -56,7 +57,7 @@ public class InventoriesController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "inventories", "put");
         if (auth != null) return auth;
 
-        if (inventory.Id == -10) return BadRequest("ID not given in body");
+        if (inventory.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_inventory_pool().UpdateInventory(id, inventory);
         if (!success) return NotFound("ID not found or ID in Body and Route are not matching");
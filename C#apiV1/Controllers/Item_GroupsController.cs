@@ -1,5 +1,6 @@
 using Microsoft.AspNetCore.Mvc;
 using Models;
+using ModelsV2;
 using Providers;
 namespace Processors;
 
@@ -51,7 +52,7 @@ public class Item_GroupsController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "item_groups", "post");
         if (auth != null) return auth;
 
-        if (itemGroup.Id == -10) return BadRequest("ID not given in body");
+        if (itemGroup.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_itemgroup_pool().AddItemGroup(itemGroup);
         if (!success) return NotFound("ID already exists in data");
@@ -66,7 +67,7 @@ public class Item_GroupsController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "item_groups", "put");
         if (auth != null) return auth;
 
-        if (itemGroup.Id == -10) return BadRequest("ID not given in body");
+        if (itemGroup.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_itemgroup_pool().UpdateItemGroup(id, itemGroup);
         if (!success) return NotFound("ID not found or ID in Body and Route are not matching");
@@ -1,5 +1,6 @@
 using Microsoft.AspNetCore.Mvc;
 using Models;
+using ModelsV2;
 using Providers;
 namespace Processors;
 
@@ -51,7 +52,7 @@ public class Item_TypesController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "item_types", "post");
         if (auth != null) return auth;
 
-        if (itemType.Id == -10) return BadRequest("ID not given in body");
+        if (itemType.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_itemtype_pool().AddItemtype(itemType);
         if (!success) return NotFound("ID already exists in data");
@@ -66,7 +67,7 @@ public class Item_TypesController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "item_types", "put");
         if (auth != null) return auth;
 
-        if (itemType.Id == -10) return BadRequest("ID not given in body");
+        if (itemType.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_itemtype_pool().UpdateItemtype(id, itemType);
         if (!success) return NotFound("ID not found or ID in Body and Route are not matching");
@@ -1,5 +1,6 @@
 using Microsoft.AspNetCore.Mvc;
 using Models;
+using ModelsV2;
 using Providers;
 namespace Processors;
 
@@ -41,8 +42,10 @@ public class LocationsController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "locations", "get");
         if (auth != null) return auth;
 
-        var inventory = DataProvider.fetch_location_pool().GetLocationsInWarehouse(id);
-        return Ok(inventory);
+        if (DataProvider.fetch_location_pool().GetLocation(id) == null) return NotFound();
+
+        var inventories = DataProvider.fetch_inventory_pool().GetInventoriesForLocation(id);
+        return Ok(inventories);
     }
 
     [HttpPost]
@@ -51,7 +54,7 @@ public class LocationsController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "locations", "post");
         if (auth != null) return auth;
 
-        if (location.Id == -10) return BadRequest("ID not given in body");
+        if (location.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_location_pool().AddLocation(location);
         if (!success) return NotFound("ID already exists in data");
@@ -66,7 +69,7 @@ public class LocationsController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "locations", "put");
         if (auth != null) return auth;
 
-        if (location.Id == -10) return BadRequest("ID not given in body");
+        if (location.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_location_pool().UpdateLocation(id, location);
         if (!success) return NotFound("ID not found or ID in Body and Route are not matching");
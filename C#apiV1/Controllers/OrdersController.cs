@@ -1,5 +1,6 @@
 using Microsoft.AspNetCore.Mvc;
 using Models;
+using ModelsV2;
 using Providers;
 namespace Processors;
 
@@ -51,7 +52,7 @@ public class OrdersController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "orders", "post");
         if (auth != null) return auth;
 
-        if (order.Id == -10) return BadRequest("ID not given in body");
+        if (order.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_order_pool().AddOrder(order);
         if (!success) return NotFound("ID already exists in data");
@@ -66,7 +67,7 @@ public class OrdersController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "orders", "put");
         if (auth != null) return auth;
 
-        if (order.Id == -10) return BadRequest("ID not given in body");
+        if (order.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_order_pool().UpdateOrder(id, order);
         if (!success) return NotFound("ID not found or ID in Body and Route are not matching");
@@ -88,6 +89,7 @@ public class OrdersController : BaseApiController
 
         DataProvider.fetch_order_pool().UpdateItemsInOrder(id, items);
         DataProvider.fetch_order_pool().Save();
+        DataProvider.fetch_inventory_pool().Save();
         return Ok();
     }
 
@@ -100,6 +102,7 @@ public class OrdersController : BaseApiController
         var order = DataProvider.fetch_order_pool().GetOrder(id);
         if (order == null) return NotFound("No data found with given ID");
 
+        var changes = new List<(Inventory Inventory, int Delta)>();
         foreach (var item in order.Items)
         {
             var inventories = DataProvider.fetch_inventory_pool().GetInventoriesForItem(item.Item_Id);
@@ -107,10 +110,14 @@ public class OrdersController : BaseApiController
             {
                 if (inventory.Locations.Contains(order.Source_Id))
                 {
-                    inventory.Total_On_Hand -= item.Amount;
+                    changes.Add((inventory, -item.Amount));
                 }
             }
         }
+        if (!DataProvider.fetch_inventory_pool().AdjustOnHand(changes))
+        {
+            return BadRequest("Inventory could not be updated; the order was not committed.");
+        }
 
         order.Order_Status = "Processed";
         var success = DataProvider.fetch_order_pool().UpdateOrder(id, order);
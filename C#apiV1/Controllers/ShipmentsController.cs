@@ -1,5 +1,6 @@
 using Microsoft.AspNetCore.Mvc;
 using Models;
+using ModelsV2;
 using Providers;
 namespace Processors;
 
@@ -61,7 +62,7 @@ public class ShipmentsController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "shipments", "post");
         if (auth != null) return auth;
 
-        if (shipment.Id == -10) return BadRequest("ID not given in body");
+        if (shipment.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_shipment_pool().AddShipment(shipment);
         if (!success) return NotFound("ID already exists in data");
@@ -76,7 +77,7 @@ public class ShipmentsController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "shipments", "put");
         if (auth != null) return auth;
 
-        if (shipment.Id == -10) return BadRequest("ID not given in body");
+        if (shipment.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_shipment_pool().UpdateShipment(id, shipment);
         if (!success) return NotFound("ID not found or ID in Body and Route are not matching");
@@ -91,7 +92,7 @@ public class ShipmentsController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "shipments", "put");
         if (auth != null) return auth;
 
-        if (orders.Any(x => x.Id == -10)) return BadRequest("ID not given in body");
+        if (orders.Any(x => x.Id == null)) return BadRequest("ID not given in body");
 
         if (DataProvider.fetch_shipment_pool().GetShipment(id) == null)
             return NotFound("No data for given ID");
@@ -114,6 +115,7 @@ public class ShipmentsController : BaseApiController
 
         DataProvider.fetch_shipment_pool().UpdateItemsInShipment(id, items);
         DataProvider.fetch_shipment_pool().Save();
+        DataProvider.fetch_inventory_pool().Save();
         return Ok();
     }
 
@@ -126,6 +128,7 @@ public class ShipmentsController : BaseApiController
         var shipment = DataProvider.fetch_shipment_pool().GetShipment(id);
         if (shipment == null) return NotFound("No data found with given ID");
 
+        var changes = new List<(Inventory Inventory, int Delta)>();
         foreach (var item in shipment.Items)
         {
             var inventories = DataProvider.fetch_inventory_pool().GetInventoriesForItem(item.Item_Id);
@@ -133,10 +136,14 @@ public class ShipmentsController : BaseApiController
             {
                 if (inventory.Locations.Contains(shipment.Source_Id))
                 {
-                    inventory.Total_On_Hand -= item.Amount;
+                    changes.Add((inventory, -item.Amount));
                 }
             }
         }
+        if (!DataProvider.fetch_inventory_pool().AdjustOnHand(changes))
+        {
+            return BadRequest("Inventory could not be updated; the shipment was not committed.");
+        }
 
         shipment.Shipment_Status = "Shipped";
         var success = DataProvider.fetch_shipment_pool().UpdateShipment(id, shipment);
@@ -1,5 +1,6 @@
 using Microsoft.AspNetCore.Mvc;
 using Models;
+using ModelsV2;
 using Providers;
 namespace Processors;
 
@@ -51,7 +52,7 @@ public class SuppliersController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "suppliers", "post");
         if (auth != null) return auth;
 
-        if (supplier.Id == -10) return BadRequest("ID not given in body");
+        if (supplier.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_supplier_pool().AddSupplier(supplier);
         if (!success) return NotFound("ID already exists in data");
@@ -66,7 +67,7 @@ public class SuppliersController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "suppliers", "put");
         if (auth != null) return auth;
 
-        if (supplier.Id == -10) return BadRequest("ID not given in body");
+        if (supplier.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_supplier_pool().UpdateSupplier(id, supplier);
         if (!success) return NotFound("ID not found or ID in Body and Route are not matching");
@@ -1,5 +1,6 @@
 using Microsoft.AspNetCore.Mvc;
 using Models;
+using ModelsV2;
 using Providers;
 namespace Processors;
 
@@ -51,7 +52,7 @@ public class TransfersController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "transfers", "post");
         if (auth != null) return auth;
 
-        if (transfer.Id == -10) return BadRequest("ID not given in body");
+        if (transfer.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_transfer_pool().AddTransfer(transfer);
         if (!success) return NotFound("ID already exists in data");
@@ -66,7 +67,7 @@ public class TransfersController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "transfers", "put");
         if (auth != null) return auth;
 
-        if (transfer.Id == -10) return BadRequest("ID not given in body");
+        if (transfer.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_transfer_pool().UpdateTransfer(id, transfer);
         if (!success) return NotFound("ID not found or ID in Body and Route are not matching");
@@ -100,9 +101,10 @@ public class TransfersController : BaseApiController
         var transfer = DataProvider.fetch_transfer_pool().GetTransfer(id);
         if (transfer == null) return NotFound("Transfer not found");
 
-        if (transfer.Id == -10) return BadRequest("Invalid transfer ID");
+        if (transfer.Id == null) return BadRequest("Invalid transfer ID");
 
         // Update inventories based on transfer items
+        var changes = new List<(Inventory Inventory, int Delta)>();
         foreach (var item in transfer.Items)
         {
             var inventories = DataProvider.fetch_inventory_pool().GetInventoriesForItem(item.Item_Id);
@@ -111,15 +113,18 @@ public class TransfersController : BaseApiController
                 if (transfer.Transfer_From is null) break;
                 if (inventory.Locations.Contains((int)transfer.Transfer_From))
                 {
-                    inventory.Total_On_Hand -= item.Amount;
+                    changes.Add((inventory, -item.Amount));
                 }
                 else if (inventory.Locations.Contains((int)transfer.Transfer_To))
                 {
-                    inventory.Total_On_Hand += item.Amount;
+                    changes.Add((inventory, item.Amount));
                 }
-                DataProvider.fetch_inventory_pool().UpdateInventory(inventory.Id, inventory);
             }
         }
+        if (!DataProvider.fetch_inventory_pool().AdjustOnHand(changes))
+        {
+            return BadRequest("Inventory could not be updated; the transfer was not committed.");
+        }
 
         transfer.Transfer_Status = "Processed";
         var success = DataProvider.fetch_transfer_pool().UpdateTransfer(id, transfer);
@@ -1,5 +1,6 @@
 using Microsoft.AspNetCore.Mvc;
 using Models;
+using ModelsV2;
 using Providers;
 namespace Processors;
 
@@ -61,7 +62,7 @@ public class WarehousesController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "warehouses", "post");
         if (auth != null) return auth;
 
-        if (warehouse.Id == -10) return BadRequest("ID not given in body");
+        if (warehouse.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_warehouse_pool().AddWarehouse(warehouse);
         if (!success) return NotFound("ID already exists in data");
@@ -76,7 +77,7 @@ public class WarehousesController : BaseApiController
         var auth = CheckAuthorization(Request.Headers["API_KEY"], "warehouses", "put");
         if (auth != null) return auth;
 
-        if (warehouse.Id == -10) return BadRequest("ID not given in body");
+        if (warehouse.Id == null) return BadRequest("ID not given in body");
 
         var success = DataProvider.fetch_warehouse_pool().UpdateWarehouse(id, warehouse);
         if (!success) return NotFound("ID not found or ID in Body and Route are not matching");
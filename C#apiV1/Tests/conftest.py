@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The v1 tests read the same data files as v2 and share its journal_data.py.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "C#api", "Tests"))
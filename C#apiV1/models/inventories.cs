@@ -1,88 +1,44 @@
-using System;
 using System.Collections.Generic;
-using System.IO;
-using System.Text.Json;
-using Newtonsoft.Json;
-using Providers;
+using ModelsV2;
 namespace Models;
 
-public class Inventory
+public class Inventories
 {
-    public int Id { get; set; } = -10;
-    public string Item_Id { get; set; }
-    public string Description { get; set; }
-    public string Item_Reference { get; set; }
-    public List<int> Locations { get; set; }
-    public int Total_On_Hand { get; set; }
-    public int Total_Expected { get; set; }
-    public int Total_Ordered { get; set; }
-    public int Total_Allocated { get; set; }
-    public int Total_Available { get; set; }
-    public string? Created_At { get; set; }
-    public string? Updated_At { get; set; }
-}
-
-public class Inventories : Base
-{
-    private string _dataPath;
-    private List<Inventory> _data;
+    private readonly ModelsV2.Inventories _pool;
 
-    public Inventories(string rootPath, bool isDebug = false)
+    public Inventories(ModelsV2.Inventories pool)
     {
-        _dataPath = Path.Combine(rootPath, "inventories.json");
-        Load(isDebug);
+        _pool = pool;
     }
 
     public List<Inventory> GetInventories()
     {
-        return _data;
+        return _pool.GetInventories();
     }
 
     public Inventory GetInventory(int inventoryId)
     {
-        return _data.Find(x => x.Id == inventoryId);
+        return _pool.GetInventory(inventoryId);
     }
 
     public List<Inventory> GetInventoriesForItem(string itemId)
     {
-        return _data.FindAll(x => x.Item_Id == itemId);
+        return _pool.GetInventoriesForItem(itemId);
     }
 
-    public Dictionary<string, int> GetInventoryTotalsForItem(string itemId)
+    public List<Inventory> GetInventoriesForLocation(int locationId)
     {
-        var result = new Dictionary<string, int>
-        {
-            { "total_expected", 0 },
-            { "total_ordered", 0 },
-            { "total_allocated", 0 },
-            { "total_available", 0 }
-        };
-
-        foreach (var x in _data)
-        {
-            if (x.Item_Id == itemId)
-            {
-                result["total_expected"] += Convert.ToInt32(x.Total_Expected);
-                result["total_ordered"] += Convert.ToInt32(x.Total_Ordered);
-                result["total_allocated"] += Convert.ToInt32(x.Total_Allocated);
-                result["total_available"] += Convert.ToInt32(x.Total_Available);
-            }
-        }
+        return _pool.GetInventoriesForLocation(locationId);
+    }
 
-        return result;
+    public Dictionary<string, int> GetInventoryTotalsForItem(string itemId)
+    {
+        return _pool.GetInventoryTotalsForItem(itemId);
     }
 
     public bool AddInventory(Inventory inventory)
     {
-        if (_data.Exists(x => x.Id == inventory.Id))
-        {
-            return false;
-        }
-
-        if (inventory.Created_At == null) inventory.Created_At = GetTimestamp();
-        if (inventory.Updated_At == null) inventory.Updated_At = GetTimestamp();
-        _data.Add(inventory);
-        return true;
+        return _pool.InsertInventory(inventory);
     }
 
     public bool UpdateInventory(int inventoryId, Inventory inventory)
@@ -92,50 +48,21 @@ public class Inventories : Base
             return false;
         }
 
-        inventory.Updated_At = GetTimestamp();
-        var index = _data.FindIndex(x => x.Id == inventoryId);
-        if (index >= 0)
-        {
-            inventory.Created_At = _data[index].Created_At;
-            _data[index] = inventory;
-            return true;
-        }
-
-        return false;
+        return _pool.OverwriteInventory(inventoryId, inventory);
     }
 
-    public bool RemoveInventory(int inventoryId)
+    public bool AdjustOnHand(List<(Inventory Inventory, int Delta)> changes)
     {
-        var inventory = GetInventory(inventoryId);
-        if (inventory == null) return false;
-        if (DataProvider.fetch_item_pool().GetItem(inventory.Item_Id) != null) return false;
-
-        return _data.Remove(inventory);
+        return _pool.AdjustOnHand(changes);
     }
 
-    private void Load(bool isDebug)
+    public bool RemoveInventory(int inventoryId)
     {
-        if (isDebug)
-        {
-            _data = new List<Inventory>();
-        }
-        else
-        {
-            using (var reader = new StreamReader(_dataPath))
-            {
-                var json = reader.ReadToEnd();
-                _data = JsonConvert.DeserializeObject<List<Inventory>>(json);
-            }
-        }
+        return _pool.RemoveInventory(inventoryId);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(_dataPath))
-        {
-            var json = JsonConvert.SerializeObject(_data, Formatting.Indented);
-            writer.Write(json);
-        }
+        _pool.Save();
     }
 }
-
@@ -1,52 +1,29 @@
-using System;
 using System.Collections.Generic;
-using System.IO;
-using System.Text.Json;
-using Newtonsoft.Json;
-using Providers;
+using ModelsV2;
 namespace Models;
 
-public class ItemGroup
+public class ItemGroups
 {
-    public int Id { get; set; } = -10;
-    public string Name { get; set; }
-    public string Description { get; set; }
-    public string? Created_At { get; set; }
-    public string? Updated_At { get; set; }
-}
-
-public class ItemGroups : Base
-{
-    private readonly string _dataPath;
-    private List<ItemGroup> _data;
+    private readonly ModelsV2.ItemGroups _pool;
 
-    public ItemGroups(string rootPath, bool isDebug = false)
+    public ItemGroups(ModelsV2.ItemGroups pool)
     {
-        _dataPath = Path.Combine(rootPath, "item_groups.json");
-        Load(isDebug);
+        _pool = pool;
     }
 
     public List<ItemGroup> GetItemGroups()
     {
-        return _data;
+        return _pool.GetItemGroups();
     }
 
     public ItemGroup GetItemGroup(int itemGroupId)
     {
-        return _data.Find(x => x.Id == itemGroupId);
+        return _pool.GetItemGroup(itemGroupId);
     }
 
     public bool AddItemGroup(ItemGroup itemGroup)
     {
-        if (_data.Exists(x => x.Id == itemGroup.Id))
-        {
-            return false;
-        }
-
-        if (itemGroup.Created_At == null) itemGroup.Created_At = GetTimestamp();
-        if (itemGroup.Updated_At == null) itemGroup.Updated_At = GetTimestamp();
-        _data.Add(itemGroup);
-        return true;
+        return _pool.InsertItemGroup(itemGroup);
     }
 
     public bool UpdateItemGroup(int itemGroupId, ItemGroup itemGroup)
@@ -56,50 +33,16 @@ public class ItemGroups : Base
             return false;
         }
 
-        itemGroup.Updated_At = GetTimestamp();
-        var index = _data.FindIndex(x => x.Id == itemGroupId);
-        if (index >= 0)
-        {
-            itemGroup.Created_At = _data[index].Created_At;
-            _data[index] = itemGroup;
-            return true;
-        }
-
-        return false;
+        return _pool.UpdateItemGroup(itemGroupId, itemGroup);
     }
 
     public bool RemoveItemGroup(int itemGroupId)
     {
-        var itemGroup = GetItemGroup(itemGroupId);
-        if (itemGroup == null) return false;
-        var items = DataProvider.fetch_item_pool().GetItemsForItemGroup(itemGroupId);
-        if (items.Count() != 0) return false;
-
-        return _data.Remove(itemGroup);
-    }
-
-    private void Load(bool isDebug)
-    {
-        if (isDebug)
-        {
-            _data = new List<ItemGroup>();
-        }
-        else
-        {
-            using (var reader = new StreamReader(_dataPath))
-            {
-                var json = reader.ReadToEnd();
-                _data = JsonConvert.DeserializeObject<List<ItemGroup>>(json);
-            }
-        }
+        return _pool.RemoveItemGroup(itemGroupId);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(_dataPath))
-        {
-            var json = JsonConvert.SerializeObject(_data, Formatting.Indented);
-            writer.Write(json);
-        }
+        _pool.Save();
     }
 }
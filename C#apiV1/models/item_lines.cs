@@ -1,53 +1,29 @@
-using System;
 using System.Collections.Generic;
-using System.IO;
-using System.Text.Json;
-using Newtonsoft.Json;
-using Providers;
+using ModelsV2;
 namespace Models;
 
-
-public class ItemLine
-{
-    public int Id { get; set; } = -10;
-    public string Name { get; set; }
-    public string Description { get; set; }
-    public string? Created_At { get; set; }
-    public string? Updated_At { get; set; }
-}
-
-public class ItemLines : Base
+public class ItemLines
 {
-    private readonly string _dataPath;
-    private List<ItemLine> _data;
+    private readonly ModelsV2.ItemLines _pool;
 
-    public ItemLines(string rootPath, bool isDebug = false)
+    public ItemLines(ModelsV2.ItemLines pool)
     {
-        _dataPath = Path.Combine(rootPath, "item_lines.json");
-        Load(isDebug);
+        _pool = pool;
     }
 
     public List<ItemLine> GetItemLines()
     {
-        return _data;
+        return _pool.GetItemLines();
     }
 
     public ItemLine GetItemLine(int itemlineId)
     {
-        return _data.Find(x => x.Id == itemlineId);
+        return _pool.GetItemLine(itemlineId);
     }
 
     public bool AddItemline(ItemLine itemline)
     {
-        if (_data.Exists(x => Convert.ToInt64(x.Id) == itemline.Id))
-        {
-            return false;
-        }
-
-        if (itemline.Created_At == null) itemline.Created_At = GetTimestamp();
-        if (itemline.Updated_At == null) itemline.Updated_At = GetTimestamp();
-        _data.Add(itemline);
-        return true;
+        return _pool.InsertItemline(itemline);
     }
 
     public bool UpdateItemline(int itemlineId, ItemLine itemline)
@@ -57,50 +33,16 @@ public class ItemLines : Base
             return false;
         }
 
-        itemline.Updated_At = GetTimestamp();
-        var index = _data.FindIndex(x => x.Id == itemlineId);
-        if (index >= 0)
-        {
-            itemline.Created_At = _data[index].Created_At;
-            _data[index] = itemline;
-            return true;
-        }
-
-        return false;
+        return _pool.UpdateItemline(itemlineId, itemline);
     }
 
     public bool RemoveItemline(int itemlineId)
     {
-        var itemline = GetItemLine(itemlineId);
-        if (itemline == null) return false;
-        var items = DataProvider.fetch_item_pool().GetItemsForItemLine(itemlineId);
-        if (items.Count() != 0) return false;
-
-        return _data.Remove(itemline);
-    }
-
-    private void Load(bool isDebug)
-    {
-        if (isDebug)
-        {
-            _data = new List<ItemLine>();
-        }
-        else
-        {
-            using (var reader = new StreamReader(_dataPath))
-            {
-                var json = reader.ReadToEnd();
-                _data = JsonConvert.DeserializeObject<List<ItemLine>>(json);
-            }
-        }
+        return _pool.RemoveItemline(itemlineId);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(_dataPath))
-        {
-            var json = JsonConvert.SerializeObject(_data, Formatting.Indented);
-            writer.Write(json);
-        }
+        _pool.Save();
     }
 }
@@ -1,226 +1,73 @@
-using System;
 using System.Collections.Generic;
-using System.IO;
-using System.Linq;
-using Newtonsoft.Json;
-using Providers;
+using ModelsV2;
 namespace Models;
 
-public class OrderItem
-    {
-        public string Item_Id { get; set; }
-        public int Amount { get; set; }
-    }
-
-public class Order
-{
-    public int Id { get; set; } = -10;
-    public int Source_Id { get; set; }
-    public string Order_Date { get; set; }
-    public string Request_Date { get; set; }
-    public string Reference { get; set; }
-    public string Reference_Extra { get; set; }
-    public string Order_Status { get; set; }
-    public string Notes { get; set; }
-    public string Shipping_Notes { get; set; }
-    public string Picking_Notes { get; set; }
-    public int Warehouse_Id { get; set; }
-    public int? Ship_To { get; set; }
-    public int? Bill_To { get; set; }
-    public int? Shipment_Id { get; set; }
-    public decimal Total_Amount { get; set; }
-    public decimal Total_Discount { get; set; }
-    public decimal Total_Tax { get; set; }
-    public decimal Total_Surcharge { get; set; }
-    public string? Created_At { get; set; }
-    public string? Updated_At { get; set; }
-    public List<OrderItem> Items { get; set; }
-}
-
-public class Orders : Base
+public class Orders
 {
-    private string dataPath;
-    private List<Order> data;
-    private Inventories inventory;
+    private readonly ModelsV2.Orders _pool;
 
-    public Orders(string rootPath, bool isDebug = false)
+    public Orders(ModelsV2.Orders pool)
     {
-        dataPath = Path.Combine(rootPath, "orders.json");
-        Load(isDebug);
-        inventory = new Inventories(rootPath);
+        _pool = pool;
     }
 
     public List<Order> GetOrders()
     {
-        return data;
+        return _pool.GetOrders();
     }
 
     public Order GetOrder(int orderId)
     {
-        return data.FirstOrDefault(order => order.Id == orderId);
+        return _pool.GetOrder(orderId);
     }
 
     public List<OrderItem> GetItemsInOrder(int orderId)
     {
-        var order = GetOrder(orderId);
-        return order.Items;
+        return _pool.GetItemsInOrder(orderId);
     }
 
     public List<Order> GetOrdersInShipment(int shipmentId)
     {
-        return data.Where(order => order.Shipment_Id == shipmentId).ToList();
+        return _pool.GetOrdersInShipment(shipmentId);
     }
 
     public List<Order> GetOrdersForClient(int clientId)
     {
-        return data.Where(order => order.Ship_To == clientId ||
-                                   order.Bill_To == clientId).ToList();
+        return _pool.GetOrdersForClient(clientId);
     }
 
     public bool AddOrder(Order order)
     {
-        if (data.Any(existingOrder => existingOrder.Id == order.Id))
-        {
-            return false;
-        }
-
-        if (order.Created_At == null) order.Created_At = GetTimestamp();
-        if (order.Updated_At == null) order.Updated_At = GetTimestamp();
-        data.Add(order);
-        return true;
+        return _pool.InsertOrder(order);
     }
 
     public bool UpdateOrder(int orderId, Order order)
     {
-        if (Convert.ToInt64(order.Id) != orderId)
+        if (order.Id != orderId)
         {
             return false;
         }
 
-        order.Updated_At = GetTimestamp();
-        var index = data.FindIndex(existingOrder => Convert.ToInt64(existingOrder.Id) == orderId);
-
-        if (index >= 0)
-        {
-            order.Created_At = data[index].Created_At;
-            data[index] = order;
-            return true;
-        }
-        return false;
+        return _pool.OverwriteOrder(orderId, order);
     }
 
     public void UpdateItemsInOrder(int orderId, List<Item> items)
     {
-        var order = GetOrder(orderId);
-        List<Item> currentItems = new List<Item>();
-        foreach (var i in order.Items) currentItems.Add(DataProvider.fetch_item_pool().GetItem(i.Item_Id));
-
-        foreach (var currentItem in currentItems)
-        {
-            var itemToUpdate = items.FirstOrDefault(item => item.Uid == currentItem.Uid);
-            if (itemToUpdate == null)
-            {
-                var inventories = inventory.GetInventoriesForItem(currentItem.Uid);
-                var minInventory = inventories.OrderBy(i => i.Total_Allocated).FirstOrDefault();
-
-                if (minInventory != null)
-                {
-                    minInventory.Total_Allocated = minInventory.Total_Allocated - order.Items.First(x => x.Item_Id == currentItem.Uid).Amount;
-                    minInventory.Total_Expected = minInventory.Total_On_Hand + minInventory.Total_Ordered;
-                    inventory.UpdateInventory(minInventory.Id, minInventory);
-                }
-            }
-        }
-
-        foreach (var newItem in items)
-        {
-            var currentItem = currentItems.FirstOrDefault(ci => ci.Uid == newItem.Uid);
-            var inventories = inventory.GetInventoriesForItem(newItem.Uid);
-            var minInventory = inventories.OrderBy(i => i.Total_Allocated).FirstOrDefault();
-
-            if (minInventory != null)
-            {
-                if (currentItem != null)
-                {
-                    minInventory.Total_Allocated = minInventory.Total_Allocated + newItem.Unit_Order_Quantity - order.Items.First(x => x.Item_Id == currentItem.Uid).Amount;
-                }
-                else
-                {
-                    minInventory.Total_Allocated = minInventory.Total_Allocated + newItem.Unit_Order_Quantity;
-                }
-                minInventory.Total_Expected = minInventory.Total_On_Hand + minInventory.Total_Ordered;
-                inventory.UpdateInventory(minInventory.Id, minInventory);
-            }
-        }
-        List<OrderItem> list = new List<OrderItem>();
-        foreach (var it in items)
-        {
-            list.Add(new OrderItem{ Item_Id = it.Uid, Amount = it.Unit_Order_Quantity });    
-        }
-        order.Items = list;
-        UpdateOrder(orderId, order);
+        _pool.UpdateItemsInOrder(orderId, items);
     }
 
     public void UpdateOrdersInShipment(int shipmentId, List<Order> orders)
     {
-        var packedOrders = GetOrdersInShipment(shipmentId);
-        
-        foreach (var packedOrder in packedOrders)
-        {
-            if (!orders.Contains(packedOrder))
-            {
-                var order = GetOrder(packedOrder.Id);
-                if (order != null)
-                {
-                    order.Shipment_Id = -1;
-                    order.Order_Status = "Scheduled";
-                    UpdateOrder(packedOrder.Id, order);
-                }
-            }
-        }
-
-        foreach (var order in orders)
-        {
-            var orderToUpdate = GetOrder(order.Id);
-            if (orderToUpdate != null)
-            {
-                orderToUpdate.Shipment_Id = shipmentId;
-                orderToUpdate.Order_Status = "Packed";
-                UpdateOrder(order.Id, orderToUpdate);
-            }
-        }
+        _pool.UpdateOrdersInShipment(shipmentId, orders);
     }
 
     public bool RemoveOrder(int orderId)
     {
-        var order = GetOrder(orderId);
-        if (order == null) return false;
-
-        return data.Remove(order);
-    }
-
-    private void Load(bool isDebug)
-    {
-        if (isDebug)
-        {
-            data = new List<Order>();
-        }
-        else
-        {
-            using (var reader = new StreamReader(dataPath))
-            {
-                var json = reader.ReadToEnd();
-                data = JsonConvert.DeserializeObject<List<Order>>(json);
-            }
-        }
+        return _pool.RemoveOrder(orderId);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(dataPath))
-        {
-            var json = JsonConvert.SerializeObject(data, Formatting.Indented);
-            writer.Write(json);
-        }
+        _pool.Save();
     }
 }
@@ -1,67 +1,35 @@
-using System;
 using System.Collections.Generic;
-using System.IO;
-using System.Linq;
+using ModelsV2;
 namespace Models;
-using Providers;
-using Newtonsoft.Json;
 
-public class TransferItem
+public class Transfers
 {
-    public string Item_Id { get; set; }
-    public int Amount { get; set; }
-}
-public class Transfer
-{
-    public int Id { get; set; } = -10;
-    public string Reference { get; set; }
-    public int? Transfer_From { get; set; } 
-    public int? Transfer_To { get; set; }
-    public string Transfer_Status { get; set; }
-    public string? Created_At { get; set; }
-    public string? Updated_At { get; set; }
-    public List<TransferItem> Items { get; set; }
-}
+    private readonly ModelsV2.Transfers _pool;
 
-public class Transfers : Base
-{
-    private string dataPath;
-    private List<Transfer> data;
-
-    public Transfers(string rootPath, bool isDebug = false)
+    public Transfers(ModelsV2.Transfers pool)
     {
-        dataPath = Path.Combine(rootPath, "transfers.json");
-        Load(isDebug);
+        _pool = pool;
     }
 
     public List<Transfer> GetTransfers()
     {
-        return data;
+        return _pool.GetTransfers();
     }
 
     public Transfer GetTransfer(int transferId)
     {
-        return data.FirstOrDefault(transfer => transfer.Id == transferId);
+        return _pool.GetTransfer(transferId);
     }
 
     public List<TransferItem> GetItemsInTransfer(int transferId)
     {
-        var transfer = GetTransfer(transferId);
-        return transfer.Items;
+        return _pool.GetItemsInTransfer(transferId);
     }
 
     public bool AddTransfer(Transfer transfer)
     {
-        if (data.Any(existingTransfer => existingTransfer.Id == transfer.Id))
-        {
-            return false;
-        }
-
         transfer.Transfer_Status = "Scheduled";
-        if (transfer.Created_At == null) transfer.Created_At = GetTimestamp();
-        if (transfer.Updated_At == null) transfer.Updated_At = GetTimestamp();
-        data.Add(transfer);
-        return true;
+        return _pool.InsertTransfer(transfer);
     }
 
     public bool UpdateTransfer(int transferId, Transfer transfer)
@@ -71,48 +39,16 @@ public class Transfers : Base
             return false;
         }
 
-        transfer.Updated_At = GetTimestamp();
-        var index = data.FindIndex(existingTransfer => existingTransfer.Id == transferId);
-        
-        if (index >= 0)
-        {
-            transfer.Created_At = data[index].Created_At;
-            data[index] = transfer;
-            return true;
-        }
-        return false;
+        return _pool.UpdateTransfer(transferId, transfer);
     }
 
     public bool RemoveTransfer(int transferId)
     {
-        var transfer = GetTransfer(transferId);
-        if (transfer == null) return false;
-
-        return data.Remove(transfer);
-    }
-
-    private void Load(bool isDebug)
-    {
-        if (isDebug)
-        {
-            data = new List<Transfer>();
-        }
-        else
-        {
-            using (var reader = new StreamReader(dataPath))
-            {
-                var json = File.ReadAllText(dataPath);
-                data = JsonConvert.DeserializeObject<List<Transfer>>(json);
-            }
-        }
+        return _pool.RemoveTransfer(transferId);
     }
 
     public void Save()
     {
-        using (var writer = new StreamWriter(dataPath))
-        {
-            var json = JsonConvert.SerializeObject(data, Formatting.Indented);
-            writer.Write(json);
-        }
+        _pool.Save();
     }
 }
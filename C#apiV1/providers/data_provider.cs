@@ -1,15 +1,11 @@
 using System;
 using Models;
-using System.IO;
 namespace Providers;
 
+// v1 has no data of its own: each pool is a compatibility view over the pool
+// ProvidersV2.DataProvider loaded, so that one has to be initialized first.
 class DataProvider
 {
-    private static readonly bool DEBUG = false;
-    private static readonly string ROOT_PATH = Path.Combine(
-    Directory.GetParent(Directory.GetParent(Directory.GetParent(Directory.GetParent(AppDomain.CurrentDomain.BaseDirectory).FullName).FullName).FullName).FullName, 
-    "data").Replace('\\', '/');
-
     private static Warehouses _warehouses;
     private static Locations _locations;
     private static Transfers _transfers;
@@ -26,18 +22,18 @@ class DataProvider
 
     public static void Init()
     {
-        _warehouses = new Warehouses(ROOT_PATH, DEBUG);
-        _locations = new Locations(ROOT_PATH, DEBUG);
-        _transfers = new Transfers(ROOT_PATH, DEBUG);
-        _items = new Items(ROOT_PATH, DEBUG);
-        _itemLines = new ItemLines(ROOT_PATH, DEBUG);
-        _itemGroups = new ItemGroups(ROOT_PATH, DEBUG);
-        _itemTypes = new ItemTypes(ROOT_PATH, DEBUG);
-        _inventories = new Inventories(ROOT_PATH, DEBUG);
-        _suppliers = new Suppliers(ROOT_PATH, DEBUG);
-        _orders = new Orders(ROOT_PATH, DEBUG);
-        _clients = new Clients(ROOT_PATH, DEBUG);
-        _shipments = new Shipments(ROOT_PATH, DEBUG);
+        _warehouses = new Warehouses(ProvidersV2.DataProvider.fetch_warehouse_pool());
+        _locations = new Locations(ProvidersV2.DataProvider.fetch_location_pool());
+        _transfers = new Transfers(ProvidersV2.DataProvider.fetch_transfer_pool());
+        _items = new Items(ProvidersV2.DataProvider.fetch_item_pool());
+        _itemLines = new ItemLines(ProvidersV2.DataProvider.fetch_itemline_pool());
+        _itemGroups = new ItemGroups(ProvidersV2.DataProvider.fetch_itemgroup_pool());
+        _itemTypes = new ItemTypes(ProvidersV2.DataProvider.fetch_itemtype_pool());
+        _inventories = new Inventories(ProvidersV2.DataProvider.fetch_inventory_pool());
+        _suppliers = new Suppliers(ProvidersV2.DataProvider.fetch_supplier_pool());
+        _orders = new Orders(ProvidersV2.DataProvider.fetch_order_pool());
+        _clients = new Clients(ProvidersV2.DataProvider.fetch_client_pool());
+        _shipments = new Shipments(ProvidersV2.DataProvider.fetch_shipment_pool());
     }
 
     public static Warehouses fetch_warehouse_pool() => _warehouses;
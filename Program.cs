@@ -1,4 +1,5 @@
 using Microsoft.AspNetCore.Builder;
+using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Hosting;
 using ProvidersV2;
@@ -57,9 +58,14 @@ if (app.Environment.IsDevelopment())
 
 // Initialize your providers
 Providers.AuthProvider.Init();
-Providers.DataProvider.Init();
 ProvidersV2.AuthProvider.Init();
-ProvidersV2.DataProvider.Init();
+var dataSettings = builder.Configuration.GetSection("DataProvider");
+ProvidersV2.DataProvider.Init(
+    dataSettings.GetValue("FlushIntervalMs", 1000),
+    dataSettings.GetValue("FlushBatchSize", 100),
+    dataSettings.GetValue("DurableWrites", false));
+app.Lifetime.ApplicationStopping.Register(ProvidersV2.DataProvider.Stop);
+Providers.DataProvider.Init();
 Processors.NotificationSystem notisys = new Processors.NotificationSystem();
 Processors.NotificationSystem.Start();
 ProcessorsV2.NotificationSystem notisys2 = new ProcessorsV2.NotificationSystem();